@@ -9,6 +9,7 @@ from typing import Dict, Any
 
 from agent_core.config import load_config, create_default_config
 from agents.manager import AgentManager
+from cli.utils import tail_lines
 
 # Setup logging
 def setup_logging(log_level: str = "INFO") -> None:
@@ -228,12 +229,8 @@ def view_logs(ctx, agent_name, lines):
     
     # Display log content
     try:
-        with open(log_file, 'r') as file:
-            # Get the last N lines
-            content = file.readlines()
-            tail = content[-lines:] if len(content) > lines else content
-            for line in tail:
-                click.echo(line.strip())
+        for line in tail_lines(log_file, lines):
+            click.echo(line.strip())
     except Exception as e:
         click.echo(f"Error reading log file: {str(e)}")
 
@@ -1 +1,30 @@
-# CLI utilities
\ No newline at end of file
+# CLI utilities
+import os
+from typing import List
+
+
+def tail_lines(path: str, lines: int, block_size: int = 8192) -> List[str]:
+    """Return the last ``lines`` lines of a file without reading all of it.
+
+    Reads fixed-size blocks backwards from the end of the file until enough
+    newlines are found, so memory stays bounded for multi-GB logs.
+    """
+    if lines <= 0:
+        return []
+
+    with open(path, "rb") as file:
+        file.seek(0, os.SEEK_END)
+        position = file.tell()
+        blocks = []
+        newlines = 0
+        # One extra newline is needed to know the first wanted line is whole.
+        while position > 0 and newlines <= lines:
+            read_size = min(block_size, position)
+            position -= read_size
+            file.seek(position)
+            block = file.read(read_size)
+            blocks.append(block)
+            newlines += block.count(b"\n")
+
+    data = b"".join(reversed(blocks))
+    return data.decode("utf-8", errors="replace").splitlines()[-lines:]
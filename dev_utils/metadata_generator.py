@@ -15,10 +15,16 @@ import os
 import re
 import sys
 import yaml
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Any, Optional
 import argparse
 
+try:
+    from yaml import CSafeDumper as _SafeDumper
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeDumper as _SafeDumper
+
 # Directories to exclude from analysis
 EXCLUDE_DIRS = {
     '.vscode', 'myenv', 'venv', 'env', '.venv', 'virtualenv',
@@ -37,13 +43,19 @@ def find_project_root() -> Path:
 
 PROJECT_ROOT = find_project_root()
 
+# Patterns used on every scanned file, compiled once at import
+_METADATA_RE = re.compile(r'^-{3,}\n(?P<metadata>.+?)\n^-{3,}\n?(?P<description>.*)', re.DOTALL | re.MULTILINE)
+# Source files are scanned as raw bytes, so these two are bytes patterns
+_FIRST_DOC_RE = re.compile(rb'^\s*\"\"\"([\s\S]*?)\"\"\"', re.MULTILINE)
+# Cheap check for files that could define a class or function at all
+_DEFINITION_RE = re.compile(rb'^[ \t]*(?:class|def|async[ \t]+def)\s', re.MULTILINE)
+
 def parse_metadata(docstring: str) -> Dict:
     """Extract YAML metadata from docstring"""
     if not docstring:
         return {}
     
-    pattern = r'^-{3,}\n(?P<metadata>.+?)\n^-{3,}\n?(?P<description>.*)'
-    match = re.search(pattern, docstring, re.DOTALL | re.MULTILINE)
+    match = _METADATA_RE.search(docstring)
     
     metadata = {}
     if match:
@@ -58,9 +70,14 @@ class CodeAnalyzer(ast.NodeVisitor):
         self.modules: Dict[str, Any] = {}
         self.current_module = None
         self.current_class = None
+        self._dependencies: Dict[ast.AST, set] = {}
 
     def visit_Module(self, node):
         self.current_module = "global"
+        # Collect every class/function's dependencies in one pass up front,
+        # instead of re-walking each nested subtree per definition.
+        self._dependencies = {}
+        self._collect_dependencies(node, ())
         self.generic_visit(node)
         self.current_module = None
 
@@ -103,55 +120,78 @@ class CodeAnalyzer(ast.NodeVisitor):
 
         self.generic_visit(node)
 
+    def _collect_dependencies(self, node, scopes) -> None:
+        """Add the names used by ``node`` to every enclosing class/function."""
+        if isinstance(node, (ast.ClassDef, ast.FunctionDef)):
+            own = set()
+            self._dependencies[node] = own
+            scopes = (*scopes, own)
+
+        if scopes:
+            names = _node_dependencies(node)
+            if names:
+                for scope in scopes:
+                    scope.update(names)
+
+        for child in ast.iter_child_nodes(node):
+            self._collect_dependencies(child, scopes)
+
     def _get_dependencies(self, node) -> List[str]:
-        dependencies = set()
-        
-        def _get_full_name(node):
-            if isinstance(node, ast.Name):
-                return node.id
-            elif isinstance(node, ast.Attribute):
-                base = _get_full_name(node.value)
-                return f"{base}.{node.attr}" if base else node.attr
-            return None
+        if node not in self._dependencies:
+            self._collect_dependencies(node, ())
+        return sorted([d for d in self._dependencies[node] if d])
 
-        for n in ast.walk(node):
-            if isinstance(n, ast.Call):
-                if isinstance(n.func, (ast.Attribute, ast.Name)):
-                    full_name = _get_full_name(n.func)
-                    if full_name:
-                        dependencies.add(full_name)
-            elif isinstance(n, ast.Import):
-                dependencies.update(alias.name for alias in n.names)
-            elif isinstance(n, ast.ImportFrom):
-                module = n.module or ""
-                for alias in n.names:
-                    full_name = f"{module}.{alias.name}" if module else alias.name
-                    dependencies.add(full_name)
-        
-        return sorted([d for d in dependencies if d])
+def _get_full_name(node):
+    if isinstance(node, ast.Name):
+        return node.id
+    elif isinstance(node, ast.Attribute):
+        base = _get_full_name(node.value)
+        return f"{base}.{node.attr}" if base else node.attr
+    return None
+
+def _node_dependencies(node) -> List[str]:
+    """Names a single node contributes: called functions and imports."""
+    if isinstance(node, ast.Call):
+        if isinstance(node.func, (ast.Attribute, ast.Name)):
+            full_name = _get_full_name(node.func)
+            if full_name:
+                return [full_name]
+    elif isinstance(node, ast.Import):
+        return [alias.name for alias in node.names]
+    elif isinstance(node, ast.ImportFrom):
+        module = node.module or ""
+        return [
+            f"{module}.{alias.name}" if module else alias.name
+            for alias in node.names
+        ]
+    return []
 
 def parse_python_file(file_path: str) -> Optional[Dict]:
     """Parse a Python file and extract metadata."""
     try:
-        with open(file_path, 'r', encoding='utf-8', errors='replace') as f:
+        # ast.parse tokenizes bytes directly, so skip decoding the whole file
+        with open(file_path, 'rb') as f:
             content = f.read()
     except Exception as e:
         print(f"Error reading {file_path}: {e}")
         return None
     
     # Extract first comment block for module-level metadata
-    first_comment = re.search(r'^\s*\"\"\"([\s\S]*?)\"\"\"', content, re.MULTILINE)
+    first_comment = _FIRST_DOC_RE.search(content)
     module_metadata = {}
     if first_comment:
-        module_metadata = parse_metadata(first_comment.group(1))
+        module_metadata = parse_metadata(first_comment.group(1).decode('utf-8', errors='replace'))
     
     analyzer = CodeAnalyzer()
-    try:
-        tree = ast.parse(content, filename=file_path)
-        analyzer.visit(tree)
-    except SyntaxError as e:
-        print(f"Syntax error in {file_path}: {e}")
-        return None
+    # Files without any class/def (package __init__s, config stubs) have no
+    # components to report, so don't pay for a full parse.
+    if _DEFINITION_RE.search(content):
+        try:
+            tree = ast.parse(content, filename=file_path)
+            analyzer.visit(tree)
+        except SyntaxError as e:
+            print(f"Syntax error in {file_path}: {e}")
+            return None
     
     try:
         rel_path = str(Path(file_path).relative_to(PROJECT_ROOT))
@@ -167,57 +207,63 @@ def parse_python_file(file_path: str) -> Optional[Dict]:
         ]
     }
 
-def generate_system_metadata(project_root: str, output_file: str = "system_metadata.yaml"):
+def _parse_python_file_safe(file_path: str) -> Optional[Dict]:
+    """Worker wrapper so one bad file does not abort the whole pool."""
+    try:
+        return parse_python_file(file_path)
+    except Exception as e:
+        print(f"Skipping {file_path} due to error: {str(e)}")
+        return None
+
+def generate_system_metadata(project_root: str, output_file: str = "system_metadata.yaml",
+                             max_workers: Optional[int] = None):
     system_data = {"modules": [], "entry_points": [], "external_connections": []}
     
+    paths = []
     for root, dirs, files in os.walk(project_root):
         dirs[:] = [d for d in dirs if d not in EXCLUDE_DIRS]
-        
-        for file in files:
-            if file.endswith(".py"):
-                full_path = os.path.join(root, file)
-                try:
-                    file_data = parse_python_file(full_path)
-                except Exception as e:
-                    print(f"Skipping {full_path} due to error: {str(e)}")
-                    continue
+        paths.extend(os.path.join(root, file) for file in files if file.endswith(".py"))
 
-                if file_data is None:
-                    continue
+    # Parsing is CPU-bound and independent per file, so fan it out across
+    # processes; results come back in walk order and are merged here.
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        for full_path, file_data in zip(paths, executor.map(_parse_python_file_safe, paths, chunksize=16)):
+            if file_data is None:
+                continue
 
-                relative_file_path = str(Path(full_path).relative_to(project_root))
-                module_path = relative_file_path.replace("/", ".").replace(".py", "")
+            relative_file_path = str(Path(full_path).relative_to(project_root))
+            module_path = relative_file_path.replace("/", ".").replace(".py", "")
+            
+            module_entry = {
+                "name": module_path,
+                "filename": relative_file_path,
+                "metadata": file_data.get("metadata", {}),
+                "components": file_data.get("components", []),
+                "dependencies": []
+            }
+
+            # Process functions
+            for component in file_data.get("components", []):
+                if "name" not in component:
+                    continue
                 
-                module_entry = {
-                    "name": module_path,
+                component_entry = {
+                    "name": component["name"],
+                    "type": component.get("type", "function"),
                     "filename": relative_file_path,
-                    "metadata": file_data.get("metadata", {}),
-                    "components": file_data.get("components", []),
-                    "dependencies": []
+                    "metadata": component.get("metadata", {}),
+                    "dependencies": component.get("dependencies", []),
+                    "docstring": component.get("docstring", ""),
+                    "line": component.get("line", -1)
                 }
+                module_entry["components"].append(component_entry)
+                module_entry["dependencies"].extend(component.get("dependencies", []))
 
-                # Process functions
-                for component in file_data.get("components", []):
-                    if "name" not in component:
-                        continue
-                    
-                    component_entry = {
-                        "name": component["name"],
-                        "type": component.get("type", "function"),
-                        "filename": relative_file_path,
-                        "metadata": component.get("metadata", {}),
-                        "dependencies": component.get("dependencies", []),
-                        "docstring": component.get("docstring", ""),
-                        "line": component.get("line", -1)
-                    }
-                    module_entry["components"].append(component_entry)
-                    module_entry["dependencies"].extend(component.get("dependencies", []))
-
-                module_entry["dependencies"] = sorted(list(set(module_entry["dependencies"])))
-                system_data["modules"].append(module_entry)
+            module_entry["dependencies"] = sorted(list(set(module_entry["dependencies"])))
+            system_data["modules"].append(module_entry)
     
     with open(output_file, "w") as f:
-        yaml.dump(system_data, f, sort_keys=False)
+        yaml.dump(system_data, f, Dumper=_SafeDumper, sort_keys=False)
     
     return system_data
 
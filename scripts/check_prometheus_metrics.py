@@ -8,42 +8,128 @@ It identifies available metrics for monitoring database operations, system resou
 Use this tool to verify monitoring configuration and troubleshoot Grafana dashboard issues.
 """
 
-import requests
+import aiohttp
+import asyncio
+import functools
+import hashlib
 import json
 import argparse
+import os
 import sys
+import time
 from datetime import datetime, timedelta
+from pathlib import Path
 
-def check_prometheus_up(base_url):
+try:
+    from orjson import loads as json_loads
+except ImportError:  # orjson is optional; the stdlib decoder works, just slower
+    json_loads = json.loads
+
+# Seconds to wait for any single Prometheus API call
+REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=5)
+# Matches Prometheus' default staleness window for instant queries
+SERIES_LOOKBACK_SECONDS = 300
+
+def create_session():
+    """Create a keep-alive session shared by every probe"""
+    connector = aiohttp.TCPConnector(limit=16, keepalive_timeout=30)
+    return aiohttp.ClientSession(connector=connector, timeout=REQUEST_TIMEOUT)
+
+async def prometheus_get(session, url, params=None):
+    """GET a Prometheus API URL, returning (status code, decoded JSON or None)"""
+    async with session.get(url, params=params) as response:
+        if response.status != 200:
+            return response.status, None
+        # aiohttp requests gzip by default; decode the raw body ourselves
+        # so the faster orjson parser is used when installed
+        return response.status, json_loads(await response.read())
+
+async def query_results(session, base_url, query):
+    """Run an instant query and return its result vector (empty on failure)"""
+    status, payload = await prometheus_get(session, f"{base_url}/api/v1/query", {'query': query})
+    # Each body is decoded exactly once, in prometheus_get; a 200 without a
+    # result vector (e.g. a scalar query) counts as no data
+    return (payload or {}).get('data', {}).get('result', []) if status == 200 else []
+
+def ttl_cache(ttl, path):
+    """Cache an async (session, base_url, query) probe's JSON result on disk.
+
+    ARXIV_PROMCHECK_CACHE selects the policy: "enabled" (default) reuses
+    entries younger than ttl seconds and stores fresh results, "replay" reuses
+    any stored entry regardless of age without writing, "disabled" always
+    queries Prometheus.
+    """
+    cache_dir = Path(path).expanduser()
+
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(session, base_url, query):
+            mode = os.environ.get("ARXIV_PROMCHECK_CACHE", "enabled").lower()
+            if mode == "disabled":
+                return await func(session, base_url, query)
+
+            key = hashlib.sha256(f"{base_url}|{query}".encode()).hexdigest()
+            cache_file = cache_dir / f"{key}.json"
+            try:
+                entry = json_loads(cache_file.read_bytes())
+                if mode == "replay" or time.time() - entry["ts"] < ttl:
+                    return entry["results"]
+            except (OSError, ValueError, KeyError):
+                pass
+
+            results = await func(session, base_url, query)
+            if mode != "replay" and results:
+                try:
+                    cache_dir.mkdir(parents=True, exist_ok=True)
+                    cache_file.write_text(json.dumps({"ts": time.time(), "results": results}))
+                except OSError as e:
+                    print(f"  Could not write probe cache {cache_file}: {e}")
+            return results
+        return wrapper
+    return decorator
+
+@ttl_cache(ttl=600, path="~/.cache/arxiv_promcheck")
+async def cached_query_results(session, base_url, query):
+    """query_results for label discovery, whose answers rarely change between runs"""
+    return await query_results(session, base_url, query)
+
+async def check_prometheus_up(session, base_url):
     """Check if Prometheus is running and responding"""
     try:
-        response = requests.get(f"{base_url}/api/v1/status/runtimeinfo", timeout=5)
-        if response.status_code == 200:
-            info = response.json()['data']
+        status, payload = await prometheus_get(session, f"{base_url}/api/v1/status/runtimeinfo")
+        if status == 200:
+            info = payload['data']
             print(f"✅ Prometheus is running (version: {info.get('version', 'unknown')})")
             return True
         else:
-            print(f"❌ Prometheus returned status code {response.status_code}")
+            print(f"❌ Prometheus returned status code {status}")
             return False
     except Exception as e:
         print(f"❌ Could not connect to Prometheus: {e}")
         return False
 
-def get_metrics_list(base_url):
+async def get_metrics_list(session, base_url):
     """Get a list of all available metrics in Prometheus"""
     try:
-        response = requests.get(f"{base_url}/api/v1/label/__name__/values")
-        if response.status_code == 200:
-            metrics = response.json()['data']
+        status, payload = await prometheus_get(session, f"{base_url}/api/v1/label/__name__/values")
+        if status == 200:
+            metrics = payload['data']
             return metrics
         else:
-            print(f"❌ Failed to retrieve metrics list. Status code: {response.status_code}")
+            print(f"❌ Failed to retrieve metrics list. Status code: {status}")
             return []
     except Exception as e:
         print(f"❌ Error retrieving metrics: {e}")
         return []
 
-def check_container_metrics(base_url):
+async def query_metrics(session, base_url, metrics):
+    """Query several metrics concurrently; failed queries come back as exceptions"""
+    return await asyncio.gather(
+        *(query_results(session, base_url, metric) for metric in metrics),
+        return_exceptions=True
+    )
+
+def check_container_metrics(metrics_set):
     """Check if container metrics are available"""
     container_metrics = [
         "container_cpu_usage_seconds_total",
@@ -51,14 +137,7 @@ def check_container_metrics(base_url):
         "container_network_receive_bytes_total"
     ]
     
-    available = []
-    for metric in container_metrics:
-        try:
-            response = requests.get(f"{base_url}/api/v1/query", params={'query': f'{metric}'})
-            if response.status_code == 200 and len(response.json()['data']['result']) > 0:
-                available.append(metric)
-        except Exception as e:
-            print(f"  Error checking {metric}: {e}")
+    available = [metric for metric in container_metrics if metric in metrics_set]
     
     if available:
         print(f"✅ Container metrics available: {len(available)}/{len(container_metrics)}")
@@ -67,7 +146,7 @@ def check_container_metrics(base_url):
         print("❌ No container metrics found")
         return []
 
-def check_host_metrics(base_url):
+def check_host_metrics(metrics_set):
     """Check if host metrics are available"""
     host_metrics = [
         "node_cpu_seconds_total",
@@ -75,14 +154,7 @@ def check_host_metrics(base_url):
         "node_filesystem_size_bytes"
     ]
     
-    available = []
-    for metric in host_metrics:
-        try:
-            response = requests.get(f"{base_url}/api/v1/query", params={'query': f'{metric}'})
-            if response.status_code == 200 and len(response.json()['data']['result']) > 0:
-                available.append(metric)
-        except Exception as e:
-            print(f"  Error checking {metric}: {e}")
+    available = [metric for metric in host_metrics if metric in metrics_set]
     
     if available:
         print(f"✅ Host metrics available: {len(available)}/{len(host_metrics)}")
@@ -91,12 +163,12 @@ def check_host_metrics(base_url):
         print("❌ No host metrics found")
         return []
 
-def check_targets(base_url):
+async def check_targets(session, base_url):
     """Check Prometheus targets and their status"""
     try:
-        response = requests.get(f"{base_url}/api/v1/targets")
-        if response.status_code == 200:
-            targets = response.json()['data']['activeTargets']
+        status, payload = await prometheus_get(session, f"{base_url}/api/v1/targets")
+        if status == 200:
+            targets = payload['data']['activeTargets']
             up_count = sum(1 for t in targets if t['health'] == 'up')
             down_count = len(targets) - up_count
             
@@ -107,26 +179,26 @@ def check_targets(base_url):
             
             return up_count, targets
         else:
-            print(f"❌ Failed to retrieve targets. Status code: {response.status_code}")
+            print(f"❌ Failed to retrieve targets. Status code: {status}")
             return 0, []
     except Exception as e:
         print(f"❌ Error checking targets: {e}")
         return 0, []
 
-def check_container_labels(base_url):
+async def check_container_labels(session, base_url, metrics_set):
     """Check what labels are available for container metrics"""
     try:
         query = "container_memory_usage_bytes"
-        response = requests.get(f"{base_url}/api/v1/query", params={'query': query})
+        if query not in metrics_set:
+            print("❌ No container metrics data returned")
+            return [], []
+        results = await cached_query_results(session, base_url, query)
         
-        if response.status_code == 200 and len(response.json()['data']['result']) > 0:
-            results = response.json()['data']['result']
+        if len(results) > 0:
             print(f"\n=== CONTAINER LABELS ANALYSIS ===")
             
             # Extract all unique label names
-            all_labels = set()
-            for result in results:
-                all_labels.update(result['metric'].keys())
+            all_labels = {label for result in results for label in result['metric']}
             
             print(f"Available labels: {', '.join(sorted(all_labels))}")
             
@@ -139,8 +211,14 @@ def check_container_labels(base_url):
                 
                 # Sample values for the first found ID label
                 label = found_id_labels[0]
-                values = {result['metric'].get(label, 'N/A') for result in results if label in result['metric']}
-                sample_values = list(values)[:5]  # Show at most 5 examples
+                # Show at most 5 distinct examples, stopping once they're found
+                # rather than collecting every series' value first
+                sample_values = []
+                for value in (result['metric'][label] for result in results if label in result['metric']):
+                    if value not in sample_values:
+                        sample_values.append(value)
+                        if len(sample_values) == 5:
+                            break
                 print(f"\nSample values for '{label}': {', '.join(sample_values)}")
                 
                 # Generate a working query example
@@ -158,7 +236,7 @@ def check_container_labels(base_url):
         print(f"❌ Error analyzing container labels: {e}")
         return [], []
 
-def check_mongodb_metrics(base_url):
+async def check_mongodb_metrics(session, base_url, metrics_set):
     """Check for MongoDB metrics critical for ArXiv pipeline vector database operations"""
     mongodb_metrics = [
         "mongodb_op_counters_total",
@@ -166,30 +244,26 @@ def check_mongodb_metrics(base_url):
         "mongodb_metrics_document_total"
     ]
     
-    available = []
+    # Check for basic MongoDB metrics
+    available = [metric for metric in mongodb_metrics if metric in metrics_set]
     operation_types = []
     connection_states = []
     
-    # Check for basic MongoDB metrics
-    for metric in mongodb_metrics:
+    # Operation types (query, insert, etc) and connection states come from
+    # series labels, fetched for both metrics in one call
+    label_metrics = [m for m in ("mongodb_op_counters_total", "mongodb_connections") if m in available]
+    if label_metrics:
         try:
-            response = requests.get(f"{base_url}/api/v1/query", params={'query': f'{metric}'})
-            if response.status_code == 200 and len(response.json()['data']['result']) > 0:
-                available.append(metric)
-                
-                # Check for operation types (query, insert, etc)
-                if metric == "mongodb_op_counters_total":
-                    for result in response.json()['data']['result']:
-                        if 'type' in result['metric']:
-                            operation_types.append(result['metric']['type'])
-                
-                # Check for connection states
-                if metric == "mongodb_connections":
-                    for result in response.json()['data']['result']:
-                        if 'state' in result['metric']:
-                            connection_states.append(result['metric']['state'])
+            params = [('match[]', metric) for metric in label_metrics]
+            params.append(('start', str(time.time() - SERIES_LOOKBACK_SECONDS)))
+            status, payload = await prometheus_get(session, f"{base_url}/api/v1/series", params)
+            for series in payload['data'] if status == 200 else []:
+                if series.get('__name__') == "mongodb_op_counters_total" and 'type' in series:
+                    operation_types.append(series['type'])
+                if series.get('__name__') == "mongodb_connections" and 'state' in series:
+                    connection_states.append(series['state'])
         except Exception as e:
-            print(f"  Error checking {metric}: {e}")
+            print(f"  Error checking MongoDB series labels: {e}")
     
     if available:
         print(f"✅ MongoDB metrics available: {len(available)}/{len(mongodb_metrics)}")
@@ -202,23 +276,34 @@ def check_mongodb_metrics(base_url):
         print("❌ No MongoDB metrics found - vector database monitoring unavailable")
         return []
 
-def verify_dashboard_queries(base_url):
+async def verify_dashboard_queries(session, base_url, metrics_set):
     """Verify that key queries used in the ArXiv Pipeline dashboard are working"""
+    # Each query with the metrics it reads; queries over missing metrics can't
+    # return data, so they are counted as failing without a request
     dashboard_queries = [
-        "100 - (avg by (instance) (rate(node_cpu_seconds_total{mode=\"idle\"}[5m])) * 100)",
-        "(node_memory_MemTotal_bytes - node_memory_MemFree_bytes) / node_memory_MemTotal_bytes * 100",
-        "rate(mongodb_op_counters_total{type=\"query\"}[5m])",
-        "sum(rate(container_cpu_usage_seconds_total[5m]))"
+        ("100 - (avg by (instance) (rate(node_cpu_seconds_total{mode=\"idle\"}[5m])) * 100)",
+         ("node_cpu_seconds_total",)),
+        ("(node_memory_MemTotal_bytes - node_memory_MemFree_bytes) / node_memory_MemTotal_bytes * 100",
+         ("node_memory_MemTotal_bytes", "node_memory_MemFree_bytes")),
+        ("rate(mongodb_op_counters_total{type=\"query\"}[5m])",
+         ("mongodb_op_counters_total",)),
+        ("sum(rate(container_cpu_usage_seconds_total[5m]))",
+         ("container_cpu_usage_seconds_total",))
+    ]
+    runnable = [
+        query for query, required in dashboard_queries
+        if all(metric in metrics_set for metric in required)
     ]
     
     working_queries = 0
-    for query in dashboard_queries:
-        try:
-            response = requests.get(f"{base_url}/api/v1/query", params={'query': query})
-            if response.status_code == 200 and len(response.json()['data']['result']) > 0:
-                working_queries += 1
-        except Exception as e:
-            print(f"  Error with query '{query[:30]}...': {e}")
+    query_results_list = await query_metrics(session, base_url, runnable)
+    # Printed once the queries finish so concurrent probes don't split the section
+    print("\n=== VERIFYING DASHBOARD QUERIES ===")
+    for query, results in zip(runnable, query_results_list):
+        if isinstance(results, Exception):
+            print(f"  Error with query '{query[:30]}...': {results}")
+        elif len(results) > 0:
+            working_queries += 1
     
     if working_queries > 0:
         print(f"✅ Dashboard queries: {working_queries}/{len(dashboard_queries)} verified working")
@@ -232,77 +317,99 @@ def main():
     parser.add_argument("--url", default="http://localhost:9090", help="Prometheus base URL")
     args = parser.parse_args()
     
-    print("\n=== ARXIV RESEARCH PIPELINE PROMETHEUS ANALYZER ===")
-    print(f"Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    print(f"Target: {args.url}")
-    print("=" * 50)
-    
-    if not check_prometheus_up(args.url):
-        print("\n❌ Prometheus is not available. Please check if it's running.")
-        sys.exit(1)
+    return asyncio.run(run_checks(args.url))
+
+async def run_checks(url):
+    """Run every probe against the Prometheus server at url"""
+    async with create_session() as session:
+        print("\n=== ARXIV RESEARCH PIPELINE PROMETHEUS ANALYZER ===")
+        print(f"Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+        print(f"Target: {url}")
+        print("=" * 50)
     
-    print("\n=== CHECKING AVAILABLE METRICS ===")
-    metrics = get_metrics_list(args.url)
-    print(f"Total metrics available: {len(metrics)}")
+        if not await check_prometheus_up(session, url):
+            print("\n❌ Prometheus is not available. Please check if it's running.")
+            sys.exit(1)
     
-    container_metrics = check_container_metrics(args.url)
-    host_metrics = check_host_metrics(args.url)
-    mongodb_metrics = check_mongodb_metrics(args.url)
+        print("\n=== CHECKING AVAILABLE METRICS ===")
+        metrics = await get_metrics_list(session, url)
+        print(f"Total metrics available: {len(metrics)}")
+        # The metric name list is ground truth: existence checks are answered
+        # from it and probes for metrics it lacks are never sent
+        metrics_set = frozenset(metrics)
     
-    up_count, targets = check_targets(args.url)
-    id_labels, sample_values = check_container_labels(args.url)
+        container_metrics = check_container_metrics(metrics_set)
+        host_metrics = check_host_metrics(metrics_set)
     
-    print("\n=== VERIFYING DASHBOARD QUERIES ===")
-    working_queries = verify_dashboard_queries(args.url)
+        if not metrics_set:
+            # Nothing is being scraped, so only the target status can explain why
+            mongodb_metrics = await check_mongodb_metrics(session, url, metrics_set)
+            up_count, targets = await check_targets(session, url)
+            id_labels, sample_values = [], []
+            working_queries = 0
+        else:
+            # The remaining probes are independent, so total latency is the slowest
+            # probe rather than the sum of all of them
+            (
+                mongodb_metrics,
+                (up_count, targets),
+                (id_labels, sample_values),
+                working_queries,
+            ) = await asyncio.gather(
+                check_mongodb_metrics(session, url, metrics_set),
+                check_targets(session, url),
+                check_container_labels(session, url, metrics_set),
+                verify_dashboard_queries(session, url, metrics_set),
+            )
     
-    print("\n=== RECOMMENDATIONS FOR ARXIV PIPELINE ===")
-    if not container_metrics and not host_metrics and not mongodb_metrics:
-        print("❌ No metrics found. Check that exporters are running and properly configured.")
-        print("- Verify that cAdvisor, Node Exporter, MongoDB Exporter are running")
-        print("- Check Prometheus configuration at config/prometheus/prometheus.yml")
-    else:
-        if not container_metrics:
-            print("⚠️ Container metrics missing - paper processing container monitoring unavailable.")
-            print("- Check that cAdvisor is running: docker compose -f docker-compose.monitoring.yml ps")
-        if not host_metrics:
-            print("⚠️ Host metrics missing - system resource monitoring unavailable.")
-            print("- Check that Node Exporter is running: docker compose -f docker-compose.monitoring.yml ps")
-        if not mongodb_metrics:
-            print("⚠️ MongoDB metrics missing - vector database monitoring unavailable.")
-            print("- Check that MongoDB Exporter is running and connected to MongoDB")
-            print("- Verify MongoDB URI in docker-compose.monitoring.yml")  
+        print("\n=== RECOMMENDATIONS FOR ARXIV PIPELINE ===")
+        if not container_metrics and not host_metrics and not mongodb_metrics:
+            print("❌ No metrics found. Check that exporters are running and properly configured.")
+            print("- Verify that cAdvisor, Node Exporter, MongoDB Exporter are running")
+            print("- Check Prometheus configuration at config/prometheus/prometheus.yml")
+        else:
+            if not container_metrics:
+                print("⚠️ Container metrics missing - paper processing container monitoring unavailable.")
+                print("- Check that cAdvisor is running: docker compose -f docker-compose.monitoring.yml ps")
+            if not host_metrics:
+                print("⚠️ Host metrics missing - system resource monitoring unavailable.")
+                print("- Check that Node Exporter is running: docker compose -f docker-compose.monitoring.yml ps")
+            if not mongodb_metrics:
+                print("⚠️ MongoDB metrics missing - vector database monitoring unavailable.")
+                print("- Check that MongoDB Exporter is running and connected to MongoDB")
+                print("- Verify MongoDB URI in docker-compose.monitoring.yml")  
         
-        if container_metrics and host_metrics and mongodb_metrics:
-            print("✅ All critical metrics for ArXiv pipeline monitoring are available!")
+            if container_metrics and host_metrics and mongodb_metrics:
+                print("✅ All critical metrics for ArXiv pipeline monitoring are available!")
     
-    if id_labels:
-        print("\n=== GRAFANA DASHBOARD CONFIGURATION ===")
-        print(f"Use these label formats in your dashboard queries:")
-        print(f"  - container_memory_usage_bytes{{{id_labels[0]}=\"{sample_values[0]}\"}}")
-        print(f"  - rate(container_cpu_usage_seconds_total{{{id_labels[0]}=\"{sample_values[0]}\"}}[5m])")
+        if id_labels:
+            print("\n=== GRAFANA DASHBOARD CONFIGURATION ===")
+            print(f"Use these label formats in your dashboard queries:")
+            print(f"  - container_memory_usage_bytes{{{id_labels[0]}=\"{sample_values[0]}\"}}")
+            print(f"  - rate(container_cpu_usage_seconds_total{{{id_labels[0]}=\"{sample_values[0]}\"}}[5m])")
     
-    # Data science recommendations specific to ArXiv pipeline
-    print("\n=== DATA SCIENCE MONITORING RECOMMENDATIONS ===")
-    if working_queries > 0:
-        print("✅ ArXiv Research Pipeline Dashboard is properly configured.")
-        print("Key metrics for monitoring your research paper processing:")
-        print("1. MongoDB query rates - Track database load during paper processing")
-        print("2. System resource correlation - Identify resource bottlenecks")
-        print("3. Query-to-write ratio - Analyze vector database usage patterns")
-    else:
-        print("❌ Dashboard queries not working - troubleshoot your Grafana configuration.")
+        # Data science recommendations specific to ArXiv pipeline
+        print("\n=== DATA SCIENCE MONITORING RECOMMENDATIONS ===")
+        if working_queries > 0:
+            print("✅ ArXiv Research Pipeline Dashboard is properly configured.")
+            print("Key metrics for monitoring your research paper processing:")
+            print("1. MongoDB query rates - Track database load during paper processing")
+            print("2. System resource correlation - Identify resource bottlenecks")
+            print("3. Query-to-write ratio - Analyze vector database usage patterns")
+        else:
+            print("❌ Dashboard queries not working - troubleshoot your Grafana configuration.")
     
-    print("\nAnalysis completed. Your ArXiv pipeline monitoring is ready for data science workflows.")
+        print("\nAnalysis completed. Your ArXiv pipeline monitoring is ready for data science workflows.")
     
-    # Return summary information that could be used by calling code
-    return {
-        "prometheus_up": True,
-        "metrics_count": len(metrics),
-        "container_metrics": bool(container_metrics),
-        "host_metrics": bool(host_metrics),
-        "mongodb_metrics": bool(mongodb_metrics),
-        "dashboard_queries_working": working_queries
-    }
+        # Return summary information that could be used by calling code
+        return {
+            "prometheus_up": True,
+            "metrics_count": len(metrics),
+            "container_metrics": bool(container_metrics),
+            "host_metrics": bool(host_metrics),
+            "mongodb_metrics": bool(mongodb_metrics),
+            "dashboard_queries_working": working_queries
+        }
 
 if __name__ == "__main__":
     main()
@@ -3,6 +3,7 @@ from abc import ABC, abstractmethod
 from typing import Dict, Any, List, Optional
 import asyncio
 import logging
+import time
 from datetime import datetime
 
 class BaseAgent(ABC):
@@ -15,6 +16,8 @@ class BaseAgent(ABC):
         self.logger = logging.getLogger(f"agent.{name}")
         self.is_running = False
         self.last_run = None
+        # Set by notify_change(); "on_change" agents wait on it between cycles
+        self._change_event = asyncio.Event()
         
     @abstractmethod
     async def initialize(self) -> None:
@@ -37,21 +40,36 @@ class BaseAgent(ABC):
         await self.initialize()
         
         try:
+            # Cycles are scheduled on fixed deadlines so run time doesn't
+            # accumulate into the period
+            next_deadline = time.monotonic() + self._get_interval_seconds()
             while self.is_running:
-                start_time = datetime.now()
+                # Monotonic clock for the duration; wall clock only for last_run
+                start_ns = time.perf_counter_ns()
                 results = await self.run_cycle()
-                end_time = datetime.now()
+                dur_ms = (time.perf_counter_ns() - start_ns) / 1e6
                 
-                self.logger.info(f"Agent {self.name} completed cycle in {end_time - start_time}")
-                self.last_run = end_time
+                self.logger.info(f"Agent {self.name} completed cycle in {dur_ms:.1f}ms")
+                self.last_run = datetime.now()
                 
                 if self.config.get("update_frequency") == "on_change":
                     # Wait for the next event trigger
-                    await asyncio.sleep(1)
+                    await self._change_event.wait()
+                    self._change_event.clear()
                 else:
-                    # Sleep for the configured interval
+                    # Sleep until the next deadline of the configured interval
                     interval = self._get_interval_seconds()
-                    await asyncio.sleep(interval)
+                    sleep_s = next_deadline - time.monotonic()
+                    if sleep_s <= 0:
+                        # Overran: start the next cycle now and reschedule from
+                        # here instead of piling up the missed cycles
+                        self.logger.warning(
+                            f"Agent {self.name} cycle overran its {interval}s interval by {-sleep_s:.1f}s"
+                        )
+                        next_deadline = time.monotonic() + interval
+                    else:
+                        await asyncio.sleep(sleep_s)
+                        next_deadline += interval
         except Exception as e:
             self.logger.error(f"Agent {self.name} encountered an error: {str(e)}", exc_info=True)
             self.is_running = False
@@ -60,6 +78,12 @@ class BaseAgent(ABC):
         """Stop the agent."""
         self.logger.info(f"Stopping agent {self.name}")
         self.is_running = False
+        # Wake an agent waiting for changes so its loop can exit
+        self._change_event.set()
+    
+    def notify_change(self) -> None:
+        """Signal that watched inputs changed and a new cycle should run."""
+        self._change_event.set()
     
     def _get_interval_seconds(self) -> int:
         """Get the interval in seconds based on configuration."""
@@ -2,15 +2,34 @@
 # agents/code_doc/agent.py
 import os
 import asyncio
-from typing import Dict, Any, List, Optional
-from pathlib import Path
+import pickle
+from datetime import datetime
+from typing import Dict, Any, Iterator, List, NamedTuple, Optional, Tuple
 import git
 import re
+import fnmatch
+import xxhash
 
 from agent_core.models.base import ModelInterface
 from agents.base_agent import BaseAgent
 from agents.code_doc.git_monitor import GitMonitor
 from agents.code_doc.code_parser import CodeParser
+from agents.code_doc.rate_limiter import TokenBucket
+from agents.code_doc.response_cache import ResponseCache
+
+DOC_SYSTEM_PROMPT = "You are an expert code documentation assistant. Your task is to suggest documentation updates based on code changes."
+DOC_TEMPERATURE = 0.2
+
+class Change(NamedTuple):
+    """A changed file flowing through a documentation cycle."""
+    file: str
+    type: str
+    last_modified: str = ""
+    
+    @classmethod
+    def from_dict(cls, change: Dict[str, Any]) -> "Change":
+        """Adapt a change record from sources that still report dicts."""
+        return cls(change.get("file", ""), change.get("type", ""), change.get("last_modified", ""))
 
 class CodeDocAgent(BaseAgent):
     """Agent for monitoring code changes and suggesting documentation updates."""
@@ -19,8 +38,27 @@ class CodeDocAgent(BaseAgent):
         super().__init__("code_documentation", config, model_interface)
         self.watch_paths = config.get("watch_paths", [])
         self.ignore_patterns = config.get("ignore_patterns", [])
+        # One alternation compiled up front instead of re.match per pattern per file
+        self._ignore_re = re.compile(
+            "|".join(f"(?:{self._pattern_to_regex(pattern)})" for pattern in self.ignore_patterns)
+        ) if self.ignore_patterns else None
         self.parser = CodeParser()
+        # path -> (mtime, size, content digest); files are only re-hashed when
+        # their mtime or size moves, so a cycle scales with changed files
+        self.file_extensions = tuple(config.get("file_extensions", [".py"]))
+        self._file_index_path = config.get(
+            "file_index_path", os.path.join(config.get("cache_dir", ".code_doc_cache"), "file_index.pkl")
+        )
+        self._file_index: Dict[str, Tuple[float, int, str]] = self._load_file_index()
+        # Unchanged files produce identical prompts, so cycles reuse responses
+        self._resp_cache = ResponseCache(
+            config.get("cache_dir", ".code_doc_cache"),
+            policy=config.get("cache_policy", "enabled")
+        )
+        # Paces model calls under the provider's request and token quotas
+        self._rate = TokenBucket(rpm=config.get("rpm", 60), tpm=config.get("tpm", 60000))
         self.git_monitor = None
+        self._watch_task = None
         
     async def initialize(self) -> None:
         """Initialize the code documentation agent."""
@@ -32,6 +70,30 @@ class CodeDocAgent(BaseAgent):
             except Exception as e:
                 self.logger.error(f"Failed to initialize Git monitoring: {str(e)}")
                 self.git_monitor = None
+        if self.config.get("update_frequency") == "on_change":
+            self._watch_task = asyncio.create_task(self._watch_for_changes())
+    
+    async def _watch_for_changes(self) -> None:
+        """Notify the agent loop when a stat of the watched files changes."""
+        interval = self.config.get("watch_interval_seconds", 5)
+        previous = await asyncio.to_thread(self._stat_snapshot)
+        while self.is_running:
+            await asyncio.sleep(interval)
+            current = await asyncio.to_thread(self._stat_snapshot)
+            if current != previous:
+                previous = current
+                self.notify_change()
+    
+    def _stat_snapshot(self) -> frozenset:
+        """Cheap (path, mtime, size) fingerprint of the watched files; no reads."""
+        snapshot = set()
+        for entry in self._iter_watched_files():
+            try:
+                stat = entry.stat()
+            except OSError:
+                continue
+            snapshot.add((entry.path, stat.st_mtime, stat.st_size))
+        return frozenset(snapshot)
     
     async def run_cycle(self) -> Dict[str, Any]:
         """Run a documentation cycle."""
@@ -59,76 +121,204 @@ class CodeDocAgent(BaseAgent):
             "documentation_suggestions": formatted_results
         }
     
-    async def _analyze_git_changes(self) -> List[Dict[str, Any]]:
+    async def _analyze_git_changes(self) -> List[Change]:
         """Analyze changes from Git."""
         if not self.git_monitor:
             return []
             
         self.logger.info("Analyzing Git changes")
-        changes = self.git_monitor.get_recent_changes()
+        changes = [
+            change if isinstance(change, Change) else Change.from_dict(change)
+            for change in self.git_monitor.get_recent_changes()
+        ]
         filtered_changes = self._filter_relevant_changes(changes)
         return filtered_changes
     
-    async def _analyze_file_changes(self) -> List[Dict[str, Any]]:
+    async def _analyze_file_changes(self) -> List[Change]:
         """Analyze changes from the file system."""
         self.logger.info("Analyzing file system for changes")
-        # This would track file modifications based on timestamps or hashing
-        # For now, we'll return an example
-        return [
-            {
-                "file": "src/example.py",
-                "type": "modified",
-                "last_modified": "2023-05-06T10:30:00"
-            }
-        ]
+        changes = await asyncio.to_thread(self._scan_watch_paths)
+        return self._filter_relevant_changes(changes)
+    
+    def _scan_watch_paths(self) -> List[Change]:
+        """Diff watch_paths against the file index, hashing only touched files."""
+        # The first scan without a saved index only records the baseline
+        has_baseline = bool(self._file_index)
+        changes = []
+        index_changed = False
+        
+        for entry in self._iter_watched_files():
+            try:
+                stat = entry.stat()
+                previous = self._file_index.get(entry.path)
+                if previous and previous[0] == stat.st_mtime and previous[1] == stat.st_size:
+                    continue
+                with open(entry.path, "rb") as f:
+                    digest = xxhash.xxh3_64(f.read()).hexdigest()
+            except OSError as e:
+                self.logger.warning(f"Could not read {entry.path}: {str(e)}")
+                continue
+            
+            self._file_index[entry.path] = (stat.st_mtime, stat.st_size, digest)
+            index_changed = True
+            if previous is None and not has_baseline:
+                continue
+            if previous is None or previous[2] != digest:
+                changes.append(Change(
+                    file=entry.path,
+                    type="added" if previous is None else "modified",
+                    last_modified=datetime.fromtimestamp(stat.st_mtime).isoformat()
+                ))
+        
+        if index_changed:
+            self._save_file_index()
+        return changes
+    
+    def _iter_watched_files(self) -> Iterator[os.DirEntry]:
+        """Walk watch_paths with os.scandir, yielding matching regular files."""
+        pending = list(self.watch_paths)
+        while pending:
+            directory = pending.pop()
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            pending.append(entry.path)
+                        elif entry.is_file() and entry.name.endswith(self.file_extensions):
+                            yield entry
+            except OSError as e:
+                self.logger.warning(f"Could not scan {directory}: {str(e)}")
     
-    def _filter_relevant_changes(self, changes: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def _load_file_index(self) -> Dict[str, Tuple[float, int, str]]:
+        """Load the persisted file index so restarts don't rehash the tree."""
+        try:
+            with open(self._file_index_path, "rb") as f:
+                return pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError):
+            return {}
+    
+    def _save_file_index(self) -> None:
+        """Persist the file index atomically."""
+        try:
+            os.makedirs(os.path.dirname(self._file_index_path) or ".", exist_ok=True)
+            tmp_path = f"{self._file_index_path}.tmp"
+            with open(tmp_path, "wb") as f:
+                pickle.dump(self._file_index, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, self._file_index_path)
+        except OSError as e:
+            self.logger.warning(f"Could not save file index: {str(e)}")
+    
+    @staticmethod
+    def _pattern_to_regex(pattern: str) -> str:
+        """Use a pattern as a regex, treating invalid regexes such as "*.pyc" as globs."""
+        try:
+            re.compile(pattern)
+            return pattern
+        except re.error:
+            return fnmatch.translate(pattern)
+    
+    def _filter_relevant_changes(self, changes: List[Change]) -> List[Change]:
         """Filter changes based on ignore patterns."""
         filtered = []
         for change in changes:
-            file_path = change.get("file", "")
+            file_path = change.file
             # Check if file matches any ignore pattern
-            if not any(re.match(pattern, file_path) for pattern in self.ignore_patterns):
+            if self._ignore_re is None or not self._ignore_re.match(file_path):
                 filtered.append(change)
         return filtered
     
-    async def _process_changes(self, changes: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    async def _process_changes(self, changes: List[Change]) -> List[Dict[str, Any]]:
         """Process code changes and generate documentation suggestions."""
-        results = []
+        # Files are read and sent to the model concurrently, bounded so a large
+        # commit doesn't flood the model backend
+        semaphore = asyncio.Semaphore(self.config.get("max_concurrent_files", 8))
+        outcomes = await asyncio.gather(
+            *(self._process_change(change, semaphore) for change in changes),
+            return_exceptions=True
+        )
         
-        for change in changes:
-            file_path = change.get("file")
-            if not os.path.exists(file_path):
-                continue
+        results = []
+        for change, outcome in zip(changes, outcomes):
+            if isinstance(outcome, Exception):
+                self.logger.error(f"Failed to process {change.file}: {str(outcome)}")
+            elif outcome is not None:
+                results.append(outcome)
+        return results
+    
+    async def _process_change(self, change: Change, semaphore: asyncio.Semaphore) -> Optional[Dict[str, Any]]:
+        """Generate a documentation suggestion for a single changed file."""
+        file_path = change.file
+        async with semaphore:
+            if not await asyncio.to_thread(os.path.exists, file_path):
+                return None
                 
-            # Parse the code file
-            code_content = Path(file_path).read_text(encoding='utf-8')
+            # Parse the code file off the event loop
+            code_content, was_truncated = await asyncio.to_thread(self._read_code, file_path)
             parsed_code = self.parser.parse(file_path, code_content)
             
             # Generate documentation with the AI model
-            prompt = self._create_doc_prompt(parsed_code, change)
-            suggestion = await self.model.generate(
-                prompt=prompt,
-                system_prompt="You are an expert code documentation assistant. Your task is to suggest documentation updates based on code changes.",
-                parameters={"temperature": 0.2}
+            prompt = self._create_doc_prompt(parsed_code, change, was_truncated)
+            cache_key = ResponseCache.make_key(
+                prompt,
+                DOC_SYSTEM_PROMPT,
+                self._cache_model_name(),
+                DOC_TEMPERATURE
             )
+            suggestion = await asyncio.to_thread(self._resp_cache.get, cache_key)
+            if suggestion is None:
+                # Rough estimate of ~4 characters per token
+                await self._rate.acquire(estimated_tokens=len(prompt) // 4)
+                # A failed generation raises here, so it is never cached
+                suggestion = await self.model.generate(
+                    prompt=prompt,
+                    system_prompt=DOC_SYSTEM_PROMPT,
+                    parameters={"temperature": DOC_TEMPERATURE}
+                )
+                await asyncio.to_thread(self._resp_cache.set, cache_key, suggestion)
             
-            results.append({
-                "file": file_path,
-                "type": change.get("type"),
-                "suggestion": suggestion
-            })
-            
-        return results
+        return {
+            "file": file_path,
+            "type": change.type,
+            "suggestion": suggestion
+        }
+    
+    def _cache_model_name(self) -> str:
+        return self.config.get("model") or type(self.model).__name__
     
-    def _create_doc_prompt(self, parsed_code: Dict[str, Any], change: Dict[str, Any]) -> str:
+    def _read_code(self, file_path: str) -> Tuple[str, bool]:
+        """Read at most max_bytes_per_file, keeping the head and tail of larger files.
+        
+        Returns the decoded content and whether it was truncated; the model's
+        context can't take whole generated files anyway.
+        """
+        max_bytes = self.config.get("max_bytes_per_file", 64 * 1024)
+        with open(file_path, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            if size <= max_bytes:
+                return f.read().decode("utf-8", "replace"), False
+            half = max_bytes // 2
+            head = f.read(half)
+            f.seek(size - half)
+            tail = f.read(half)
+        content = (
+            head.decode("utf-8", "replace")
+            + f"\n# ... {size - 2 * half} bytes omitted ...\n"
+            + tail.decode("utf-8", "replace")
+        )
+        return content, True
+    
+    def _create_doc_prompt(self, parsed_code: Dict[str, Any], change: Change, was_truncated: bool = False) -> str:
         """Create a prompt for documentation generation."""
+        truncation_note = (
+            "Note: the file is large, so only its beginning and end are shown.\n"
+            if was_truncated else ""
+        )
         return f"""
         I need documentation suggestions for the following code changes:
         
-        File: {change.get('file')}
-        Change type: {change.get('type')}
-        
+        File: {change.file}
+        Change type: {change.type}
+        {truncation_note}
         Code:
         ```python
         {parsed_code.get('content', '')}
@@ -0,0 +1,52 @@
+# Request/token pacing for model calls
+# agents/code_doc/rate_limiter.py
+import asyncio
+import time
+
+
+class TokenBucket:
+    """Async limiter holding separate request-per-minute and token-per-minute budgets.
+
+    Both buckets refill continuously from time.monotonic(); acquire() waits
+    until one request and the estimated tokens fit, so bursts are spread out
+    instead of tripping provider 429s.
+    """
+
+    def __init__(self, rpm: float = 60, tpm: float = 60000):
+        if rpm <= 0 or tpm <= 0:
+            raise ValueError("rpm and tpm must be positive")
+        self.rpm = float(rpm)
+        self.tpm = float(tpm)
+        self.request_tokens = self.rpm
+        self.token_tokens = self.tpm
+        self.last_update = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        elapsed = now - self.last_update
+        self.request_tokens = min(
+            self.rpm, self.request_tokens + elapsed * self.rpm / 60
+        )
+        self.token_tokens = min(self.tpm, self.token_tokens + elapsed * self.tpm / 60)
+        self.last_update = now
+
+    async def acquire(self, estimated_tokens: int = 0) -> float:
+        """Wait for budget for one request of estimated_tokens; return seconds waited."""
+        # A single oversized prompt can never fit, so charge at most a full bucket
+        tokens = min(float(estimated_tokens), self.tpm)
+        waited = 0.0
+        # Callers queue on the lock so concurrent requests are paced in order
+        async with self._lock:
+            while True:
+                self._refill()
+                if self.request_tokens >= 1 and self.token_tokens >= tokens:
+                    self.request_tokens -= 1
+                    self.token_tokens -= tokens
+                    return waited
+                wait_time = max(
+                    (1 - self.request_tokens) * 60 / self.rpm,
+                    (tokens - self.token_tokens) * 60 / self.tpm,
+                )
+                await asyncio.sleep(wait_time)
+                waited += wait_time
@@ -0,0 +1,68 @@
+# Prompt/response cache for documentation suggestions
+# agents/code_doc/response_cache.py
+import hashlib
+import json
+import time
+from pathlib import Path
+from typing import Optional
+
+
+class ResponseCache:
+    """Disk cache of model responses keyed by a SHA256 of the full request.
+
+    Policies:
+        enabled  - serve unexpired entries and store new responses
+        replay   - serve any stored entry regardless of age, never write
+        disabled - always call the model
+    """
+
+    POLICIES = ("enabled", "replay", "disabled")
+
+    def __init__(
+        self, directory: str, policy: str = "enabled", expire_seconds: int = 86400
+    ):
+        if policy not in self.POLICIES:
+            raise ValueError(
+                f"Unknown cache policy '{policy}', expected one of {self.POLICIES}"
+            )
+        self.directory = Path(directory)
+        self.policy = policy
+        self.expire_seconds = expire_seconds
+
+    @staticmethod
+    def make_key(
+        prompt: str, system_prompt: str, model: str, temperature: float
+    ) -> str:
+        """Deterministic key covering everything that changes the response."""
+        payload = "|".join([prompt, system_prompt, model, str(temperature)])
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """Return a cached response, or None on a miss or expired entry."""
+        if self.policy == "disabled":
+            return None
+        path = self._path(key)
+        try:
+            entry = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        if (
+            self.policy == "enabled"
+            and time.time() - entry.get("created_at", 0) > self.expire_seconds
+        ):
+            return None
+        return entry.get("response")
+
+    def set(self, key: str, response: str) -> None:
+        """Store a response unless the policy is read-only."""
+        if self.policy != "enabled":
+            return
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(
+            json.dumps({"created_at": time.time(), "response": response}),
+            encoding="utf-8",
+        )
+
+    def _path(self, key: str) -> Path:
+        return self.directory / key[:2] / f"{key}.json"
@@ -13,11 +13,19 @@ from agents.base_agent import BaseAgent
 class AgentManager:
     """Manages the lifecycle of all agents in the system."""
     
+    # Built-in agents: config name -> (module, class)
+    _AGENT_REGISTRY = {
+        "code_documentation": ("agents.code_doc.agent", "CodeDocAgent"),
+        "research_analysis": ("agents.research.agent", "ResearchAnalysisAgent"),
+    }
+    
     def __init__(self, config_path: str = "config/agent_config.yaml"):
         self.logger = logging.getLogger("agent_manager")
         self.config = load_config(config_path)
         self.agents: Dict[str, BaseAgent] = {}
         self.model_instances: Dict[str, ModelInterface] = {}
+        self._model_to_provider: Dict[str, str] = {}
+        self._agent_classes: Dict[str, type] = {}
         self.tasks = []
     
     async def initialize(self) -> None:
@@ -35,6 +43,16 @@ class AgentManager:
         model_config = self.config.get("models", {})
         default_provider = model_config.get("default", "ollama")
         
+        # Inverted model -> provider index so agent lookups don't rescan every provider
+        self._model_to_provider = {}
+        for provider_name, provider_config in model_config.get("providers", {}).items():
+            for model in provider_config.get("models", []):
+                # First provider listing a model owns it
+                self._model_to_provider.setdefault(model.get("name", model.get("repo_id", "")), provider_name)
+        
+        # Import every enabled provider first, then initialize them concurrently
+        # so startup takes as long as the slowest provider, not their sum
+        pending = []
         for provider_name, provider_config in model_config.get("providers", {}).items():
             if not provider_config.get("enabled", True):
                 continue
@@ -43,15 +61,23 @@ class AgentManager:
             try:
                 module = importlib.import_module(f"agent_core.models.{provider_name}")
                 model_class = getattr(module, f"{provider_name.capitalize()}ModelInterface")
-                
-                # Initialize the model interface
-                model_interface = model_class()
-                await model_interface.initialize(provider_config)
-                
-                self.model_instances[provider_name] = model_interface
-                self.logger.info(f"Initialized model interface for {provider_name}")
+                pending.append((provider_name, model_class(), provider_config))
             except Exception as e:
                 self.logger.error(f"Failed to initialize model interface for {provider_name}: {str(e)}", exc_info=True)
+        
+        results = await asyncio.gather(
+            *(model_interface.initialize(provider_config) for _, model_interface, provider_config in pending),
+            return_exceptions=True
+        )
+        for (provider_name, model_interface, _), result in zip(pending, results):
+            if isinstance(result, Exception):
+                self.logger.error(
+                    f"Failed to initialize model interface for {provider_name}: {str(result)}",
+                    exc_info=result
+                )
+                continue
+            self.model_instances[provider_name] = model_interface
+            self.logger.info(f"Initialized model interface for {provider_name}")
     
     async def _initialize_agents(self) -> None:
         """Initialize agents based on configuration."""
@@ -71,16 +97,7 @@ class AgentManager:
             
             # Import the appropriate agent class
             try:
-                if agent_name == "code_documentation":
-                    module = importlib.import_module("agents.code_doc.agent")
-                    agent_class = getattr(module, "CodeDocAgent")
-                elif agent_name == "research_analysis":
-                    module = importlib.import_module("agents.research.agent")
-                    agent_class = getattr(module, "ResearchAnalysisAgent")
-                else:
-                    # Try to dynamically import a custom agent
-                    module = importlib.import_module(f"agents.{agent_name}.agent")
-                    agent_class = getattr(module, f"{agent_name.title().replace('_', '')}Agent")
+                agent_class = self._resolve_agent_class(agent_name)
                 
                 # Initialize the agent
                 agent = agent_class(agent_config, self.model_instances[model_provider])
@@ -89,21 +106,25 @@ class AgentManager:
             except Exception as e:
                 self.logger.error(f"Failed to initialize agent {agent_name}: {str(e)}", exc_info=True)
     
+    def _resolve_agent_class(self, agent_name: str) -> type:
+        """Import an agent's class once and memoize it by agent name."""
+        agent_class = self._agent_classes.get(agent_name)
+        if agent_class is None:
+            # Custom agents follow the agents.<name>.agent / <Name>Agent convention
+            module_name, class_name = self._AGENT_REGISTRY.get(
+                agent_name,
+                (f"agents.{agent_name}.agent", f"{agent_name.title().replace('_', '')}Agent")
+            )
+            agent_class = getattr(importlib.import_module(module_name), class_name)
+            self._agent_classes[agent_name] = agent_class
+        return agent_class
+    
     def _get_model_provider(self, model_name: str) -> str:
         """Determine which provider owns a specific model."""
-        model_config = self.config.get("models", {})
-        default_provider = model_config.get("default", "ollama")
-        
-        # Check each provider for the model
-        for provider_name, provider_config in model_config.get("providers", {}).items():
-            models = provider_config.get("models", [])
-            for model in models:
-                name = model.get("name", model.get("repo_id", ""))
-                if name == model_name:
-                    return provider_name
-        
         # Fall back to default provider
-        return default_provider
+        return self._model_to_provider.get(
+            model_name, self.config.get("models", {}).get("default", "ollama")
+        )
     
     async def start_agent(self, agent_name: str) -> bool:
         """Start a specific agent."""
@@ -1,8 +1,12 @@
 # agents/research/agent.py
 import asyncio
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 import os
-import json
+import hashlib
+import itertools
+from dataclasses import dataclass
+from collections import defaultdict
+from datetime import datetime, timezone
 
 from agent_core.models.base import ModelInterface
 from agent_core.data.mongodb import MongoDBClient
@@ -12,6 +16,106 @@ from agents.base_agent import BaseAgent
 from agents.research.paper_processor import PaperProcessor
 from agents.research.concept_mapper import ConceptMapper
 
+# Characters of paper content included in each prompt
+CONTENT_EXCERPT_CHARS = 2000
+
+# Upper bound on characters per token, used to size the fetched excerpt
+# when content is trimmed to a token budget instead
+MAX_CHARS_PER_TOKEN = 8
+
+def paper_projection(excerpt_chars: int) -> Dict[str, Any]:
+    """Fields the prompts use, with content cut server-side to excerpt_chars."""
+    return {
+        # Stringified server-side so no ObjectId is decoded or formatted per paper
+        "_id": 0,
+        "paper_id": {"$toString": "$_id"},
+        "id": 1,
+        "title": 1,
+        "abstract": 1,
+        "authors": 1,
+        "categories": 1,
+        "content": {"$substrCP": [{"$ifNull": ["$content", ""]}, 0, excerpt_chars]},
+    }
+
+PAPER_PROJECTION = paper_projection(CONTENT_EXCERPT_CHARS)
+
+# Prompt template for every task without a template file; the task-specific
+# text is in _DEFAULT_INSTRUCTIONS, so only paper fields vary here
+# (indentation is part of the prompt text and of the prompt cache key)
+_DEFAULT_PROMPT_TEMPLATE = """
+            Title: {title}
+            Authors: {authors}
+            Categories: {categories}
+            
+            Abstract:
+            {abstract}
+            
+            Paper excerpt:
+            {content}
+            """
+
+# Fixed instructions for tasks without a template file, keyed by task name
+# (indentation is part of the prompt text and of the prompt cache key)
+_DEFAULT_INSTRUCTIONS = {
+    "summarize": """
+            Please provide a comprehensive summary of the research paper in the user message.
+            
+            Your summary should include:
+            1. The main research question or problem
+            2. Key methodologies used
+            3. Major findings and results
+            4. Limitations and future work
+            5. Potential applications and impact
+            """,
+    "concept_mapping": """
+            Please extract and map the key concepts from the research paper in the user message.
+            
+            Your response should include:
+            1. A list of key concepts/terms and their definitions
+            2. Relationships between these concepts
+            3. How these concepts connect to the broader field
+            4. Novel combinations or applications of these concepts
+            """,
+    "_default": """
+            Please analyze the research paper in the user message.
+            
+            Provide a detailed analysis including key points, methodology, results, and significance.
+            """,
+}
+
+@dataclass(slots=True)
+class Paper:
+    """Fields of a fetched paper that the prompts use."""
+    id: str
+    title: str
+    abstract: str
+    authors: List[str]
+    categories: List[str]
+    content: str
+    # Joined once here instead of by every task's prompt
+    authors_str: str
+    categories_str: str
+    
+    @classmethod
+    def from_document(cls, document: Dict[str, Any], excerpt_chars: int = CONTENT_EXCERPT_CHARS) -> "Paper":
+        """Build a paper from a MongoDB document or Neo4j row."""
+        paper_id = document.get("paper_id")
+        if paper_id is None:
+            paper_id = str(document.get("_id", document.get("id", "unknown")))
+        authors = document.get("authors", [])
+        categories = document.get("categories", [])
+        return cls(
+            id=paper_id,
+            title=document.get("title", "Untitled"),
+            abstract=document.get("abstract", ""),
+            authors=authors,
+            categories=categories,
+            # MongoDB cuts content server-side; Cypher queries come from config
+            content=(document.get("content") or "")[:excerpt_chars],
+            authors_str=", ".join(authors),
+            categories_str=", ".join(categories)
+        )
+
 class ResearchAnalysisAgent(BaseAgent):
     """Agent for analyzing research papers and generating insights."""
     
@@ -29,11 +133,45 @@ class ResearchAnalysisAgent(BaseAgent):
         self.mongodb_clients = {}
         self.neo4j_clients = {}
         self.vector_store = None
+        # Exact-match prompt -> analysis cache, stored with the first MongoDB source
+        self.prompt_cache = None
+        self._system_prompts: Dict[str, str] = {}
+        self._templates: Dict[str, str] = {}
+        # Clients are created once and reused by every cycle; this bounds how many
+        # blocking DB calls run in worker threads so cycles cannot drain the pools
+        self._db_semaphore = asyncio.Semaphore(config.get("db_concurrency", 8))
+        # (kind, client, collection or query) per source, resolved in initialize
+        self._fetch_specs: List[Tuple[str, Any, str]] = []
+        # Optional exact token budget for content, using a Hugging Face tokenizer
+        # loaded once in initialize; otherwise content is cut by characters
+        self.max_content_tokens = config.get("max_content_tokens")
+        self._tokenizer = None
+        self._excerpt_chars = CONTENT_EXCERPT_CHARS
+        self._paper_projection = PAPER_PROJECTION
         
     async def initialize(self) -> None:
         """Initialize the research analysis agent."""
         self.logger.info("Initializing research analysis agent")
         
+        # System prompts are fixed per task; paper content only goes in the user message
+        self._system_prompts = {task.get("name"): self._build_system_prompt(task) for task in self.tasks}
+        # Templates are read once instead of on every cycle, off the event loop
+        templates = await asyncio.gather(
+            *(asyncio.to_thread(self._load_prompt_template, task) for task in self.tasks)
+        )
+        self._templates = {task.get("name"): template for task, template in zip(self.tasks, templates)}
+        
+        if self.max_content_tokens and self.config.get("tokenizer"):
+            try:
+                from transformers import AutoTokenizer
+                self._tokenizer = await asyncio.to_thread(AutoTokenizer.from_pretrained, self.config["tokenizer"])
+                # Fetch enough characters to fill the budget, then trim by tokens
+                self._excerpt_chars = self.max_content_tokens * MAX_CHARS_PER_TOKEN
+                self._paper_projection = paper_projection(self._excerpt_chars)
+                self.logger.info(f"Trimming paper content to {self.max_content_tokens} tokens")
+            except Exception as e:
+                self.logger.warning(f"Could not load tokenizer {self.config['tokenizer']}, trimming by characters: {str(e)}")
+        
         # Initialize data source clients
         for source in self.data_sources:
             source_type = source.get("type")
@@ -44,6 +182,21 @@ class ResearchAnalysisAgent(BaseAgent):
                     database=source.get("database")
                 )
                 self.mongodb_clients[source.get("database")] = client
+                if self.prompt_cache is None:
+                    self.prompt_cache = client.get_collection(
+                        self.config.get("prompt_cache_collection", "prompt_cache")
+                    )
+                    try:
+                        self.prompt_cache.create_index(
+                            [("task_name", 1), ("model_name", 1), ("key", 1)], unique=True
+                        )
+                        # Entries expire so prompt or model changes never pin stale analyses
+                        self.prompt_cache.create_index(
+                            "updated_at",
+                            expireAfterSeconds=self.config.get("prompt_cache_ttl_seconds", 30 * 24 * 3600)
+                        )
+                    except Exception as e:
+                        self.logger.warning(f"Could not index prompt cache: {str(e)}")
                 self.logger.info(f"Connected to MongoDB database: {source.get('database')}")
                 
             elif source_type == "neo4j":
@@ -56,6 +209,19 @@ class ResearchAnalysisAgent(BaseAgent):
                 self.neo4j_clients["default"] = client
                 self.logger.info("Connected to Neo4j database")
         
+        # Pair each source with its client once instead of re-matching every cycle;
+        # Neo4j sources share the single client, as before
+        self._fetch_specs = []
+        for source in self.data_sources:
+            source_type = source.get("type")
+            if source_type == "mongodb":
+                client = self.mongodb_clients.get(source.get("database"))
+                if client is not None:
+                    self._fetch_specs.append(("mongodb", client, source.get("collection")))
+            elif source_type == "neo4j":
+                for client in self.neo4j_clients.values():
+                    self._fetch_specs.append(("neo4j", client, source.get("query")))
+        
         # Initialize vector store
         if self.vector_store_config:
             vector_type = self.vector_store_config.get("type")
@@ -70,151 +236,249 @@ class ResearchAnalysisAgent(BaseAgent):
         """Run a research analysis cycle."""
         self.logger.info("Running research analysis cycle")
         
-        # Get papers to analyze
-        papers = await self._fetch_papers()
+        # Papers stream in chunks through a bounded queue, so the model works on
+        # one chunk while the next is fetched and only a few chunks are in memory
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.config.get("max_pending_chunks", 4))
+        producer = asyncio.create_task(self._produce_papers(queue))
         
-        if not papers:
+        results: Dict[str, Dict[str, Any]] = {task.get("name"): {} for task in self.tasks}
+        papers_analyzed = 0
+        try:
+            while (papers := await queue.get()) is not None:
+                # Tokenize once per paper, not once per task
+                if self._tokenizer is not None:
+                    await asyncio.to_thread(self._trim_contents, papers)
+                
+                # Prompt fields (joined authors etc.) are shared by every task
+                paper_fields = [self._prompt_fields(paper) for paper in papers]
+                
+                for task in self.tasks:
+                    task_name = task.get("name")
+                    self.logger.info(f"Processing task {task_name} for {len(papers)} papers")
+                    results[task_name].update(await self._process_task(task, papers, paper_fields))
+                
+                papers_analyzed += len(papers)
+                self.logger.info(f"Analyzed {papers_analyzed} papers so far")
+        finally:
+            if not producer.done():
+                producer.cancel()
+        # Surface fetch errors once the queue is drained
+        await producer
+        
+        if not papers_analyzed:
             self.logger.info("No papers to analyze")
             return {"status": "no_papers"}
         
-        # Process tasks
-        results = {}
-        for task in self.tasks:
-            task_name = task.get("name")
-            self.logger.info(f"Processing task: {task_name}")
-            
-            task_results = await self._process_task(task, papers)
-            results[task_name] = task_results
-        
         return {
             "status": "completed",
-            "papers_analyzed": len(papers),
+            "papers_analyzed": papers_analyzed,
             "results": results
         }
     
-    async def _fetch_papers(self) -> List[Dict[str, Any]]:
-        """Fetch papers from configured data sources."""
-        all_papers = []
-        
-        # Fetch from MongoDB
-        for db_name, client in self.mongodb_clients.items():
-            for source in self.data_sources:
-                if source.get("type") == "mongodb" and source.get("database") == db_name:
-                    collection = client.get_collection(source.get("collection"))
-                    papers = list(collection.find({}))
-                    self.logger.info(f"Fetched {len(papers)} papers from MongoDB collection {source.get('collection')}")
-                    all_papers.extend(papers)
-        
-        # Fetch from Neo4j
-        for _, client in self.neo4j_clients.items():
-            for source in self.data_sources:
-                if source.get("type") == "neo4j":
-                    query = source.get("query")
-                    papers = client.run_query(query)
-                    self.logger.info(f"Fetched {len(papers)} papers from Neo4j")
-                    all_papers.extend(papers)
-        
-        return all_papers
+    async def _produce_papers(self, queue: asyncio.Queue) -> None:
+        """Stream chunks from every data source into the queue, then a None sentinel."""
+        streams = [asyncio.create_task(self._stream_source(spec, queue)) for spec in self._fetch_specs]
+        try:
+            await asyncio.gather(*streams)
+        except Exception:
+            # Stop the other sources and let the consumer finish what it has
+            for stream in streams:
+                stream.cancel()
+            await queue.put(None)
+            raise
+        await queue.put(None)
+    
+    async def _stream_source(self, spec: Tuple[str, Any, str], queue: asyncio.Queue) -> None:
+        """Stream papers from one (kind, client, collection or query) spec."""
+        kind, client, target = spec
+        chunk_size = self.config.get("chunk_size", 500)
+        fetched = 0
+        if kind == "mongodb":
+            collection = client.get_collection(target)
+            # Only the fields the prompts use, with content cut server-side to the
+            # excerpt length, drained off the event loop one chunk at a time
+            cursor = collection.find({}, self._paper_projection).batch_size(chunk_size)
+            while True:
+                async with self._db_semaphore:
+                    documents = await asyncio.to_thread(list, itertools.islice(cursor, chunk_size))
+                if not documents:
+                    break
+                fetched += len(documents)
+                await queue.put([Paper.from_document(document, self._excerpt_chars) for document in documents])
+            self.logger.info(f"Fetched {fetched} papers from MongoDB collection {target}")
+            return
+        
+        # The Neo4j driver is blocking and returns whole result sets; keep it off the event loop
+        async with self._db_semaphore:
+            rows = await asyncio.to_thread(client.run_query, target)
+        self.logger.info(f"Fetched {len(rows)} papers from Neo4j")
+        for start in range(0, len(rows), chunk_size):
+            await queue.put([Paper.from_document(row, self._excerpt_chars) for row in rows[start:start + chunk_size]])
+    
+    def _trim_contents(self, papers: List[Paper]) -> None:
+        """Cut each paper's content to max_content_tokens in one tokenizer batch."""
+        encoded = self._tokenizer(
+            [paper.content for paper in papers],
+            add_special_tokens=False,
+            truncation=True,
+            max_length=self.max_content_tokens
+        )["input_ids"]
+        for paper, ids in zip(papers, encoded):
+            paper.content = self._tokenizer.decode(ids, skip_special_tokens=True)
     
-    async def _process_task(self, task: Dict[str, Any], papers: List[Dict[str, Any]]) -> Dict[str, Any]:
+    async def _process_task(self,
+                            task: Dict[str, Any],
+                            papers: List[Paper],
+                            paper_fields: Optional[List[Dict[str, str]]] = None) -> Dict[str, Any]:
         """Process a specific task on the papers."""
         task_name = task.get("name")
-        prompt_template_path = task.get("prompt_template")
+        prompt_template = self._templates.get(task_name)
+        if prompt_template is None:
+            # Only tasks unknown at initialize reach the disk here
+            prompt_template = await asyncio.to_thread(self._load_prompt_template, task)
+        if paper_fields is None:
+            paper_fields = [self._prompt_fields(paper) for paper in papers]
         
-        # Load prompt template
-        prompt_template = ""
-        if prompt_template_path and os.path.exists(prompt_template_path):
-            with open(prompt_template_path, 'r') as f:
-                prompt_template = f.read()
-        else:
-            prompt_template = self._get_default_prompt(task_name)
+        # Identical for every paper so the provider can cache the prefix
+        system_prompt = self._system_prompts.get(task_name)
+        if system_prompt is None:
+            system_prompt = self._build_system_prompt(task)
         
         results = {}
-        
-        # Process each paper
-        for paper in papers:
-            paper_id = str(paper.get("_id", paper.get("id", "unknown")))
-            paper_title = paper.get("title", "Untitled")
+        pending = list(zip(papers, paper_fields))
+        attempts = self.config.get("max_attempts", 2)
+        for attempt in range(1, attempts + 1):
+            # Render every prompt up front and hand the whole set to the model
+            # in one batch; providers overlap or natively batch the requests
+            prompts = [prompt_template.format_map(fields) for _, fields in pending]
             
-            # Create prompt for this paper
-            prompt = prompt_template.format(
-                title=paper_title,
-                abstract=paper.get("abstract", ""),
-                authors=", ".join(paper.get("authors", [])),
-                categories=", ".join(paper.get("categories", [])),
-                content=paper.get("content", "")[:2000]  # Limit content to prevent token overflow
-            )
-            
-            # Generate analysis
-            analysis = await self.model.generate(
-                prompt=prompt,
-                system_prompt=f"You are an expert research analyst specializing in scientific papers. Your task is to {task.get('description')}",
-                parameters={"temperature": 0.3}
-            )
+            # Unchanged papers render identical prompts; reuse their analyses
+            keys = [self._prompt_cache_key(system_prompt, prompt) for prompt in prompts]
+            cached = await self._get_cached_analyses(task_name, keys)
+            # Duplicate papers render the same prompt; ask the model once per key
+            misses: Dict[str, List[Any]] = defaultdict(list)
+            miss_prompts: Dict[str, str] = {}
+            for (paper, fields), prompt, key in zip(pending, prompts, keys):
+                if key in cached:
+                    results[paper.id] = {
+                        "title": paper.title,
+                        "analysis": cached[key]
+                    }
+                else:
+                    misses[key].append((paper, fields))
+                    miss_prompts[key] = prompt
+            if cached:
+                self.logger.info(f"Reused {len(cached)} cached analyses for task {task_name}")
             
-            results[paper_id] = {
-                "title": paper_title,
-                "analysis": analysis
-            }
+            # Cap in-flight model calls (match the backend's parallelism, e.g. OLLAMA_NUM_PARALLEL)
+            outcomes = await self.model.generate_batch(
+                list(miss_prompts.values()),
+                system_prompt=system_prompt,
+                parameters={"temperature": 0.3},
+                max_concurrency=self.config.get("max_concurrency", 10)
+            ) if miss_prompts else []
+            failed = []
+            generated = {}
+            for key, outcome in zip(miss_prompts, outcomes):
+                # Failures are retried and never reach the prompt cache
+                if isinstance(outcome, BaseException):
+                    failed.extend((item, outcome) for item in misses[key])
+                    continue
+                generated[key] = outcome
+                for paper, _ in misses[key]:
+                    results[paper.id] = {
+                        "title": paper.title,
+                        "analysis": outcome
+                    }
+            await self._store_cached_analyses(task_name, generated)
+            if not failed:
+                break
+            # Retry only the papers that failed
+            pending = [item for item, _ in failed]
+            if attempt < attempts:
+                self.logger.warning(f"Retrying {len(pending)} failed papers for task {task_name}")
+            else:
+                for (paper, _), error in failed:
+                    self.logger.error(f"Failed to analyze paper {paper.title} for task {task_name}: {str(error)}")
             
         return results
     
-    def _get_default_prompt(self, task_name: str) -> str:
-        """Get a default prompt template for a task."""
-        if task_name == "summarize":
-            return """
-            Please provide a comprehensive summary of the following research paper:
-            
-            Title: {title}
-            Authors: {authors}
-            Categories: {categories}
-            
-            Abstract:
-            {abstract}
-            
-            Paper excerpt:
-            {content}
-            
-            Your summary should include:
-            1. The main research question or problem
-            2. Key methodologies used
-            3. Major findings and results
-            4. Limitations and future work
-            5. Potential applications and impact
-            """
-        elif task_name == "concept_mapping":
-            return """
-            Please extract and map the key concepts from the following research paper:
-            
-            Title: {title}
-            Authors: {authors}
-            Categories: {categories}
-            
-            Abstract:
-            {abstract}
-            
-            Paper excerpt:
-            {content}
-            
-            Your response should include:
-            1. A list of key concepts/terms and their definitions
-            2. Relationships between these concepts
-            3. How these concepts connect to the broader field
-            4. Novel combinations or applications of these concepts
-            """
-        else:
-            return """
-            Please analyze the following research paper:
-            
-            Title: {title}
-            Authors: {authors}
-            Categories: {categories}
-            
-            Abstract:
-            {abstract}
-            
-            Paper excerpt:
-            {content}
-            
-            Provide a detailed analysis including key points, methodology, results, and significance.
-            """
\ No newline at end of file
+    def _prompt_cache_key(self, system_prompt: str, prompt: str) -> str:
+        """SHA-256 of the full rendered request."""
+        return hashlib.sha256(f"{system_prompt}\n{prompt}".encode("utf-8")).hexdigest()
+    
+    def _cache_model_name(self) -> str:
+        return self.config.get("model") or type(self.model).__name__
+    
+    async def _get_cached_analyses(self, task_name: str, keys: List[str]) -> Dict[str, str]:
+        """Look up cached analyses for many prompt keys in one query."""
+        if self.prompt_cache is None or not keys:
+            return {}
+        
+        def lookup() -> Dict[str, str]:
+            documents = self.prompt_cache.find(
+                {"task_name": task_name, "model_name": self._cache_model_name(), "key": {"$in": keys}},
+                {"_id": 0, "key": 1, "analysis": 1}
+            )
+            return {document["key"]: document["analysis"] for document in documents}
+        
+        try:
+            async with self._db_semaphore:
+                return await asyncio.to_thread(lookup)
+        except Exception as e:
+            self.logger.warning(f"Prompt cache lookup failed: {str(e)}")
+            return {}
+    
+    async def _store_cached_analyses(self, task_name: str, analyses: Dict[str, str]) -> None:
+        """Upsert freshly generated analyses into the prompt cache."""
+        if self.prompt_cache is None or not analyses:
+            return
+        from pymongo import UpdateOne
+        
+        model_name = self._cache_model_name()
+        operations = [
+            UpdateOne(
+                {"task_name": task_name, "model_name": model_name, "key": key},
+                {"$set": {"analysis": analysis, "updated_at": datetime.now(timezone.utc)}},
+                upsert=True
+            )
+            for key, analysis in analyses.items()
+        ]
+        try:
+            async with self._db_semaphore:
+                await asyncio.to_thread(self.prompt_cache.bulk_write, operations, ordered=False)
+        except Exception as e:
+            self.logger.warning(f"Prompt cache update failed: {str(e)}")
+    
+    def _load_prompt_template(self, task: Dict[str, Any]) -> str:
+        """Load a task's prompt template file, or its default template."""
+        prompt_template_path = task.get("prompt_template")
+        if prompt_template_path and os.path.exists(prompt_template_path):
+            with open(prompt_template_path, 'r') as f:
+                return f.read()
+        return _DEFAULT_PROMPT_TEMPLATE
+    
+    @staticmethod
+    def _prompt_fields(paper: Paper) -> Dict[str, str]:
+        """Template fields for a paper, computed once and shared by all tasks."""
+        return {
+            "title": paper.title,
+            "abstract": paper.abstract,
+            "authors": paper.authors_str,
+            "categories": paper.categories_str,
+            "content": paper.content
+        }
+    
+    def _build_system_prompt(self, task: Dict[str, Any]) -> str:
+        """Build a task's static system prompt, including default instructions."""
+        system_prompt = f"You are an expert research analyst specializing in scientific papers. Your task is to {task.get('description')}"
+        prompt_template_path = task.get("prompt_template")
+        if not (prompt_template_path and os.path.exists(prompt_template_path)):
+            # Default templates carry only paper fields; their fixed
+            # instructions live here so the long prefix never varies
+            system_prompt += "\n\n" + self._get_default_instructions(task.get("name"))
+        return system_prompt
+    
+    def _get_default_instructions(self, task_name: str) -> str:
+        """Get the fixed instructions that accompany the default prompt template."""
+        return _DEFAULT_INSTRUCTIONS.get(task_name, _DEFAULT_INSTRUCTIONS["_default"])
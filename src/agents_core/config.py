@@ -1,13 +1,25 @@
 # Configuration loading and validation
 # agent_core/config.py
+import copy
+import functools
+import json
 import os
 import yaml
 import logging
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 import re
 from dotenv import load_dotenv
 from src.utils.ai_services import resolve_ollama_model, resolve_ollama_url
 
+try:
+    # libyaml's C loader parses many times faster than the pure-Python one
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
+
+# ${ENV_VAR} references inside configuration strings
+_ENV_RE = re.compile(r'\$\{([^}]+)\}')
+
 # Load environment variables from .env file
 load_dotenv()
 
@@ -15,24 +27,44 @@ def load_config(config_path: str) -> Dict[str, Any]:
     """
     Load and validate configuration from a YAML file.
     Replaces environment variables in the format ${ENV_VAR}.
+
+    Parsed configs are cached by path and modification time, so CLI commands
+    that load the same file repeatedly parse it once; editing the file
+    invalidates the cache. Environment variables are expanded on every call,
+    on the caller's own copy, so changed variables are always picked up.
     """
     logger = logging.getLogger("config")
     
-    if not os.path.exists(config_path):
+    try:
+        stat = os.stat(config_path)
+    except FileNotFoundError:
         logger.error(f"Configuration file not found: {config_path}")
         raise FileNotFoundError(f"Configuration file not found: {config_path}")
     
+    # Size guards against edits landing within a coarse mtime tick
+    parsed, has_env_refs = _load_config_cached(os.path.abspath(config_path), stat.st_mtime_ns, stat.st_size)
+    config = copy.deepcopy(parsed)
+    
     try:
-        with open(config_path, 'r') as file:
-            config = yaml.safe_load(file)
-        
-        # Replace environment variables
-        config = _replace_env_vars(config)
+        # Replace environment variables; most files have none, so skip the walk
+        if has_env_refs:
+            config = _replace_env_vars(config)
         
         # Validate configuration
         _validate_config(config)
         
         return config
+    except Exception as e:
+        logger.error(f"Error loading configuration: {str(e)}")
+        raise
+
+@functools.lru_cache(maxsize=8)
+def _load_config_cached(config_path: str, mtime_ns: int, size: int) -> Tuple[Any, bool]:
+    """Parse one version of a configuration file, before environment expansion."""
+    logger = logging.getLogger("config")
+    
+    try:
+        return _parse_yaml(config_path, mtime_ns, size)
     except yaml.YAMLError as e:
         logger.error(f"Error parsing YAML configuration: {str(e)}")
         raise ValueError(f"Invalid YAML configuration: {str(e)}")
@@ -40,22 +72,68 @@ def load_config(config_path: str) -> Dict[str, Any]:
         logger.error(f"Error loading configuration: {str(e)}")
         raise
 
+def _parse_yaml(config_path: str, mtime_ns: int, size: int) -> Tuple[Any, bool]:
+    """
+    Parse a YAML file, reusing a JSON sidecar of the parse while it is unchanged.
+    Also reports whether the source contains any ${...} reference at all.
+
+    The sidecar holds the tree before environment variables are expanded, so
+    it never contains more than the YAML file itself. Configs that do not
+    survive a JSON round trip (dates, non-string keys) are not cached.
+    """
+    cache_path = f"{config_path}.cache"
+    try:
+        with open(cache_path, 'r') as file:
+            cached = json.load(file)
+        if cached.get("mtime_ns") == mtime_ns and cached.get("size") == size:
+            return cached["config"], cached["env_refs"]
+    except (OSError, ValueError, KeyError, AttributeError):
+        pass
+    
+    with open(config_path, 'r') as file:
+        text = file.read()
+    config = yaml.load(text, Loader=_SafeLoader)
+    has_env_refs = '${' in text
+    
+    try:
+        payload = json.dumps({"mtime_ns": mtime_ns, "size": size, "env_refs": has_env_refs, "config": config})
+        if json.loads(payload)["config"] == config:
+            tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+            with open(tmp_path, 'w') as file:
+                file.write(payload)
+            os.replace(tmp_path, cache_path)
+    except (OSError, TypeError, ValueError):
+        # Read-only config directory or non-JSON values; the YAML parse stands
+        pass
+    return config, has_env_refs
+
 def _replace_env_vars(obj: Any) -> Any:
-    """Recursively replace environment variables in strings."""
-    if isinstance(obj, str):
-        # Find all ${ENV_VAR} patterns
-        env_vars = re.findall(r'\${([^}]+)}', obj)
-        for env_var in env_vars:
-            env_value = os.environ.get(env_var)
-            if env_value is not None:
-                obj = obj.replace(f"${{{env_var}}}", env_value)
-        return obj
-    elif isinstance(obj, dict):
-        return {k: _replace_env_vars(v) for k, v in obj.items()}
-    elif isinstance(obj, list):
-        return [_replace_env_vars(item) for item in obj]
-    else:
-        return obj
+    """Replace ${ENV_VAR} references in every string of a parsed config.
+
+    Unset variables are left as written. The tree is walked with an explicit
+    stack and containers are updated in place, so deep configs cost no
+    recursion and strings without '$' are never scanned.
+    """
+    if not isinstance(obj, (dict, list)):
+        return _expand_env_string(obj) if isinstance(obj, str) else obj
+    
+    stack = [obj]
+    while stack:
+        container = stack.pop()
+        items = container.items() if isinstance(container, dict) else enumerate(container)
+        for key, value in items:
+            if isinstance(value, str):
+                if '$' in value:
+                    container[key] = _expand_env_string(value)
+            elif isinstance(value, (dict, list)):
+                stack.append(value)
+    return obj
+
+def _expand_env_string(value: str) -> str:
+    """Substitute environment variables in one string in a single pass."""
+    if '$' not in value:
+        return value
+    return _ENV_RE.sub(lambda m: os.environ.get(m.group(1), m.group(0)), value)
 
 def _validate_config(config: Dict[str, Any]) -> None:
     """Validate the configuration structure."""
@@ -1,4 +1,5 @@
 # Logging setup and utilities
+import functools
 import logging
 import json
 from datetime import datetime, timedelta
@@ -6,8 +7,7 @@ from typing import Dict, List, Any, Optional, Union, Tuple
 import os
 import sys
 from collections import defaultdict, OrderedDict
-import pandas as pd
-import numpy as np
+from itertools import repeat
 import pymongo
 from pymongo.errors import PyMongoError
 from bson import ObjectId
@@ -24,7 +24,14 @@ def setup_logger(name: str, log_level: str = 'INFO') -> logging.Logger:
     Returns:
         Configured logger instance
     """
-    level = getattr(logging, log_level.upper())
+    logger = _get_logger(name)
+    # Levels can change between calls, so only their lookup is cached
+    logger.setLevel(_resolve_level(log_level))
+    return logger
+
+@functools.lru_cache(maxsize=None)
+def _get_logger(name: str) -> logging.Logger:
+    """Fetch a logger and attach the stream handler once per name."""
     logger = logging.getLogger(name)
     
     if not logger.handlers:
@@ -35,13 +42,80 @@ def setup_logger(name: str, log_level: str = 'INFO') -> logging.Logger:
         handler.setFormatter(formatter)
         logger.addHandler(handler)
     
-    logger.setLevel(level)
     return logger
 
+@functools.lru_cache(maxsize=None)
+def _resolve_level(log_level: str) -> int:
+    return getattr(logging, log_level.upper())
+
 # Initialize default logger
 logger = setup_logger('arxiv_pipeline')
 
+# ArXiv didn't exist before 1991
+ARXIV_EPOCH = datetime(1990, 1, 1)
+
+# Full weekday names indexed by datetime.weekday()
+WEEKDAYS = ("Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday")
+
+def _parse_iso_timestamp(date_str: str) -> datetime:
+    """
+    Parse exactly YYYY-MM-DDThh:mm:ss, raising ValueError for anything else.
+    
+    fromisoformat is far faster than strptime but also accepts other ISO forms
+    (week dates, fractions, offsets), so the layout is checked first. Callers
+    fall back to _strptime_date for the unpadded forms strptime also accepts.
+    """
+    if (len(date_str) != 19 or date_str[4] != '-' or date_str[7] != '-'
+            or date_str[10] != 'T' or date_str[13] != ':' or date_str[16] != ':'):
+        raise ValueError(f"Invalid timestamp: {date_str}")
+    return datetime.fromisoformat(date_str)
+
+def _strptime_date(date_str: str) -> datetime:
+    """
+    Parse with strptime, which also accepts unpadded fields (2023-1-1T1:1:1Z).
+    
+    Slow path for strings the zero-padded fast parsers reject.
+    """
+    if 'T' in date_str and 'Z' in date_str:
+        return datetime.strptime(date_str, "%Y-%m-%dT%H:%M:%SZ")
+    if 'T' in date_str:
+        return datetime.strptime(date_str, "%Y-%m-%dT%H:%M:%S")
+    if len(date_str) == 10:
+        return datetime.strptime(date_str, "%Y-%m-%d")
+    raise ValueError(f"Invalid date: {date_str}")
+
 # MongoDB Data Validation Functions
+def _all_str(values: List[Any]) -> bool:
+    # map() keeps the loop in C; no generator frame is resumed per element
+    return all(map(isinstance, values, repeat(str)))
+
+def _is_arxiv_timestamp(value: str) -> bool:
+    """Check the YYYY-MM-DDThh:mm:ssZ format."""
+    if value[-1:] != 'Z':
+        return False
+    try:
+        _parse_iso_timestamp(value[:-1])
+    except ValueError:
+        try:
+            _strptime_date(value)
+        except ValueError:
+            return False
+    return True
+
+_TYPE_DESCRIPTIONS = {str: "a string", list: "a list"}
+
+# (field, expected type, optional check of a well-typed value, error when the check fails);
+# every field is required
+_PAPER_FIELD_SPEC = (
+    ('id', str, None, None),
+    ('title', str, None, None),
+    ('authors', list, _all_str, "All authors must be strings"),
+    ('categories', list, _all_str, "All categories must be strings"),
+    ('published', str, _is_arxiv_timestamp,
+     "Field 'published' has invalid date format. Expected YYYY-MM-DDThh:mm:ssZ"),
+    ('pdf_url', str, None, None),
+)
+
 def validate_paper_schema(paper: Dict[str, Any]) -> Tuple[bool, List[str]]:
     """
     Validate a paper document against the expected schema.
@@ -52,48 +126,40 @@ def validate_paper_schema(paper: Dict[str, Any]) -> Tuple[bool, List[str]]:
     Returns:
         Tuple of (is_valid, list_of_errors)
     """
-    required_fields = ['id', 'title', 'authors', 'categories', 'published', 'pdf_url']
-    errors = []
-    
     # Check required fields
-    for field in required_fields:
-        if field not in paper:
-            errors.append(f"Missing required field: {field}")
+    errors = [f"Missing required field: {field}" for field, _, _, _ in _PAPER_FIELD_SPEC if field not in paper]
     
     # Validate field types
-    if 'id' in paper and not isinstance(paper['id'], str):
-        errors.append("Field 'id' must be a string")
-    
-    if 'title' in paper and not isinstance(paper['title'], str):
-        errors.append("Field 'title' must be a string")
-    
-    if 'authors' in paper:
-        if not isinstance(paper['authors'], list):
-            errors.append("Field 'authors' must be a list")
-        elif not all(isinstance(author, str) for author in paper['authors']):
-            errors.append("All authors must be strings")
-    
-    if 'categories' in paper:
-        if not isinstance(paper['categories'], list):
-            errors.append("Field 'categories' must be a list")
-        elif not all(isinstance(cat, str) for cat in paper['categories']):
-            errors.append("All categories must be strings")
-    
-    if 'published' in paper:
-        if not isinstance(paper['published'], str):
-            errors.append("Field 'published' must be a string")
-        else:
-            # Validate date format YYYY-MM-DDThh:mm:ssZ
-            try:
-                datetime.strptime(paper['published'], "%Y-%m-%dT%H:%M:%SZ")
-            except ValueError:
-                errors.append("Field 'published' has invalid date format. Expected YYYY-MM-DDThh:mm:ssZ")
-    
-    if 'pdf_url' in paper and not isinstance(paper['pdf_url'], str):
-        errors.append("Field 'pdf_url' must be a string")
+    for field, expected_type, check, check_error in _PAPER_FIELD_SPEC:
+        if field not in paper:
+            continue
+        value = paper[field]
+        if not isinstance(value, expected_type):
+            errors.append(f"Field '{field}' must be {_TYPE_DESCRIPTIONS[expected_type]}")
+        elif check is not None and not check(value):
+            errors.append(check_error)
     
     return len(errors) == 0, errors
 
+def _parse_date(date_str: str) -> datetime:
+    """Parse YYYY-MM-DD."""
+    if date_str[4] != '-' or date_str[7] != '-':
+        raise ValueError(f"Invalid date: {date_str}")
+    return datetime.fromisoformat(date_str)
+
+def _parse_utc_timestamp(date_str: str) -> datetime:
+    """Parse YYYY-MM-DDThh:mm:ssZ."""
+    if date_str[-1] != 'Z':
+        raise ValueError(f"Invalid timestamp: {date_str}")
+    return _parse_iso_timestamp(date_str[:-1])
+
+# Parser for each accepted publication date format, keyed by string length
+_DATE_PARSERS = {
+    10: _parse_date,            # YYYY-MM-DD
+    19: _parse_iso_timestamp,   # YYYY-MM-DDThh:mm:ss
+    20: _parse_utc_timestamp,   # YYYY-MM-DDThh:mm:ssZ
+}
+
 def validate_publication_date(date_str: str) -> Tuple[bool, Optional[datetime]]:
     """
     Validate a publication date string and convert to datetime object.
@@ -107,25 +173,21 @@ def validate_publication_date(date_str: str) -> Tuple[bool, Optional[datetime]]:
     if not isinstance(date_str, str):
         return False, None
     
+    # Each zero-padded format has a distinct length, so dispatch on it once;
+    # anything else takes the strptime path
+    parse = _DATE_PARSERS.get(len(date_str), _strptime_date)
+    
     try:
-        # Handle different date string formats
-        if 'T' in date_str and 'Z' in date_str:
-            # Standard ISO format: YYYY-MM-DDThh:mm:ssZ
-            dt = datetime.strptime(date_str, "%Y-%m-%dT%H:%M:%SZ")
-        elif 'T' in date_str:
-            # ISO without Z: YYYY-MM-DDThh:mm:ss
-            dt = datetime.strptime(date_str, "%Y-%m-%dT%H:%M:%S")
-        elif len(date_str) == 10:
-            # Just date: YYYY-MM-DD
-            dt = datetime.strptime(date_str, "%Y-%m-%d")
-        else:
-            return False, None
+        try:
+            dt = parse(date_str)
+        except ValueError:
+            dt = _strptime_date(date_str)
         
         # Validate date range (papers shouldn't be from future or too distant past)
         now = datetime.utcnow()
         if dt > now:
             return False, None
-        if dt < datetime(1990, 1, 1):  # ArXiv didn't exist before 1991
+        if dt < ARXIV_EPOCH:
             return False, None
             
         return True, dt
@@ -133,6 +195,35 @@ def validate_publication_date(date_str: str) -> Tuple[bool, Optional[datetime]]:
         return False, None
 
 # Data Analysis Utilities
+# Length of the date string prefix each grouping keys on
+_DATE_PREFIX_LENGTHS = {'day': 10, 'month': 7, 'year': 4}
+
+def _date_count_pipeline(date_field: str, group_by: str) -> List[Dict[str, Any]]:
+    """
+    Build the aggregation for count_papers_by_date.
+    
+    A fresh list on every call: the stages are plain dicts, so a cached copy
+    shared between callers could be mutated under them.
+    """
+    if group_by == 'weekday':
+        # Parse and group server-side so only seven rows come back
+        return [
+            {"$match": {date_field: {"$type": "string"}}},
+            {"$project": {"_d": {"$dateFromString": {
+                "dateString": {"$substrCP": [f"${date_field}", 0, 10]},
+                "format": "%Y-%m-%d",
+                "onError": None
+            }}}},
+            {"$match": {"_d": {"$ne": None}}},
+            {"$group": {"_id": {"$dayOfWeek": "$_d"}, "count": {"$sum": 1}}}
+        ]
+    
+    # Extract date components based on string format
+    return [
+        {"$group": {"_id": {"$substr": [f"${date_field}", 0, _DATE_PREFIX_LENGTHS[group_by]]}, "count": {"$sum": 1}}},
+        {"$sort": {"_id": 1}}
+    ]
+
 def count_papers_by_date(mongo_collection, date_field="published", group_by="day"):
     """
     Count papers by publication date with flexible grouping.
@@ -150,51 +241,20 @@ def count_papers_by_date(mongo_collection, date_field="published", group_by="day
     if group_by not in valid_groups:
         raise ValueError(f"group_by must be one of {valid_groups}")
     
-    pipeline = []
-    
-    # Extract date components based on string format
-    if group_by == 'day':
-        pipeline.extend([
-            {"$addFields": {"dateStr": {"$substr": [f"${date_field}", 0, 10]}}},
-            {"$group": {"_id": "$dateStr", "count": {"$sum": 1}}}
-        ])
-    elif group_by == 'month':
-        pipeline.extend([
-            {"$addFields": {"yearMonth": {"$substr": [f"${date_field}", 0, 7]}}},
-            {"$group": {"_id": "$yearMonth", "count": {"$sum": 1}}}
-        ])
-    elif group_by == 'year':
-        pipeline.extend([
-            {"$addFields": {"year": {"$substr": [f"${date_field}", 0, 4]}}},
-            {"$group": {"_id": "$year", "count": {"$sum": 1}}}
-        ])
-    elif group_by == 'weekday':
-        # This requires date conversion in Python
-        results = list(mongo_collection.find({}, {date_field: 1}))
+    if group_by == 'weekday':
         weekday_counts = defaultdict(int)
-        
-        for doc in results:
-            date_str = doc.get(date_field)
-            if date_str and isinstance(date_str, str):
-                try:
-                    dt = datetime.strptime(date_str[:10], "%Y-%m-%d")
-                    weekday = dt.strftime("%A")  # Full weekday name
-                    weekday_counts[weekday] += 1
-                except ValueError:
-                    continue
+        for doc in mongo_collection.aggregate(_date_count_pipeline(date_field, group_by)):
+            # $dayOfWeek runs 1 (Sunday) to 7 (Saturday); WEEKDAYS starts on Monday
+            weekday_counts[WEEKDAYS[(doc["_id"] + 5) % 7]] += doc["count"]
         
         # Order by day of week
-        weekday_order = ["Monday", "Tuesday", "Wednesday", "Thursday", 
-                        "Friday", "Saturday", "Sunday"]
         ordered_counts = OrderedDict()
-        for day in weekday_order:
+        for day in WEEKDAYS:
             ordered_counts[day] = weekday_counts.get(day, 0)
         
         return ordered_counts
     
-    # Execute aggregation for non-weekday queries
-    pipeline.append({"$sort": {"_id": 1}})
-    result = mongo_collection.aggregate(pipeline)
+    result = mongo_collection.aggregate(_date_count_pipeline(date_field, group_by))
     
     # Convert to ordered dictionary
     counts = OrderedDict()
@@ -220,7 +280,9 @@ def analyze_mongodb_collection(mongo_collection, query=None, projection=None):
     
     analysis = {
         "collection_name": mongo_collection.name,
-        "document_count": mongo_collection.count_documents(query),
+        # Unfiltered counts come from collection metadata instead of a scan
+        "document_count": mongo_collection.estimated_document_count() if not query
+        else mongo_collection.count_documents(query),
         "fields": defaultdict(set),
         "field_types": defaultdict(set),
         "field_stats": {},
@@ -231,51 +293,46 @@ def analyze_mongodb_collection(mongo_collection, query=None, projection=None):
     if sample_size == 0:
         return analysis
     
-    cursor = mongo_collection.find(query, projection).limit(sample_size)
+    # Random sample rather than the first documents in natural order,
+    # fetched in a single batch
+    pipeline = [{"$match": query}, {"$sample": {"size": sample_size}}]
+    if projection:
+        pipeline.append({"$project": projection})
+    cursor = mongo_collection.aggregate(pipeline, batchSize=sample_size)
     
-    # Process each document
-    for doc in cursor:
-        for field, value in doc.items():
-            # Record field name
-            analysis["fields"][field].add(True)
-            
-            # Record value type
-            value_type = type(value).__name__
-            analysis["field_types"][field].add(value_type)
-            
-            # Special handling for specific field types
-            if field not in analysis["field_stats"]:
-                analysis["field_stats"][field] = {
-                    "count": 0,
-                    "missing": 0,
-                    "unique_values": set(),
-                }
-            
-            analysis["field_stats"][field]["count"] += 1
-            
-            # Track unique values for categorical fields (with reasonable cardinality)
-            if isinstance(value, (str, int, bool)) and len(str(value)) < 100:
-                analysis["field_stats"][field]["unique_values"].add(value)
-    
-    # Calculate missing values
-    for field in analysis["fields"]:
-        analysis["field_stats"][field]["missing"] = sample_size - analysis["field_stats"][field]["count"]
-        analysis["field_stats"][field]["unique_count"] = len(analysis["field_stats"][field]["unique_values"])
+    docs = list(cursor)
+    
+    # Work column by column: one pass finds the fields, then each field's values
+    # are gathered once instead of updating nested stats per document item
+    fields = dict.fromkeys(field for doc in docs for field in doc)
+    for field in fields:
+        values = [doc[field] for doc in docs if field in doc]
         
-        # Convert sets to lists for JSON serialization
-        if len(analysis["field_stats"][field]["unique_values"]) <= 20:
-            analysis["field_stats"][field]["unique_values"] = list(analysis["field_stats"][field]["unique_values"])
-        else:
+        # Track unique values for categorical fields (with reasonable cardinality)
+        unique_values = {
+            value for value in values
+            if isinstance(value, (str, int, bool)) and len(str(value)) < 100
+        }
+        unique_count = len(unique_values)
+        
+        analysis["field_types"][field] = list({type(value).__name__ for value in values})
+        analysis["field_stats"][field] = {
+            "count": len(values),
+            "missing": sample_size - len(values),
             # Too many values to display, just show count
-            analysis["field_stats"][field]["unique_values"] = f"[{analysis['field_stats'][field]['unique_count']} unique values]"
+            "unique_values": list(unique_values) if unique_count <= 20 else f"[{unique_count} unique values]",
+            "unique_count": unique_count,
+        }
     
-    # Convert sets to lists for JSON serialization
-    analysis["fields"] = {k: True for k in analysis["fields"].keys()}
-    analysis["field_types"] = {k: list(v) for k, v in analysis["field_types"].items()}
+    analysis["fields"] = {field: True for field in fields}
+    analysis["field_types"] = dict(analysis["field_types"])
     
     return analysis
 
 # Data Reporting Utilities
+# First-column label and width by date key length (year, year-month, full date)
+_REPORT_HEADERS = {4: ('Year', 6), 7: ('Year-Month', 10), 10: ('Date', 10)}
+
 def generate_date_distribution_report(date_counts, title="Date Distribution Report"):
     """
     Generate a formatted report of date-based paper distribution.
@@ -290,8 +347,13 @@ def generate_date_distribution_report(date_counts, title="Date Distribution Repo
     if not date_counts:
         return "No data available for reporting."
     
-    total = sum(date_counts.values())
-    max_count = max(date_counts.values()) if date_counts else 0
+    # Total and maximum in a single pass over the counts
+    total = 0
+    max_count = 0
+    for count in date_counts.values():
+        total += count
+        if count > max_count:
+            max_count = count
     scale_factor = 40 / max_count if max_count > 0 else 0
     
     # Generate the report
@@ -300,29 +362,17 @@ def generate_date_distribution_report(date_counts, title="Date Distribution Repo
     lines.append("-" * 60)
     
     # Determine header based on the first key format
-    if date_counts:
-        first_key = next(iter(date_counts.keys()))
-        if len(first_key) == 4:  # Year
-            lines.append(f"{'Year':<6} | {'Count':>8} | {'Percentage':>11} | {'Distribution':<40}")
-        elif len(first_key) == 7:  # Year-Month
-            lines.append(f"{'Year-Month':<10} | {'Count':>8} | {'Percentage':>11} | {'Distribution':<40}")
-        elif len(first_key) == 10:  # Full date
-            lines.append(f"{'Date':<10} | {'Count':>8} | {'Percentage':>11} | {'Distribution':<40}")
-        else:  # Weekday or other
-            lines.append(f"{'Period':<10} | {'Count':>8} | {'Percentage':>11} | {'Distribution':<40}")
+    first_key = next(iter(date_counts))
+    header_label, header_width = _REPORT_HEADERS.get(len(first_key), ('Period', 10))
+    lines.append(f"{header_label:<{header_width}} | {'Count':>8} | {'Percentage':>11} | {'Distribution':<40}")
     
     lines.append("-" * 60)
     
-    # Add data rows
+    # Add data rows; years use a narrower first column
     for date, count in date_counts.items():
         percentage = (count / total) * 100 if total > 0 else 0
-        bar_length = int(count * scale_factor)
-        bar = "█" * bar_length
-        
-        if len(date) == 4:  # Year
-            lines.append(f"{date:<6} | {count:>8,d} | {percentage:>10.2f}% | {bar}")
-        else:  # Other formats
-            lines.append(f"{date:<10} | {count:>8,d} | {percentage:>10.2f}% | {bar}")
+        width = 6 if len(date) == 4 else 10
+        lines.append(f"{date:<{width}} | {count:>8,d} | {percentage:>10.2f}% | {'█' * int(count * scale_factor)}")
     
     lines.append("-" * 60)
     lines.append(f"Total: {total:,d} papers")
@@ -342,7 +392,8 @@ def validate_mongodb_data(mongo_collection, validation_func, sample_size=100):
     Returns:
         Dictionary with validation results
     """
-    total_count = mongo_collection.count_documents({})
+    # Whole-collection count from metadata rather than a scan
+    total_count = mongo_collection.estimated_document_count()
     if total_count == 0:
         return {
             "total_documents": 0,
@@ -356,11 +407,12 @@ def validate_mongodb_data(mongo_collection, validation_func, sample_size=100):
     # Adjust sample size if collection has fewer documents
     sample_size = min(sample_size, total_count)
     
-    # Get random sample of documents
+    # Get random sample of documents, streamed in one batch instead of
+    # 101-document round trips and never held in memory all at once
     pipeline = [
         {"$sample": {"size": sample_size}}
     ]
-    documents = list(mongo_collection.aggregate(pipeline))
+    documents = mongo_collection.aggregate(pipeline, batchSize=sample_size, allowDiskUse=True)
     
     valid_count = 0
     invalid_count = 0
@@ -396,6 +448,18 @@ def validate_mongodb_data(mongo_collection, validation_func, sample_size=100):
     }
 
 # Data Integrity Checking
+def _month_index(month: str) -> Optional[int]:
+    """Map a YYYY-MM key to year * 12 + month - 1, or None if it is not one."""
+    if len(month) != 7 or month[4] != '-':
+        return None
+    try:
+        year, month_number = int(month[:4]), int(month[5:])
+    except ValueError:
+        return None
+    if not 1 <= month_number <= 12:
+        return None
+    return year * 12 + month_number - 1
+
 def check_data_integrity(mongo_collection, date_range=None):
     """
     Check data integrity with focus on temporal consistency.
@@ -407,11 +471,6 @@ def check_data_integrity(mongo_collection, date_range=None):
     Returns:
         Dictionary with integrity check results
     """
-    results = {
-        "total_documents": mongo_collection.count_documents({}),
-        "integrity_checks": {}
-    }
-    
     # Query filter
     query = {}
     if date_range:
@@ -421,63 +480,63 @@ def check_data_integrity(mongo_collection, date_range=None):
             "$lte": end_date
         }
     
-    # Check for duplicate IDs
-    pipeline = [
-        {"$match": query},
-        {"$group": {"_id": "$id", "count": {"$sum": 1}}},
-        {"$match": {"count": {"$gt": 1}}},
-        {"$count": "duplicate_count"}
-    ]
-    duplicate_result = list(mongo_collection.aggregate(pipeline))
-    results["integrity_checks"]["duplicate_ids"] = duplicate_result[0]["duplicate_count"] if duplicate_result else 0
-    
-    # Check for missing required fields
+    # Future dates are checked across the whole collection, not just the range.
+    # The bound has the same layout as stored dates, so $gt compares strings
+    # and an index on published stays usable
+    future_date = datetime.utcnow().isoformat(timespec='seconds') + "Z"
     required_fields = ["id", "title", "published", "authors", "categories"]
+    
+    # Every check runs as one $facet branch so the collection is scanned once
+    facets = {
+        "total_documents": [{"$count": "n"}],
+        "duplicate_ids": [
+            {"$match": query},
+            {"$group": {"_id": "$id", "count": {"$sum": 1}}},
+            {"$match": {"count": {"$gt": 1}}},
+            {"$count": "n"}
+        ],
+        "future_dates": [
+            {"$match": {"published": {"$gt": future_date}}},
+            {"$count": "n"}
+        ],
+    }
     for field in required_fields:
-        field_query = query.copy()
-        field_query[field] = {"$exists": False}
-        results["integrity_checks"][f"missing_{field}"] = mongo_collection.count_documents(field_query)
+        facets[f"missing_{field}"] = [
+            {"$match": {**query, field: {"$exists": False}}},
+            {"$count": "n"}
+        ]
+    
+    facet_result = next(mongo_collection.aggregate([{"$facet": facets}], allowDiskUse=True), {})
+    counts = {name: rows[0]["n"] if rows else 0 for name, rows in facet_result.items()}
     
-    # Check for temporal anomalies (future dates)
-    future_date = datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%SZ")
-    future_query = query.copy()
-    future_query["published"] = {"$gt": future_date}
-    results["integrity_checks"]["future_dates"] = mongo_collection.count_documents(future_query)
+    results = {
+        "total_documents": counts.get("total_documents", 0),
+        "integrity_checks": {
+            "duplicate_ids": counts.get("duplicate_ids", 0),
+            **{f"missing_{field}": counts.get(f"missing_{field}", 0) for field in required_fields},
+            "future_dates": counts.get("future_dates", 0),
+        }
+    }
     
     # Data completeness by time period
     if date_range:
         # Check for time gaps in the data
         monthly_counts = count_papers_by_date(mongo_collection, "published", "month")
         
-        # Convert month strings to datetime for gap analysis
-        months = [(datetime.strptime(m, "%Y-%m"), count) for m, count in monthly_counts.items()]
-        months.sort(key=lambda x: x[0])
+        # Months as integer indexes (year * 12 + month - 1), so stepping is
+        # plain arithmetic instead of datetime replace/strftime per month
+        month_indexes = sorted(
+            index for index in map(_month_index, monthly_counts) if index is not None
+        )
         
         # Find gaps (months with zero papers)
         gaps = []
-        for i in range(len(months) - 1):
-            current_month = months[i][0]
-            next_month = months[i + 1][0]
-            
-            # Calculate expected next month
-            expected_next = current_month.replace(day=1)
-            if current_month.month == 12:
-                expected_next = expected_next.replace(year=current_month.year + 1, month=1)
-            else:
-                expected_next = expected_next.replace(month=current_month.month + 1)
-            
-            # Check if there's a gap
-            if expected_next < next_month:
-                gap_months = []
-                gap_date = expected_next
-                while gap_date < next_month:
-                    gap_months.append(gap_date.strftime("%Y-%m"))
-                    if gap_date.month == 12:
-                        gap_date = gap_date.replace(year=gap_date.year + 1, month=1)
-                    else:
-                        gap_date = gap_date.replace(month=gap_date.month + 1)
-                
-                gaps.append(gap_months)
+        for current_index, next_index in zip(month_indexes, month_indexes[1:]):
+            if next_index - current_index > 1:
+                gaps.append([
+                    f"{index // 12:04d}-{index % 12 + 1:02d}"
+                    for index in range(current_index + 1, next_index)
+                ])
         
         results["integrity_checks"]["time_gaps"] = gaps
     
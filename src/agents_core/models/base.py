@@ -1 +1,44 @@
-# Abstract base class
\ No newline at end of file
+# Abstract base class
+# agent_core/models/base.py
+import asyncio
+from abc import ABC, abstractmethod
+from typing import Dict, Any, List, Optional, Union
+
+class ModelInterface(ABC):
+    """Interface every model provider implements."""
+
+    @abstractmethod
+    async def initialize(self, config: Dict[str, Any]) -> None:
+        """Initialize the provider with its configuration."""
+        pass
+
+    @abstractmethod
+    async def generate(self,
+                      prompt: str,
+                      system_prompt: Optional[str] = None,
+                      parameters: Optional[Dict[str, Any]] = None) -> str:
+        """Generate text from the given prompt."""
+        pass
+
+    async def generate_batch(self,
+                             prompts: List[str],
+                             system_prompt: Optional[str] = None,
+                             parameters: Optional[Dict[str, Any]] = None,
+                             max_concurrency: int = 10) -> List[Union[str, BaseException]]:
+        """Generate text for many prompts sharing one system prompt.
+
+        Results are in prompt order; a failed prompt yields its exception
+        instead of failing the batch. Providers with a native batch endpoint
+        should override this; the default overlaps individual generate calls.
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def generate_one(prompt: str) -> str:
+            async with semaphore:
+                return await self.generate(prompt=prompt, system_prompt=system_prompt, parameters=parameters)
+
+        return await asyncio.gather(*(generate_one(prompt) for prompt in prompts), return_exceptions=True)
+
+    async def shutdown(self) -> None:
+        """Clean up resources."""
+        pass
@@ -1,7 +1,8 @@
 # Ollama integration# agent_core/models/ollama.py
 import aiohttp
+import asyncio
 import json
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Union
 import logging
 
 from agent_core.models.base import ModelInterface
@@ -13,7 +14,19 @@ class OllamaModelInterface(ModelInterface):
     def __init__(self):
         self.base_url = resolve_ollama_url()
         self.available_models = []
+        # Per-model parameters from config, keyed by model name
+        self._model_params: Dict[str, Dict[str, Any]] = {}
         self.logger = logging.getLogger("models.ollama")
+        # One pooled session for every request; keep-alive connections are reused
+        self._session: Optional[aiohttp.ClientSession] = None
+    
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Return the shared session, creating it on first use."""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=32, keepalive_timeout=60)
+            )
+        return self._session
     
     async def initialize(self, config: Dict[str, Any]) -> None:
         """Initialize the Ollama interface with the given configuration."""
@@ -22,17 +35,21 @@ class OllamaModelInterface(ModelInterface):
         
         # Store available models configuration
         self.available_models = config.get("models", [])
+        # First entry wins for duplicate names, matching the old linear scan
+        self._model_params = {}
+        for model_config in self.available_models:
+            self._model_params.setdefault(model_config.get("name"), model_config.get("parameters", {}))
         
         # Test connection
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(f"{self.base_url}/api/tags") as response:
-                    if response.status == 200:
-                        models_data = await response.json()
-                        installed_models = [model["name"] for model in models_data.get("models", [])]
-                        self.logger.info(f"Connected to Ollama. Available models: {installed_models}")
-                    else:
-                        self.logger.warning(f"Connected to Ollama but got status code: {response.status}")
+            session = await self._get_session()
+            async with session.get(f"{self.base_url}/api/tags") as response:
+                if response.status == 200:
+                    models_data = await response.json()
+                    installed_models = [model["name"] for model in models_data.get("models", [])]
+                    self.logger.info(f"Connected to Ollama. Available models: {installed_models}")
+                else:
+                    self.logger.warning(f"Connected to Ollama but got status code: {response.status}")
         except Exception as e:
             self.logger.error(f"Failed to connect to Ollama at {self.base_url}: {str(e)}")
             # Continue anyway - the model might not be running yet but could start later
@@ -41,7 +58,39 @@ class OllamaModelInterface(ModelInterface):
                       prompt: str, 
                       system_prompt: Optional[str] = None,
                       parameters: Optional[Dict[str, Any]] = None) -> str:
-        """Generate text from the given prompt using an Ollama model."""
+        """Generate text from the given prompt using an Ollama model.
+        
+        Raises RuntimeError for an error response and lets transport errors
+        propagate, so callers can retry instead of using error text as output.
+        """
+        return await self._generate(await self._get_session(), prompt, system_prompt, parameters)
+    
+    async def generate_batch(self,
+                             prompts: List[str],
+                             system_prompt: Optional[str] = None,
+                             parameters: Optional[Dict[str, Any]] = None,
+                             max_concurrency: int = 10) -> List[Union[str, BaseException]]:
+        """Generate text for many prompts over the shared connection pool.
+        
+        Ollama has no multi-prompt endpoint; concurrent requests are batched
+        server-side up to OLLAMA_NUM_PARALLEL, so keep max_concurrency near it.
+        A failed prompt yields its exception in place of the text.
+        """
+        session = await self._get_session()
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        async def generate_one(prompt: str) -> str:
+            async with semaphore:
+                return await self._generate(session, prompt, system_prompt, parameters)
+        
+        return await asyncio.gather(*(generate_one(prompt) for prompt in prompts), return_exceptions=True)
+    
+    async def _generate(self,
+                        session: aiohttp.ClientSession,
+                        prompt: str,
+                        system_prompt: Optional[str],
+                        parameters: Optional[Dict[str, Any]]) -> str:
+        """Send one generate request on the given session."""
         # Use default parameters from config or empty dict
         params = {
             "temperature": 0.7,
@@ -58,11 +107,9 @@ class OllamaModelInterface(ModelInterface):
                 model_name = resolve_ollama_model()
         
         # Update with model-specific parameters from config
-        for model_config in self.available_models:
-            if model_config.get("name") == model_name:
-                model_params = model_config.get("parameters", {})
-                params.update(model_params)
-                break
+        model_params = self._model_params.get(model_name)
+        if model_params:
+            params.update(model_params)
         
         # Override with request-specific parameters
         if parameters:
@@ -82,20 +129,20 @@ class OllamaModelInterface(ModelInterface):
         
         try:
             self.logger.info(f"Generating text with Ollama model {model_name}")
-            async with aiohttp.ClientSession() as session:
-                async with session.post(f"{self.base_url}/api/generate", json=payload) as response:
-                    if response.status != 200:
-                        error_text = await response.text()
-                        self.logger.error(f"Ollama API error: {response.status} - {error_text}")
-                        return f"Error generating text: {response.status}"
-                    
-                    response_data = await response.json()
-                    return response_data.get("response", "")
+            async with session.post(f"{self.base_url}/api/generate", json=payload) as response:
+                if response.status != 200:
+                    error_text = await response.text()
+                    raise RuntimeError(f"Ollama API error: {response.status} - {error_text}")
+                
+                response_data = await response.json()
+                return response_data.get("response", "")
         except Exception as e:
             self.logger.error(f"Failed to generate text with Ollama: {str(e)}")
-            return f"Error: {str(e)}"
+            raise
     
     async def shutdown(self) -> None:
         """Clean up resources."""
-        # Nothing to clean up for Ollama
         self.logger.info("Shutting down Ollama interface")
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
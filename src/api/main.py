@@ -1,14 +1,33 @@
 import os
+from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from src.api.models import ResearchCapabilities, research_capabilities
-from src.api.routes.mongodb import router as mongodb_router
+from src.api.routes.feedback import router as feedback_router
+from src.api.routes.mongodb import close_mongo_client, router as mongodb_router
+from src.api.routes.neo4j import close_neo4j_driver, router as neo4j_router
+from src.api.routes.papers import router as papers_router
+from src.api.routes.qdrant import close_qdrant_clients, router as qdrant_router
+from src.api.routes.research import router as research_router
+from src.storage.mongo import close_mongo_clients
 
 SERVICE_VERSION = "0.9.0"
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    yield
+    close_mongo_client()
+    # /paper-analysis goes through MongoStorage's shared client pool
+    close_mongo_clients()
+    await close_neo4j_driver()
+    await close_qdrant_clients()
+
+
 app = FastAPI(
+    lifespan=lifespan,
     title="ArXiv Research Intelligence API",
     version=SERVICE_VERSION,
     description=(
@@ -50,36 +69,15 @@ def service_health() -> dict[str, str]:
     }
 
 
-app.include_router(mongodb_router, prefix="/metrics/mongodb", tags=["mongodb"])
-
-from src.api.routes.qdrant import router as qdrant_router
-
-app.include_router(qdrant_router, prefix="/metrics/qdrant", tags=["qdrant"])
-
-from src.api.routes.neo4j import router as neo4j_router
-
-app.include_router(neo4j_router, prefix="/neo4j", tags=["neo4j"])
-
-from src.api.routes.papers import router as papers_router
-
-app.include_router(
-    papers_router,
-    prefix="/research/papers",
-    tags=["research"],
-)
-
-from src.api.routes.research import router as research_router
-
-app.include_router(
-    research_router,
-    prefix="/research",
-    tags=["research"],
+# Registered once each, in this order, so the OpenAPI schema is stable
+ROUTERS = (
+    (mongodb_router, "/metrics/mongodb", "mongodb"),
+    (qdrant_router, "/metrics/qdrant", "qdrant"),
+    (neo4j_router, "/neo4j", "neo4j"),
+    (papers_router, "/research/papers", "research"),
+    (research_router, "/research", "research"),
+    (feedback_router, "/research", "feedback"),
 )
 
-from src.api.routes.feedback import router as feedback_router
-
-app.include_router(
-    feedback_router,
-    prefix="/research",
-    tags=["feedback"],
-)
+for router, prefix, tag in ROUTERS:
+    app.include_router(router, prefix=prefix, tags=[tag])
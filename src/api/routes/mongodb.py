@@ -1,9 +1,11 @@
 from fastapi import APIRouter, Query
-from pymongo import MongoClient
+from motor.motor_asyncio import AsyncIOMotorClient
 from pymongo.errors import ConnectionFailure
+import asyncio
 import os
 import sys
 import logging
+import time
 from collections import OrderedDict
 from typing import Dict, Any, Optional
 
@@ -16,67 +18,93 @@ from src.utils.analyze_papers_by_year_month_day import analyze_papers_by_year_mo
 
 router = APIRouter()
 
+# One pooled async client for the metrics endpoints, created on first use and
+# closed on application shutdown, so requests skip the connect/auth/discovery
+# handshake and never block the event loop
+MAX_POOL_SIZE = int(os.getenv("MONGO_API_MAX_POOL_SIZE", "50"))
+# Connections kept warm so the first requests after idle skip the handshake
+MIN_POOL_SIZE = int(os.getenv("MONGO_API_MIN_POOL_SIZE", "5"))
+_client: Optional[AsyncIOMotorClient] = None
+
+# Only called on the event loop, which serializes creation without a lock
+def get_mongo_client() -> AsyncIOMotorClient:
+    global _client
+    if _client is None:
+        mongo_uri = os.getenv("MONGO_CONNECTION_STRING") or "mongodb://localhost:27017/"
+        # Log the connection string (without credentials)
+        safe_uri = mongo_uri.replace("://", "://***:***@") if "@" in mongo_uri else mongo_uri
+        logging.info(f"Connecting to MongoDB using: {safe_uri}")
+        _client = AsyncIOMotorClient(mongo_uri, serverSelectionTimeoutMS=2000,
+                                     maxPoolSize=MAX_POOL_SIZE, minPoolSize=MIN_POOL_SIZE)
+    return _client
+
+def close_mongo_client() -> None:
+    global _client
+    if _client is not None:
+        _client.close()
+        _client = None
+
+# Dashboards poll /paper-stats; the distinct-count scan is reused for this long
+PAPER_STATS_TTL_SECONDS = float(os.getenv("PAPER_STATS_TTL_SECONDS", "60"))
+_paper_stats_cache: Optional[tuple] = None  # (computed_at, stats)
+
+def _distinct_strings_pipeline(field: str) -> list:
+    """Count distinct string elements of an array field across the collection."""
+    return [
+        {"$match": {field: {"$type": "array"}}},
+        {"$unwind": f"${field}"},
+        {"$match": {field: {"$type": "string"}}},
+        {"$group": {"_id": f"${field}"}},
+        {"$count": "n"}
+    ]
+
+def _facet_count(result: Dict[str, Any], name: str) -> int:
+    rows = result.get(name) or []
+    return rows[0]["n"] if rows else 0
+
 @router.get("/paper-stats")
-def mongodb_paper_stats():
-    # Try different connection strings in order of preference
-    mongo_uri = os.getenv("MONGO_CONNECTION_STRING", None)
-    if not mongo_uri:
-        # For local development
-        if os.path.exists('/etc/hosts'):  # Check if we're in a Unix-like system
-            mongo_uri = "mongodb://localhost:27017/"
-        else:  # Windows or other
-            mongo_uri = "mongodb://localhost:27017/"
-    
-    # Log the connection string (without credentials)
-    safe_uri = mongo_uri.replace("://", "://***:***@") if "@" in mongo_uri else mongo_uri
-    logging.info(f"Connecting to MongoDB using: {safe_uri}")
+async def mongodb_paper_stats():
+    global _paper_stats_cache
+    cached = _paper_stats_cache
+    if cached is not None and time.monotonic() - cached[0] < PAPER_STATS_TTL_SECONDS:
+        return dict(cached[1])
     try:
-        client = MongoClient(mongo_uri, serverSelectionTimeoutMS=2000)
+        client = get_mongo_client()
         db = client["arxiv_papers"]
         papers_collection = db["papers"]
-        papers_count = papers_collection.count_documents({})
-        # Aggregate unique authors
-        author_set = set()
-        category_set = set()
-        for doc in papers_collection.find({}, {"authors": 1, "categories": 1}):
-            if "authors" in doc and isinstance(doc["authors"], list):
-                author_set.update([a for a in doc["authors"] if isinstance(a, str)])
-            if "categories" in doc and isinstance(doc["categories"], list):
-                category_set.update([c for c in doc["categories"] if isinstance(c, str)])
-        authors_count = len(author_set)
-        categories_count = len(category_set)
-        return {"papers": papers_count, "authors": authors_count, "categories": categories_count}
+        # Both queries are issued together so their round trips overlap: the
+        # unfiltered count comes from collection metadata instead of a scan, and
+        # unique authors and categories are counted server-side in one pass
+        # (grouping instead of distinct() avoids the 16MB result limit)
+        papers_count, facet_rows = await asyncio.gather(
+            papers_collection.estimated_document_count(),
+            papers_collection.aggregate(
+                [{"$facet": {field: _distinct_strings_pipeline(field) for field in ("authors", "categories")}}],
+                allowDiskUse=True
+            ).to_list(length=1)
+        )
+        distinct_counts = facet_rows[0] if facet_rows else {}
+        authors_count = _facet_count(distinct_counts, "authors")
+        categories_count = _facet_count(distinct_counts, "categories")
+        stats = {"papers": papers_count, "authors": authors_count, "categories": categories_count}
+        # Only successful results are cached, so errors are retried on the next poll
+        _paper_stats_cache = (time.monotonic(), stats)
+        return dict(stats)
     except Exception as e:
         logger.error(f"MongoDB stats error: {str(e)}")
         # Return fallback values for UI compatibility
         return {"papers": 0, "authors": 0, "categories": 0, "error": str(e)}
-    finally:
-        client.close()
 
 @router.get("/test-connection")
-def test_mongodb_connection():
-    # Try different connection strings in order of preference
-    mongo_uri = os.getenv("MONGO_CONNECTION_STRING", None)
-    if not mongo_uri:
-        # For local development
-        if os.path.exists('/etc/hosts'):  # Check if we're in a Unix-like system
-            mongo_uri = "mongodb://localhost:27017/"
-        else:  # Windows or other
-            mongo_uri = "mongodb://localhost:27017/"
-    
-    # Log the connection string (without credentials)
-    safe_uri = mongo_uri.replace("://", "://***:***@") if "@" in mongo_uri else mongo_uri
-    logging.info(f"Connecting to MongoDB using: {safe_uri}")
+async def test_mongodb_connection():
     try:
-        client = MongoClient(mongo_uri, serverSelectionTimeoutMS=2000)
+        client = get_mongo_client()
         # The ismaster command is cheap and does not require auth.
-        client.admin.command('ping')
-        dbs = client.list_database_names()
+        await client.admin.command('ping')
+        dbs = await client.list_database_names()
         return {"status": "success", "message": "Connected to MongoDB", "databases": dbs}
     except ConnectionFailure as e:
         return {"status": "error", "message": str(e)}
-    finally:
-        client.close()
 
 
 @router.get("/paper-analysis")
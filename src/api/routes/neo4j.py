@@ -1,8 +1,9 @@
 from fastapi import APIRouter, Query, Body, HTTPException
-from neo4j import GraphDatabase
+from neo4j import AsyncDriver, AsyncGraphDatabase
 from neo4j.exceptions import ServiceUnavailable
 import os
 import logging
+import time
 from typing import Dict, Any, Optional, List
 
 # Configure logging
@@ -16,26 +17,40 @@ router = APIRouter()
 NEO4J_URI = os.getenv("NEO4J_URI", "bolt://neo4j:7687")
 NEO4J_USER = os.getenv("NEO4J_USER", "neo4j")
 NEO4J_PASSWORD = os.getenv("NEO4J_PASSWORD", "password")
+NEO4J_MAX_POOL_SIZE = int(os.getenv("NEO4J_API_MAX_POOL_SIZE", "50"))
 
 # Log connection parameters (without password)
 logging.info(f"Neo4j connection configured with URI: {NEO4J_URI}")
 logging.info(f"Neo4j user: {NEO4J_USER}")
 
-def get_driver():
-    """Get a Neo4j driver instance with proper error handling"""
-    try:
-        driver = GraphDatabase.driver(
-            NEO4J_URI, 
-            auth=(NEO4J_USER, NEO4J_PASSWORD),
-            encrypted=False
-        )
-        return driver
-    except Exception as e:
-        logger.error(f"Failed to create Neo4j driver: {str(e)}")
-        return None
+# One pooled async driver shared by all requests, created on first use and
+# closed on application shutdown; only touched from the event loop
+_driver: Optional[AsyncDriver] = None
+
+def get_driver() -> Optional[AsyncDriver]:
+    """Get the shared Neo4j driver instance with proper error handling"""
+    global _driver
+    if _driver is None:
+        try:
+            _driver = AsyncGraphDatabase.driver(
+                NEO4J_URI, 
+                auth=(NEO4J_USER, NEO4J_PASSWORD),
+                encrypted=False,
+                max_connection_pool_size=NEO4J_MAX_POOL_SIZE
+            )
+        except Exception as e:
+            logger.error(f"Failed to create Neo4j driver: {str(e)}")
+            return None
+    return _driver
+
+async def close_neo4j_driver() -> None:
+    global _driver
+    if _driver is not None:
+        await _driver.close()
+        _driver = None
 
 @router.get("/test-connection")
-def test_neo4j_connection():
+async def test_neo4j_connection():
     """Test connection to Neo4j database"""
     try:
         driver = get_driver()
@@ -43,16 +58,16 @@ def test_neo4j_connection():
             return {"status": "error", "message": "Failed to create Neo4j driver"}
         
         # Test connection with a simple query
-        with driver.session() as session:
-            result = session.run("CALL db.info()")
-            record = result.single()
+        async with driver.session() as session:
+            result = await session.run("CALL db.info()")
+            record = await result.single()
             if record:
                 databases = ["neo4j"]  # Default database
                 
                 # Try to get list of databases (Neo4j 4.0+)
                 try:
-                    db_result = session.run("SHOW DATABASES")
-                    databases = [record["name"] for record in db_result]
+                    db_result = await session.run("SHOW DATABASES")
+                    databases = [record["name"] async for record in db_result]
                 except:
                     # Older Neo4j or no permission, use default
                     pass
@@ -64,42 +79,51 @@ def test_neo4j_connection():
         return {"status": "error", "message": f"Neo4j is unavailable: {str(e)}"}
     except Exception as e:
         return {"status": "error", "message": f"Failed to connect to Neo4j: {str(e)}"}
-    finally:
-        if driver:
-            driver.close()
+
+# Independent subqueries so an empty label still yields a zero count instead
+# of an empty result (a grouped count over no rows returns no rows)
+NODE_COUNTS_QUERY = """
+CALL { MATCH (p:Paper) RETURN count(p) AS papers }
+CALL { MATCH (a:Author) RETURN count(a) AS authors }
+CALL { MATCH (c:Category) RETURN count(c) AS categories }
+RETURN papers, authors, categories
+"""
+
+# Dashboards poll /db-stats; counts only change when the sync runs
+NEO4J_STATS_TTL_SECONDS = float(os.getenv("NEO4J_STATS_TTL_SECONDS", "30"))
+_db_stats_cache: Optional[tuple] = None  # (computed_at, stats)
 
 @router.get("/db-stats")
-def neo4j_db_stats():
+async def neo4j_db_stats():
     """Get Neo4j database statistics (papers, authors, categories)"""
+    global _db_stats_cache
+    cached = _db_stats_cache
+    if cached is not None and time.monotonic() - cached[0] < NEO4J_STATS_TTL_SECONDS:
+        return dict(cached[1])
     try:
         driver = get_driver()
         if not driver:
             return {"papers": 0, "authors": 0, "categories": 0, "error": "Failed to create Neo4j driver"}
         
-        with driver.session() as session:
-            # Count papers
-            paper_result = session.run("MATCH (p:Paper) RETURN count(p) as count")
-            paper_count = paper_result.single()["count"] if paper_result.peek() else 0
-            
-            # Count authors
-            author_result = session.run("MATCH (a:Author) RETURN count(a) as count")
-            author_count = author_result.single()["count"] if author_result.peek() else 0
-            
-            # Count categories
-            category_result = session.run("MATCH (c:Category) RETURN count(c) as count")
-            category_count = category_result.single()["count"] if category_result.peek() else 0
-            
-            return {"papers": paper_count, "authors": author_count, "categories": category_count}
+        async with driver.session() as session:
+            # All three counts in one round trip; label counts are served from
+            # the count store rather than by scanning nodes
+            result = await session.run(NODE_COUNTS_QUERY)
+            record = await result.single()
+        
+        if not record:
+            return {"papers": 0, "authors": 0, "categories": 0}
+        stats = {"papers": record["papers"], "authors": record["authors"], "categories": record["categories"]}
+        # Only successful results are cached, so errors are retried on the next poll
+        _db_stats_cache = (time.monotonic(), stats)
+        return dict(stats)
     except Exception as e:
         logger.error(f"Neo4j stats error: {str(e)}")
         # Return fallback values for UI compatibility
         return {"papers": 0, "authors": 0, "categories": 0, "error": str(e)}
-    finally:
-        if driver:
-            driver.close()
 
 @router.post("/run-query")
-def run_neo4j_query(cypher_query: str = Body(..., embed=True)):
+async def run_neo4j_query(cypher_query: str = Body(..., embed=True)):
     """Run a Cypher query and return the results in a format suitable for visualization"""
     if os.getenv("ENABLE_LEGACY_CYPHER_API", "false").lower() != "true":
         raise HTTPException(
@@ -115,14 +139,14 @@ def run_neo4j_query(cypher_query: str = Body(..., embed=True)):
         if not driver:
             return {"nodes": [], "edges": [], "error": "Failed to create Neo4j driver"}
         
-        with driver.session() as session:
-            result = session.run(cypher_query)
+        async with driver.session() as session:
+            result = await session.run(cypher_query)
             
             # Process the records into a format for Cytoscape
             node_map = {}
             edges = []
             
-            for record in result:
+            async for record in result:
                 for key in record.keys():
                     value = record[key]
                     
@@ -163,6 +187,3 @@ def run_neo4j_query(cypher_query: str = Body(..., embed=True)):
     except Exception as e:
         logger.error(f"Error executing Neo4j query: {str(e)}")
         return {"nodes": [], "edges": [], "error": str(e)}
-    finally:
-        if driver:
-            driver.close()
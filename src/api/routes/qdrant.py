@@ -2,24 +2,55 @@
 
 from __future__ import annotations
 
+import asyncio
+import copy
 import os
+import time
 from typing import Any
 
 from fastapi import APIRouter, HTTPException
-from qdrant_client import QdrantClient
+from qdrant_client import AsyncQdrantClient
+from qdrant_client.http.exceptions import UnexpectedResponse
 
 from src.retrieval.factory import load_project_config, resolve_qdrant_url
 
 router = APIRouter()
 
+# Dashboards poll /status; collection sizes only change when indexing runs
+QDRANT_STATUS_TTL_SECONDS = float(os.getenv("QDRANT_STATUS_TTL_SECONDS", "30"))
+_status_cache: tuple[float, dict[str, Any]] | None = None  # (computed_at, status)
+
+# One client per Qdrant URL, reused across requests so its HTTP connection
+# pool keeps sockets alive instead of reconnecting on every status check.
+# Only touched from the event loop, so no lock is needed.
+_clients: dict[str, AsyncQdrantClient] = {}
+
+
+def _get_client(url: str) -> AsyncQdrantClient:
+    client = _clients.get(url)
+    if client is None:
+        client = _clients[url] = AsyncQdrantClient(url=url, timeout=10)
+    return client
+
+
+async def close_qdrant_clients() -> None:
+    clients = list(_clients.values())
+    _clients.clear()
+    for client in clients:
+        await client.close()
+
 
 @router.get(
     "/status",
     operation_id="get_qdrant_research_status",
     summary="Inspect active evidence and discovery collections",
 )
-def get_qdrant_research_status() -> dict[str, Any]:
-    config = load_project_config()
+async def get_qdrant_research_status() -> dict[str, Any]:
+    global _status_cache
+    cached = _status_cache
+    if cached is not None and time.monotonic() - cached[0] < QDRANT_STATUS_TTL_SECONDS:
+        return copy.deepcopy(cached[1])
+    config = await asyncio.to_thread(load_project_config)
     research = config.get("research_index", {})
     discovery = config.get("discovery_index", {})
     evidence_name = str(
@@ -32,33 +63,29 @@ def get_qdrant_research_status() -> dict[str, Any]:
         or discovery.get("alias_name")
         or "arxiv_discovery_current"
     )
-    client = QdrantClient(url=resolve_qdrant_url(config), timeout=10)
+    client = _get_client(resolve_qdrant_url(config))
     try:
-        aliases = {
-            alias.alias_name: alias.collection_name
-            for alias in client.get_aliases().aliases
-        }
-        collections = [
-            _collection_status(
-                client,
-                role="evidence",
-                configured_name=evidence_name,
-                resolved_name=evidence_name,
-            ),
+        # The lookups are independent, so their round trips overlap; the
+        # alias only names the collection behind the discovery status
+        evidence, discovery, alias_response = await asyncio.gather(
+            _collection_status(client, role="evidence", configured_name=evidence_name),
             _collection_status(
-                client,
-                role="discovery",
-                configured_name=discovery_alias,
-                resolved_name=aliases.get(discovery_alias, discovery_alias),
+                client, role="discovery", configured_name=discovery_alias
             ),
-        ]
+            client.get_aliases(),
+        )
+        aliases = {
+            alias.alias_name: alias.collection_name for alias in alias_response.aliases
+        }
+        discovery["resolved_name"] = aliases.get(discovery_alias, discovery_alias)
+        collections = [evidence, discovery]
     except Exception as error:
         raise HTTPException(
             status_code=503,
             detail=f"Qdrant status unavailable: {error}",
         ) from error
     available = sum(item["available"] for item in collections)
-    return {
+    status = {
         "status": (
             "healthy"
             if available == len(collections)
@@ -66,20 +93,28 @@ def get_qdrant_research_status() -> dict[str, Any]:
         ),
         "collections": collections,
     }
+    # Failures raise above and are never cached
+    _status_cache = (time.monotonic(), status)
+    return copy.deepcopy(status)
 
 
-def _collection_status(
-    client: QdrantClient,
+async def _collection_status(
+    client: AsyncQdrantClient,
     *,
     role: str,
     configured_name: str,
-    resolved_name: str,
 ) -> dict[str, Any]:
-    if not client.collection_exists(configured_name):
+    # A single collection-info request; Qdrant answers 404 for a missing
+    # collection, so a separate existence check would only add a round trip
+    try:
+        collection = await client.get_collection(configured_name)
+    except UnexpectedResponse as error:
+        if error.status_code != 404:
+            raise
         return {
             "role": role,
             "configured_name": configured_name,
-            "resolved_name": resolved_name,
+            "resolved_name": configured_name,
             "available": False,
             "status": "missing",
             "points": 0,
@@ -87,13 +122,12 @@ def _collection_status(
             "dense_dimensions": None,
             "sparse_enabled": False,
         }
-    collection = client.get_collection(configured_name)
     vectors = collection.config.params.vectors
     sparse_vectors = collection.config.params.sparse_vectors or {}
     return {
         "role": role,
         "configured_name": configured_name,
-        "resolved_name": resolved_name,
+        "resolved_name": configured_name,
         "available": True,
         "status": str(collection.status),
         "points": int(collection.points_count or 0),
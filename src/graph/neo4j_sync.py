@@ -1,10 +1,20 @@
 from neo4j import GraphDatabase
+from neo4j.exceptions import Neo4jError
 from typing import List, Dict, Any, Tuple
 import logging
 import time
 
 logger = logging.getLogger(__name__)
 
+# Papers written per transaction by sync_papers_batch
+SYNC_BATCH_SIZE = 1000
+
+# Paper document fields copied onto :Paper nodes
+PAPER_PROPERTIES = ('title', 'summary', 'published', 'updated', 'arxiv_url', 'pdf_url')
+
+# Unique keys that every MERGE matches on, so each is an index lookup
+NODE_KEYS = (('Paper', 'id'), ('Author', 'name'), ('Category', 'name'))
+
 class Neo4jSync:
     def __init__(self, uri: str, user: str, password: str):
         self.driver = GraphDatabase.driver(uri, auth=(user, password))
@@ -16,11 +26,25 @@ class Neo4jSync:
         except Exception as e:
             logger.error(f"Failed to connect to Neo4j: {e}")
             raise
+        self._ensure_constraints()
 
     def close(self):
         if self.driver:
             self.driver.close()
     
+    def _ensure_constraints(self):
+        """Create the uniqueness constraints (and their indexes) MERGE relies on"""
+        with self.driver.session() as session:
+            for label, key in NODE_KEYS:
+                try:
+                    session.run(
+                        f"CREATE CONSTRAINT {label.lower()}_{key}_unique IF NOT EXISTS "
+                        f"FOR (n:{label}) REQUIRE n.{key} IS UNIQUE"
+                    ).consume()
+                except Neo4jError as e:
+                    # Existing duplicate nodes block the constraint; sync still works, just slower
+                    logger.warning(f"Could not create unique constraint on :{label}({key}): {e}")
+    
     def clear_database(self):
         """Clear all data from the Neo4j database"""
         with self.driver.session() as session:
@@ -32,12 +56,18 @@ class Neo4jSync:
         success, errors = self.sync_papers_batch(papers)
         return success
 
-    def sync_papers_batch(self, papers: List[Dict[str, Any]], sync_timestamp: str = None) -> Tuple[int, int]:
+    def sync_papers_batch(self, papers: List[Dict[str, Any]], sync_timestamp: str = None,
+                          batch_size: int = SYNC_BATCH_SIZE) -> Tuple[int, int]:
         """Sync a batch of papers to Neo4j using optimized batch operations
         
+        Papers are written batch_size at a time, each chunk in one transaction
+        of three UNWIND queries. If a chunk fails, its papers are retried one
+        by one so a single bad paper does not fail the rest.
+        
         Args:
             papers: List of paper documents from MongoDB
             sync_timestamp: Optional timestamp to mark this sync operation
+            batch_size: Papers written per transaction
             
         Returns:
             Tuple of (success_count, error_count)
@@ -48,41 +78,26 @@ class Neo4jSync:
         
         try:
             with self.driver.session() as session:
-                # Process papers in a single transaction per batch
-                for idx, paper in enumerate(papers):
+                for start in range(0, len(papers), batch_size):
+                    rows = [self._paper_row(paper, sync_timestamp) for paper in papers[start:start + batch_size]]
                     try:
-                        # Create paper
-                        session.write_transaction(self._create_paper, paper)
-                        
-                        # Create authors in batch
-                        if paper.get('authors', []):
-                            authors_batch = [(paper['id'], author) for author in paper.get('authors', [])]
-                            session.write_transaction(self._create_authors_batch, authors_batch)
-                        
-                        # Create categories in batch
-                        if paper.get('categories', []):
-                            categories_batch = [(paper['id'], category) for category in paper.get('categories', [])]
-                            session.write_transaction(self._create_categories_batch, categories_batch)
-                        
-                        # Mark paper with sync timestamp if provided
-                        if sync_timestamp:
-                            session.write_transaction(
-                                self._mark_paper_synced, paper['id'], sync_timestamp
-                            )
-                            
-                        success_count += 1
-                        
-                    except Exception as e:
-                        error_count += 1
-                        paper_id = paper.get('id', 'unknown')
-                        logger.error(f"Failed to sync paper {paper_id}: {e}")
-                        
-                        # Don't let one paper failure crash the entire batch
+                        session.execute_write(self._write_papers, rows)
+                        success_count += len(rows)
                         continue
+                    except Exception as e:
+                        logger.warning(f"Failed to sync {len(rows)} papers in one transaction, retrying individually: {e}")
+                    
+                    for row in rows:
+                        try:
+                            session.execute_write(self._write_papers, [row])
+                            success_count += 1
+                        except Exception as e:
+                            error_count += 1
+                            logger.error(f"Failed to sync paper {row['id'] or 'unknown'}: {e}")
         
         except Exception as e:
             logger.error(f"Failed to process batch: {e}")
-            error_count += len(papers) - success_count
+            error_count += len(papers) - success_count - error_count
         
         batch_time = time.time() - batch_start_time
         papers_per_second = len(papers) / batch_time if batch_time > 0 else 0
@@ -91,99 +106,46 @@ class Neo4jSync:
         return success_count, error_count
 
     @staticmethod
-    def _create_paper(tx, paper: Dict[str, Any]):
-        tx.run(
-            """
-            MERGE (p:Paper {id: $id})
-            SET p.title = $title,
-                p.summary = $summary,
-                p.published = $published,
-                p.updated = $updated,
-                p.arxiv_url = $arxiv_url,
-                p.pdf_url = $pdf_url
-            """,
-            id=paper.get('id', ''),
-            title=paper.get('title', ''),
-            summary=paper.get('summary', ''),
-            published=paper.get('published', ''),
-            updated=paper.get('updated', ''),
-            arxiv_url=paper.get('arxiv_url', ''),
-            pdf_url=paper.get('pdf_url', '')
-        )
+    def _paper_row(paper: Dict[str, Any], sync_timestamp: str = None) -> Dict[str, Any]:
+        """Build the UNWIND row for one paper document"""
+        props = {field: paper.get(field, '') for field in PAPER_PROPERTIES}
+        if sync_timestamp:
+            props['last_synced'] = sync_timestamp
+        return {
+            'id': paper.get('id', ''),
+            'props': props,
+            'authors': paper.get('authors') or [],
+            'categories': paper.get('categories') or [],
+        }
 
     @staticmethod
-    def _create_author_and_relationship(tx, paper_id: str, author_name: str):
+    def _write_papers(tx, rows: List[Dict[str, Any]]):
+        """Create papers, authors, categories and their relationships for a chunk of rows"""
         tx.run(
             """
-            MERGE (a:Author {name: $author_name})
-            MERGE (p:Paper {id: $paper_id})
-            MERGE (a)-[:AUTHORED]->(p)
+            UNWIND $rows AS row
+            MERGE (p:Paper {id: row.id})
+            SET p += row.props
             """,
-            author_name=author_name,
-            paper_id=paper_id
-        )
-        
-    @staticmethod
-    def _create_authors_batch(tx, authors_data: List[Tuple[str, str]]):
-        """Create multiple authors and their relationships to papers in a single transaction
-        
-        Args:
-            authors_data: List of (paper_id, author_name) tuples
-        """
-        # Use UNWIND for batch processing
+            rows=rows
+        ).consume()
         tx.run(
             """
-            UNWIND $authors_data AS author_data
-            MERGE (a:Author {name: author_data[1]})
-            MERGE (p:Paper {id: author_data[0]})
+            UNWIND $rows AS row
+            MATCH (p:Paper {id: row.id})
+            UNWIND row.authors AS author_name
+            MERGE (a:Author {name: author_name})
             MERGE (a)-[:AUTHORED]->(p)
             """,
-            authors_data=authors_data
-        )
-
-    @staticmethod
-    def _create_category_and_relationship(tx, paper_id: str, category: str):
-        tx.run(
-            """
-            MERGE (c:Category {name: $category})
-            MERGE (p:Paper {id: $paper_id})
-            MERGE (p)-[:IN_CATEGORY]->(c)
-            """,
-            category=category,
-            paper_id=paper_id
-        )
-    
-    @staticmethod
-    def _create_categories_batch(tx, categories_data: List[Tuple[str, str]]):
-        """Create multiple categories and their relationships to papers in a single transaction
-        
-        Args:
-            categories_data: List of (paper_id, category) tuples
-        """
-        # Use UNWIND for batch processing
+            rows=rows
+        ).consume()
         tx.run(
             """
-            UNWIND $categories_data AS category_data
-            MERGE (c:Category {name: category_data[1]})
-            MERGE (p:Paper {id: category_data[0]})
+            UNWIND $rows AS row
+            MATCH (p:Paper {id: row.id})
+            UNWIND row.categories AS category
+            MERGE (c:Category {name: category})
             MERGE (p)-[:IN_CATEGORY]->(c)
             """,
-            categories_data=categories_data
-        )
-    
-    @staticmethod
-    def _mark_paper_synced(tx, paper_id: str, timestamp: str):
-        """Mark a paper as synced with the given timestamp
-        
-        Args:
-            paper_id: ID of the paper
-            timestamp: ISO format timestamp string
-        """
-        tx.run(
-            """
-            MATCH (p:Paper {id: $paper_id})
-            SET p.last_synced = $timestamp
-            """,
-            paper_id=paper_id,
-            timestamp=timestamp
-        )
\ No newline at end of file
+            rows=rows
+        ).consume()
@@ -17,6 +17,20 @@ logger = logging.getLogger(__name__)
 class ArxivFetchError(RuntimeError):
     """Raised when an exact arXiv metadata request cannot be completed."""
 
+    def __init__(self, message: str, *, status_code: Optional[int] = None):
+        super().__init__(message)
+        self.status_code = status_code
+
+    @property
+    def retryable(self) -> bool:
+        """Network, malformed-feed, rate-limit, and server errors may recover."""
+
+        return (
+            self.status_code is None
+            or self.status_code == 429
+            or self.status_code >= 500
+        )
+
 
 @dataclass(frozen=True, slots=True)
 class ArxivPage:
@@ -263,7 +277,8 @@ class ArxivClient:
         if response.status_code != 200:
             raise ArxivFetchError(
                 f"arXiv returned HTTP {response.status_code} for "
-                f"{search_query_str}: {response.text[:500]}"
+                f"{search_query_str}: {response.text[:500]}",
+                status_code=response.status_code,
             )
 
         # Parse XML response
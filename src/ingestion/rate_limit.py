@@ -0,0 +1,62 @@
+"""Token-bucket pacing shared by concurrent requests to a rate-limited API."""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import Callable
+
+
+class TokenBucket:
+    """Thread-safe limiter allowing bursts of ``capacity`` at ``refill_rate``/s.
+
+    Unlike a fixed sleep after every request, the bucket only waits when the
+    budget is exhausted, and one bucket paces every thread that shares it.
+    """
+
+    def __init__(
+        self,
+        capacity: float,
+        refill_rate: float,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        if capacity < 1:
+            raise ValueError("capacity must be at least one token")
+        if refill_rate <= 0:
+            raise ValueError("refill_rate must be positive")
+        self.capacity = float(capacity)
+        self.refill_rate = float(refill_rate)
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = self.capacity
+        self._last_refill = clock()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_interval(cls, interval_seconds: float, *, burst: int = 1) -> TokenBucket:
+        """Allow one request per ``interval_seconds`` after an initial burst."""
+
+        return cls(capacity=burst, refill_rate=1.0 / interval_seconds)
+
+    def acquire(self, tokens: float = 1.0) -> float:
+        """Block until ``tokens`` are available and return the seconds waited."""
+
+        if tokens > self.capacity:
+            raise ValueError("cannot acquire more tokens than the bucket holds")
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = self._clock()
+                self._tokens = min(
+                    self.capacity,
+                    self._tokens + (now - self._last_refill) * self.refill_rate,
+                )
+                self._last_refill = now
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return waited
+                delay = (tokens - self._tokens) / self.refill_rate
+            self._sleep(delay)
+            waited += delay
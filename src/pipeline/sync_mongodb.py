@@ -5,7 +5,9 @@ from __future__ import annotations
 import argparse
 import logging
 import os
+import random
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Any
@@ -13,7 +15,8 @@ from typing import Any
 import yaml
 
 from src.ingestion.fetch import ArxivClient, ArxivFetchError, ArxivPage
-from src.storage.mongo import MongoStorage
+from src.ingestion.rate_limit import TokenBucket
+from src.storage.mongo import MongoStorage, close_mongo_clients
 
 logging.basicConfig(
     level=logging.INFO,
@@ -55,8 +58,13 @@ def _fetch_with_retries(
     start_date: str | None,
     end_date: str | None,
     attempts: int = 3,
+    base_delay: float = 10.0,
+    max_delay: float = 120.0,
+    rate_limiter: TokenBucket | None = None,
 ) -> ArxivPage:
     for attempt in range(1, attempts + 1):
+        if rate_limiter is not None:
+            rate_limiter.acquire()
         try:
             return client.fetch_papers_page(
                 category=category,
@@ -65,12 +73,15 @@ def _fetch_with_retries(
                 start_date=start_date,
                 end_date=end_date,
             )
-        except ArxivFetchError:
-            if attempt >= attempts:
+        except ArxivFetchError as error:
+            if attempt >= attempts or not error.retryable:
                 raise
-            delay = 10 * attempt
+            # Exponential backoff with jitter so concurrent categories that
+            # hit the same rate limit do not retry in lockstep.
+            delay = min(max_delay, base_delay * 2 ** (attempt - 1))
+            delay += random.uniform(0, base_delay)
             logger.warning(
-                "arXiv request failed (%d/%d); retrying in %d seconds",
+                "arXiv request failed (%d/%d); retrying in %.1f seconds",
                 attempt,
                 attempts,
                 delay,
@@ -79,8 +90,106 @@ def _fetch_with_retries(
     raise AssertionError("arXiv retry loop exited without returning or raising")
 
 
+def _ingest_category(
+    arxiv_client: ArxivClient,
+    mongo_storage: MongoStorage,
+    arxiv_config: dict[str, Any],
+    category: str,
+    rate_limiter: TokenBucket | None = None,
+) -> int:
+    """Page through one arXiv category and store each batch; return its total."""
+
+    logger.info("Processing category: %s", category)
+    start = 0
+    max_iterations = int(arxiv_config.get("max_iterations", 2))
+    max_results = int(arxiv_config["max_results"])
+    total_papers = 0
+    empty_batches = 0
+    start_date = arxiv_config.get("start_date")
+    end_date = arxiv_config.get("end_date")
+
+    for iteration in range(max_iterations):
+        logger.info(
+            "Fetching %s batch %d/%d, start=%d",
+            category,
+            iteration + 1,
+            max_iterations,
+            start,
+        )
+        page = _fetch_with_retries(
+            arxiv_client,
+            category=category,
+            search_query=arxiv_config.get("search_query"),
+            start=start,
+            start_date=start_date,
+            end_date=end_date,
+            rate_limiter=rate_limiter,
+        )
+        papers = page.papers
+        fetched_count = len(papers)
+        logger.info(
+            "Fetched %d papers from arXiv before filtering " "(offset=%d, total=%s)",
+            fetched_count,
+            page.start_index,
+            page.total_results,
+        )
+
+        if start_date and end_date:
+            before_filter = len(papers)
+            papers = filter_papers_by_date(
+                papers,
+                start_date,
+                end_date,
+            )
+            logger.info(
+                "%d papers remain after date filtering "
+                "(%d filtered out); range %s to %s",
+                len(papers),
+                before_filter - len(papers),
+                start_date,
+                end_date,
+            )
+
+        if papers:
+            empty_batches = 0
+            mongo_storage.store_papers_bulk(papers)
+            total_papers += len(papers)
+        else:
+            empty_batches += 1
+            logger.info("Empty batch %d", empty_batches)
+
+        page_advance = fetched_count or page.items_per_page or max_results
+        start = max(
+            start + page_advance,
+            page.start_index + page_advance,
+        )
+        if page.total_results is not None and start >= page.total_results:
+            logger.info(
+                "Reached the end of %s results at offset %d",
+                category,
+                start,
+            )
+            break
+        if empty_batches >= int(arxiv_config["max_no_papers"]):
+            logger.info(
+                "No more papers after %d empty batches",
+                empty_batches,
+            )
+            break
+        logger.info(
+            "%s progress: %d papers processed",
+            category,
+            total_papers,
+        )
+    return total_papers
+
+
 def run_ingestion_pipeline(config: dict[str, Any]) -> dict[str, Any]:
-    """Run the arXiv metadata ingestion pipeline."""
+    """Run the arXiv metadata ingestion pipeline.
+
+    Categories are independent, so up to ``arxiv.max_concurrency`` of them
+    are fetched and stored concurrently on a shared client and MongoDB pool.
+    """
 
     arxiv_config = config["arxiv"]
     arxiv_client = ArxivClient(
@@ -96,107 +205,46 @@ def run_ingestion_pipeline(config: dict[str, Any]) -> dict[str, Any]:
     mongo_storage = MongoStorage(
         connection_string=mongo_uri,
         db_name=config["mongo"]["db_name"],
+        **config["mongo"].get("pool", {}),
     )
     logger.info("Using MongoDB connection: %s", mongo_uri)
 
-    grand_total = 0
+    # One bucket paces every category thread, so concurrency never raises the
+    # request rate sent to arXiv above rate_limit_seconds.
+    rate_limit = float(arxiv_config.get("rate_limit_seconds", 0))
+    rate_limiter = (
+        TokenBucket.from_interval(
+            rate_limit, burst=int(arxiv_config.get("rate_limit_burst", 1))
+        )
+        if rate_limit > 0
+        else None
+    )
+    categories = list(arxiv_config["categories"])
+    max_concurrency = max(1, int(arxiv_config.get("max_concurrency", 1)))
     category_totals: dict[str, int] = {}
     cleanup_result: dict[str, Any] | None = None
     try:
-        for category in arxiv_config["categories"]:
-            logger.info("Processing category: %s", category)
-            start = 0
-            max_iterations = int(arxiv_config.get("max_iterations", 2))
-            max_results = int(arxiv_config["max_results"])
-            total_papers = 0
-            empty_batches = 0
-            start_date = arxiv_config.get("start_date")
-            end_date = arxiv_config.get("end_date")
-
-            for iteration in range(max_iterations):
-                logger.info(
-                    "Fetching batch %d/%d, start=%d",
-                    iteration + 1,
-                    max_iterations,
-                    start,
-                )
-                page = _fetch_with_retries(
+        with ThreadPoolExecutor(
+            max_workers=min(max_concurrency, len(categories) or 1),
+            thread_name_prefix="arxiv-category",
+        ) as executor:
+            totals = executor.map(
+                lambda category: _ingest_category(
                     arxiv_client,
-                    category=category,
-                    search_query=arxiv_config.get("search_query"),
-                    start=start,
-                    start_date=start_date,
-                    end_date=end_date,
-                )
-                papers = page.papers
-                fetched_count = len(papers)
-                logger.info(
-                    "Fetched %d papers from arXiv before filtering "
-                    "(offset=%d, total=%s)",
-                    fetched_count,
-                    page.start_index,
-                    page.total_results,
-                )
-
-                if start_date and end_date:
-                    before_filter = len(papers)
-                    papers = filter_papers_by_date(
-                        papers,
-                        start_date,
-                        end_date,
-                    )
-                    logger.info(
-                        "%d papers remain after date filtering "
-                        "(%d filtered out); range %s to %s",
-                        len(papers),
-                        before_filter - len(papers),
-                        start_date,
-                        end_date,
-                    )
-
-                if papers:
-                    empty_batches = 0
-                    mongo_storage.store_papers_bulk(papers)
-                    total_papers += len(papers)
-                    grand_total += len(papers)
-                else:
-                    empty_batches += 1
-                    logger.info("Empty batch %d", empty_batches)
-
-                page_advance = fetched_count or page.items_per_page or max_results
-                start = max(
-                    start + page_advance,
-                    page.start_index + page_advance,
-                )
-                if page.total_results is not None and start >= page.total_results:
-                    logger.info(
-                        "Reached the end of %s results at offset %d",
-                        category,
-                        start,
-                    )
-                    break
-                if empty_batches >= int(arxiv_config["max_no_papers"]):
-                    logger.info(
-                        "No more papers after %d empty batches",
-                        empty_batches,
-                    )
-                    break
-                logger.info(
-                    "%s progress: %d papers processed",
+                    mongo_storage,
+                    arxiv_config,
                     category,
-                    total_papers,
-                )
-
-                rate_limit = float(arxiv_config.get("rate_limit_seconds", 0))
-                if rate_limit > 0 and iteration + 1 < max_iterations:
-                    time.sleep(rate_limit)
-            category_totals[category] = total_papers
+                    rate_limiter,
+                ),
+                categories,
+            )
+            category_totals = dict(zip(categories, totals))
         cleanup_result = mongo_storage.cleanup_paper_versions()
     finally:
         mongo_storage.close()
 
     result = {
-        "total_processed": grand_total,
+        "total_processed": sum(category_totals.values()),
         "category_totals": category_totals,
         "version_cleanup": cleanup_result,
     }
@@ -218,18 +266,21 @@ def main(argv: list[str] | None = None) -> int:
     args = parser.parse_args(argv)
     config = load_config(args.config)
 
-    for run in range(args.runs):
-        logger.info(
-            "Starting arXiv ingestion pipeline (run %d/%d)",
-            run + 1,
-            args.runs,
-        )
-        started = datetime.now()
-        run_ingestion_pipeline(config)
-        logger.info(
-            "Pipeline run completed in %s",
-            datetime.now() - started,
-        )
+    try:
+        for run in range(args.runs):
+            logger.info(
+                "Starting arXiv ingestion pipeline (run %d/%d)",
+                run + 1,
+                args.runs,
+            )
+            started = datetime.now()
+            run_ingestion_pipeline(config)
+            logger.info(
+                "Pipeline run completed in %s",
+                datetime.now() - started,
+            )
+    finally:
+        close_mongo_clients()
     return 0
 
 
@@ -206,6 +206,7 @@ def sync_qdrant_with_tracking():
             if to_add:
                 print(f"Adding {len(to_add)} papers to tracking that are in Qdrant")
                 bulk_operations = []
+                processed_date = datetime.datetime.now()
                 
                 for paper_id in to_add:
                     # Find the paper in MongoDB to get its category
@@ -220,7 +221,7 @@ def sync_qdrant_with_tracking():
                         tracking_data = {
                             "paper_id": paper_id,
                             "category": category,
-                            "processed_date": datetime.datetime.now(),
+                            "processed_date": processed_date,
                             "summary_length": summary_length,
                             "published": paper.get("published")
                         }
@@ -238,7 +239,7 @@ def sync_qdrant_with_tracking():
                         tracking_data = {
                             "paper_id": paper_id,
                             "category": "unknown",
-                            "processed_date": datetime.datetime.now(),
+                            "processed_date": processed_date,
                             "summary_length": 0
                         }
                         
@@ -474,11 +475,12 @@ def process_papers():
             
             # Step 7: Prepare tracking operations for bulk update
             if TRACKING_ENABLED:
+                processed_date = datetime.datetime.now()
                 for idx, paper_id in enumerate(batch_paper_ids):
                     tracking_data = {
                         "paper_id": paper_id,
                         "category": batch_categories[idx],
-                        "processed_date": datetime.datetime.now(),
+                        "processed_date": processed_date,
                         "summary_length": batch_summary_lengths[idx],
                         "qdrant_id": str(ids[idx]) if idx < len(ids) else None
                     }
@@ -1,7 +1,12 @@
 import logging
+import random
+import threading
+import time
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from itertools import islice
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
+import bson
 import pymongo
 
 from src.analysis.identity import paper_lookup_aliases
@@ -17,14 +22,102 @@ from src.storage.paper_archive import (
 
 logger = logging.getLogger(__name__)
 
+# Fields refreshed on every import; all other paper fields are only written
+# when a paper is first inserted or its stored value actually changed.
+VOLATILE_PAPER_FIELDS = ("ingestion_timestamp",)
+
+# Buffered ingestion_stats documents written per insert_many
+STATS_FLUSH_THRESHOLD = 100
+
+# Metadata-only projection for list views; abstracts dominate document size.
+PAPER_LISTING_PROJECTION = {"id": 1, "title": 1, "published": 1, "_id": 0}
+
+# Clients are shared per connection string and options so repeated pipeline
+# runs in one process reuse a warm pool instead of repeating the handshake.
+_client_cache: Dict[tuple, pymongo.MongoClient] = {}
+_indexed_databases: set[tuple] = set()
+_client_lock = threading.Lock()
+
+
+def _shared_client(connection_string: str, **options: Any) -> pymongo.MongoClient:
+    key = (connection_string, tuple(sorted(options.items())))
+    with _client_lock:
+        client = _client_cache.get(key)
+        if client is None:
+            if not bson.has_c():
+                # Pure-Python BSON encoding multiplies CPU per bulk_write batch
+                logger.warning(
+                    "PyMongo is running without its BSON C extension; "
+                    "reinstall pymongo from a binary wheel for faster writes"
+                )
+            client = pymongo.MongoClient(connection_string, **options)
+            _client_cache[key] = client
+        return client
+
+
+def _bulk_write_with_retries(
+    collection: Any,
+    operations: List[Any],
+    *,
+    ordered: bool,
+    attempts: int = 3,
+    base_delay: float = 0.5,
+    max_delay: float = 8.0,
+) -> Any:
+    """Retry idempotent upsert batches on connection-level failures only.
+
+    Write errors (duplicate keys, validation) are not retried; they surface as
+    ``BulkWriteError`` and are accounted per operation by the caller.
+    """
+    from pymongo.errors import ConnectionFailure
+
+    for attempt in range(1, attempts + 1):
+        try:
+            return collection.bulk_write(operations, ordered=ordered)
+        except ConnectionFailure as error:
+            if attempt >= attempts:
+                raise
+            delay = min(max_delay, base_delay * 2 ** (attempt - 1))
+            delay += random.uniform(0, base_delay)
+            logger.warning(
+                "MongoDB bulk write failed (%d/%d); retrying in %.1f seconds: %s",
+                attempt,
+                attempts,
+                delay,
+                error,
+            )
+            time.sleep(delay)
+    raise AssertionError("bulk write retry loop exited without returning or raising")
+
+
+def close_mongo_clients() -> None:
+    """Close every shared MongoDB client, e.g. at process shutdown."""
+
+    with _client_lock:
+        for client in _client_cache.values():
+            client.close()
+        _client_cache.clear()
+        _indexed_databases.clear()
+
 
 class MongoStorage:
     """MongoDB storage for arXiv papers."""
 
+    # Categories are ingested on worker threads that share one storage, so
+    # stats buffer appends and flushes are serialized.
+    _stats_lock = threading.Lock()
+
     def __init__(
         self,
         connection_string: str = "mongodb://localhost:27017/",
         db_name: str = "arxiv_papers",
+        *,
+        max_pool_size: Optional[int] = None,
+        min_pool_size: Optional[int] = None,
+        max_idle_time_ms: Optional[int] = None,
+        wait_queue_timeout_ms: Optional[int] = None,
+        server_selection_timeout_ms: Optional[int] = None,
+        compressors: Optional[str] = None,
     ):
         """
         Initialize MongoDB connection.
@@ -32,24 +125,60 @@ class MongoStorage:
         Args:
             connection_string: MongoDB connection URI
             db_name: Target database name
+            max_pool_size: Upper bound on pooled connections
+            min_pool_size: Connections kept warm so concurrent writers do not
+                pay the TCP/auth handshake on first use
+            max_idle_time_ms: Idle time before a pooled connection is closed
+            wait_queue_timeout_ms: Maximum wait for a free pooled connection
+            server_selection_timeout_ms: Maximum wait for a usable server
+            compressors: Comma-separated wire compressors, e.g. "zstd,zlib"
+
+        Unset options keep the PyMongo defaults.
         """
-        self.client = pymongo.MongoClient(connection_string)
+        client_options = {
+            "maxPoolSize": max_pool_size,
+            "minPoolSize": min_pool_size,
+            "maxIdleTimeMS": max_idle_time_ms,
+            "waitQueueTimeoutMS": wait_queue_timeout_ms,
+            "serverSelectionTimeoutMS": server_selection_timeout_ms,
+            "compressors": compressors,
+        }
+        self.client = _shared_client(
+            connection_string,
+            **{
+                key: value for key, value in client_options.items() if value is not None
+            },
+        )
         self.db = self.client[db_name]
         self.papers = self.db.papers
         self.paper_archive = self.db[PAPERS_ARCHIVE_COLLECTION]
         self.stats = self.db.ingestion_stats
+        # Ingestion stats are buffered and written with insert_many
+        self._stats_buffer: List[Dict[str, Any]] = []
 
-        # Create indexes
-        self._setup_indexes()
+        # Create indexes once per shared client and database
+        index_key = (id(self.client), db_name)
+        if index_key not in _indexed_databases:
+            self._setup_indexes()
+            _indexed_databases.add(index_key)
 
     def _setup_indexes(self):
         """Set up MongoDB indexes for optimized queries."""
+        from pymongo import IndexModel
         from pymongo.errors import DuplicateKeyError, OperationFailure
 
-        self.papers.create_index("id", unique=True)
-        self.papers.create_index("categories")
-        self.papers.create_index("authors")
-        self.papers.create_index("published")
+        self.papers.create_indexes(
+            [
+                IndexModel("id", unique=True),
+                IndexModel("categories"),
+                IndexModel("authors"),
+                IndexModel("published"),
+                # Date-range analysis filtered by category
+                IndexModel([("published", 1), ("categories", 1)]),
+            ]
+        )
+        # Built separately: existing duplicate versions make this one fail
+        # until cleanup runs, which must not block the indexes above.
         try:
             self.papers.create_index(
                 "base_arxiv_id",
@@ -64,30 +193,37 @@ class MongoStorage:
                 "Deferring the unique base_arxiv_id index until paper "
                 "version cleanup removes existing duplicates"
             )
-        self.paper_archive.create_index(
-            [("base_arxiv_id", 1), ("arxiv_version", 1)],
-            name="archived_paper_version_unique",
-            unique=True,
+        self.paper_archive.create_indexes(
+            [
+                IndexModel(
+                    [("base_arxiv_id", 1), ("arxiv_version", 1)],
+                    name="archived_paper_version_unique",
+                    unique=True,
+                ),
+                IndexModel("archived_at"),
+            ]
         )
-        self.paper_archive.create_index("archived_at")
         logger.info("MongoDB indexes initialized")
 
     def store_papers(self, papers: List[Dict]) -> Dict[str, int]:
-        """Store papers using the same version-aware path as bulk imports."""
+        """Store papers through one unordered bulk write, never per paper."""
 
         return self.store_papers_bulk(papers)
 
-    def store_papers_bulk(self, papers: List[Dict]) -> Dict[str, int]:
+    def store_papers_bulk(
+        self, papers: List[Dict], batch_size: int = 1000
+    ) -> Dict[str, int]:
         """
         Bulk upsert papers for efficiency with large batches.
 
         Args:
             papers: List of paper metadata dictionaries
+            batch_size: Paper operations per bulk_write; MongoDB throughput
+                plateaus around 1-2k operations and degrades on huge batches
 
         Returns:
             Stats dictionary with counts of inserted and updated documents
         """
-        from pymongo import ReplaceOne, UpdateOne
         from pymongo.errors import BulkWriteError, PyMongoError
 
         now = datetime.now(timezone.utc)
@@ -152,17 +288,110 @@ class MongoStorage:
             ) > paper_version_sort_key(current):
                 existing_by_base[base_id] = document
 
-        paper_operations = []
-        archive_operations = []
+        # Operations are planned lazily and materialized one batch at a time,
+        # so peak memory no longer holds an operation per paper.
+        planned_writes = self._plan_version_writes(
+            canonical_by_base, existing_by_base, archived_at=now
+        )
+        written = 0
+        try:
+            while batch := list(islice(planned_writes, batch_size)):
+                archive_operations = [op for op, _ in batch if op is not None]
+                paper_operations = [op for _, op in batch if op is not None]
+                if archive_operations:
+                    _bulk_write_with_retries(
+                        self.paper_archive, archive_operations, ordered=True
+                    )
+                    archived += len(archive_operations)
+                skipped_older += len(batch) - len(paper_operations)
+                if paper_operations:
+                    try:
+                        result = _bulk_write_with_retries(
+                            self.papers, paper_operations, ordered=False
+                        )
+                    except BulkWriteError as bwe:
+                        # Unordered paper writes continue past individual
+                        # failures, so only the reported write errors were lost.
+                        logger.error(f"Bulk write error: {bwe.details}")
+                        inserted += bwe.details.get("nUpserted", 0)
+                        updated += bwe.details.get("nModified", 0)
+                        failed += len(bwe.details.get("writeErrors", []))
+                    else:
+                        inserted += result.upserted_count
+                        updated += result.modified_count
+                written += len(batch)
+        except BulkWriteError as bwe:
+            logger.error(f"Archive bulk write error: {bwe.details}")
+            failed += len(canonical_by_base) - written
+        except PyMongoError as e:
+            logger.error(f"MongoDB error during bulk write: {str(e)}")
+            failed += len(canonical_by_base) - written
+        except Exception as e:
+            logger.exception(f"Unexpected error during bulk write: {str(e)}")
+            failed += len(canonical_by_base) - written
+
+        stats = {
+            "event": "paper_ingestion",
+            "timestamp": now,
+            "inserted": inserted,
+            "updated": updated,
+            "archived": archived,
+            "skipped_older": skipped_older,
+            "failed": failed,
+            "total_processed": len(papers),
+        }
+
+        with self._stats_lock:
+            self._stats_buffer.append(dict(stats))
+            flush = len(self._stats_buffer) >= STATS_FLUSH_THRESHOLD
+        if flush:
+            self.flush_stats()
+
+        logger.info(
+            "Stored %d new papers, updated %d, archived %d, "
+            "skipped %d older versions, failed %d",
+            inserted,
+            updated,
+            archived,
+            skipped_older,
+            failed,
+        )
+        return stats
+
+    def _plan_version_writes(
+        self,
+        canonical_by_base: Dict[str, Dict[str, Any]],
+        existing_by_base: Dict[str, Dict[str, Any]],
+        *,
+        archived_at: datetime,
+    ) -> Iterator[Tuple[Any, Any]]:
+        """Yield ``(archive_operation, paper_operation)`` for each base paper.
+
+        Either side may be None; an older incoming version is archived
+        without touching the live paper.
+        """
+        from pymongo import ReplaceOne, UpdateOne
+
         for base_id, incoming in canonical_by_base.items():
             current = existing_by_base.get(base_id)
             if current is None:
-                paper_operations.append(
-                    UpdateOne(
-                        {"base_arxiv_id": base_id},
-                        {"$set": incoming},
-                        upsert=True,
-                    )
+                # Only the ingestion stamp is rewritten if a concurrent import
+                # inserted the paper first; indexed fields stay untouched.
+                yield None, UpdateOne(
+                    {"base_arxiv_id": base_id},
+                    {
+                        "$setOnInsert": {
+                            key: value
+                            for key, value in incoming.items()
+                            if key not in VOLATILE_PAPER_FIELDS
+                        },
+                        "$set": {
+                            key: incoming[key]
+                            for key in VOLATILE_PAPER_FIELDS
+                            if key in incoming
+                        },
+                    },
+                    upsert=True,
                 )
                 continue
 
@@ -173,7 +402,7 @@ class MongoStorage:
             incoming_number = incoming_version if incoming_version is not None else -1
 
             if incoming_number < current_number:
-                archive_operations.append(
+                yield (
                     ReplaceOne(
                         {
                             "base_arxiv_id": base_id,
@@ -183,14 +412,14 @@ class MongoStorage:
                             incoming,
                             reason="older_version_received",
                             replaced_by=current_canonical["arxiv_id"],
-                            archived_at=now,
+                            archived_at=archived_at,
                         ),
                         upsert=True,
-                    )
+                    ),
+                    None,
                 )
-                skipped_older += 1
             elif incoming_number > current_number:
-                archive_operations.append(
+                yield (
                     ReplaceOne(
                         {
                             "base_arxiv_id": base_id,
@@ -200,63 +429,20 @@ class MongoStorage:
                             current_canonical,
                             reason="superseded_by_import",
                             replaced_by=incoming["arxiv_id"],
-                            archived_at=now,
+                            archived_at=archived_at,
                         ),
                         upsert=True,
-                    )
-                )
-                paper_operations.append(
-                    ReplaceOne({"_id": current["_id"]}, incoming, upsert=False)
+                    ),
+                    ReplaceOne({"_id": current["_id"]}, incoming, upsert=False),
                 )
             else:
-                paper_operations.append(
-                    UpdateOne({"_id": current["_id"]}, {"$set": incoming})
-                )
-
-        try:
-            if archive_operations:
-                self.paper_archive.bulk_write(archive_operations, ordered=True)
-                archived = len(archive_operations)
-            if paper_operations:
-                result = self.papers.bulk_write(paper_operations, ordered=False)
-                inserted = result.upserted_count
-                updated = result.modified_count
-        except BulkWriteError as bwe:
-            logger.error(f"Bulk write error: {bwe.details}")
-            failed += len(canonical_by_base)
-        except PyMongoError as e:
-            logger.error(f"MongoDB error during bulk write: {str(e)}")
-            failed += len(canonical_by_base)
-        except Exception as e:
-            logger.exception(f"Unexpected error during bulk write: {str(e)}")
-            failed += len(canonical_by_base)
-
-        stats = {
-            "event": "paper_ingestion",
-            "timestamp": now,
-            "inserted": inserted,
-            "updated": updated,
-            "archived": archived,
-            "skipped_older": skipped_older,
-            "failed": failed,
-            "total_processed": len(papers),
-        }
-
-        try:
-            self.stats.insert_one(dict(stats))
-        except PyMongoError as e:
-            logger.warning(f"Could not log ingestion stats: {str(e)}")
-
-        logger.info(
-            "Stored %d new papers, updated %d, archived %d, "
-            "skipped %d older versions, failed %d",
-            inserted,
-            updated,
-            archived,
-            skipped_older,
-            failed,
-        )
-        return stats
+                # Re-ingesting the same version only rewrites changed fields.
+                changed = {
+                    key: value
+                    for key, value in incoming.items()
+                    if key in VOLATILE_PAPER_FIELDS or current.get(key) != value
+                }
+                yield None, UpdateOne({"_id": current["_id"]}, {"$set": changed})
 
     def cleanup_paper_versions(self, *, dry_run: bool = False) -> Dict[str, Any]:
         """Archive superseded versions and normalize the live paper collection."""
@@ -407,16 +593,22 @@ class MongoStorage:
         skip: int = 0,
         sort_by: str = "published",
         sort_order: int = -1,
+        projection: Optional[Dict] = None,
     ) -> List[Dict]:
         """
         Retrieve papers with filtering, pagination and sorting.
 
+        Sorting by ``published`` is served by the index created in
+        ``_setup_indexes``, so it never falls back to an in-memory sort.
+
         Args:
             filter_query: MongoDB filter query
             limit: Max number of results
             skip: Number of documents to skip (pagination)
             sort_by: Field to sort by
             sort_order: pymongo.ASCENDING (1) or pymongo.DESCENDING (-1)
+            projection: Fields to return, e.g. ``PAPER_LISTING_PROJECTION``
+                for list views; ``None`` returns full documents
 
         Returns:
             List of paper documents
@@ -425,25 +617,44 @@ class MongoStorage:
             filter_query = {}
 
         cursor = (
-            self.papers.find(filter_query)
+            self.papers.find(filter_query, projection)
             .sort(sort_by, sort_order)
             .skip(skip)
             .limit(limit)
         )
         return list(cursor)
 
+    def flush_stats(self) -> None:
+        """Write buffered ingestion statistics in a single round trip."""
+        from pymongo.errors import PyMongoError
+
+        with self._stats_lock:
+            buffered, self._stats_buffer = self._stats_buffer, []
+        if not buffered:
+            return
+        try:
+            self.stats.insert_many(buffered, ordered=False)
+        except PyMongoError as e:
+            logger.warning(f"Could not log ingestion stats: {str(e)}")
+
     def get_stats(self, limit: int = 10) -> List[Dict]:
         """Get recent ingestion statistics."""
+        self.flush_stats()
         return list(self.stats.find().sort("timestamp", -1).limit(limit))
 
     def close(self):
-        """Close MongoDB connection."""
-        self.client.close()
+        """Flush buffered stats and release this storage.
+
+        The shared client stays pooled for reuse; use ``close_mongo_clients``
+        to close the underlying connections.
+        """
+        self.flush_stats()
+        self.client = None
 
     def __enter__(self):
         """Enable use as a context manager."""
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        """Ensure connection is closed when exiting context."""
+        """Release the storage when exiting context."""
         self.close()
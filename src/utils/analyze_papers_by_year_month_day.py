@@ -46,18 +46,20 @@ def analyze_papers_by_year_month_day(connection_string=None, db_name="arxiv_pape
     
     logger.info(f"Connecting to MongoDB at {connection_string}")
     
-    # Prepare filter query
-    filter_query = {}
+    # Prepare filter query; the published bounds are a plain range so the
+    # leading $match is an index scan on published (and categories)
+    published_range = {}
     if start_date:
-        filter_query["published"] = {"$gte": f"{start_date}T00:00:00Z"}
+        published_range["$gte"] = f"{start_date}T00:00:00Z"
     if end_date:
-        if "published" not in filter_query:
-            filter_query["published"] = {}
-        filter_query["published"]["$lte"] = f"{end_date}T23:59:59Z"
+        published_range["$lte"] = f"{end_date}T23:59:59Z"
+    filter_query = {}
+    if published_range:
+        filter_query["published"] = published_range
     
     # Add category filter if specified
     if category:
-        filter_query["categories"] = {"$in": [category]}
+        filter_query["categories"] = category
         logger.info(f"Filtering by category: {category}")
     
     try:
@@ -67,27 +69,26 @@ def analyze_papers_by_year_month_day(connection_string=None, db_name="arxiv_pape
             total_papers = mongo.papers.count_documents(filter_query)
             logger.info(f"Total papers matching filter: {total_papers}")
             
-            # Query to extract year, month, and day from the published field
+            # Apply year filter if specified, as a range over the year's
+            # timestamps rather than a regex so it narrows the same index bounds
+            match_query = filter_query
+            if year_filter:
+                year_range = dict(published_range)
+                year_start, next_year = f"{year_filter}", f"{int(year_filter) + 1}"
+                year_range["$gte"] = max(year_range.get("$gte", year_start), year_start)
+                year_range["$lt"] = next_year
+                match_query = {**filter_query, "published": year_range}
+            
+            # Count papers per day server-side; filtering is the first stage, only
+            # the date prefix is read and one row per day crosses the wire
             pipeline = [
-                {"$match": filter_query},
-                {"$addFields": {
-                    "year": {"$substr": ["$published", 0, 4]},
-                    "month": {"$substr": ["$published", 5, 2]},
-                    "day": {"$substr": ["$published", 8, 2]},
-                    "yearMonth": {"$substr": ["$published", 0, 7]},
-                    "fullDate": {"$substr": ["$published", 0, 10]}
-                }},
-                {"$sort": {"published": 1}}  # Sort by date ascending
+                {"$match": match_query},
+                {"$group": {"_id": {"$substr": ["$published", 0, 10]}, "count": {"$sum": 1}}}
             ]
             
-            # Apply year filter if specified
-            if year_filter:
-                pipeline[0]["$match"]["published"] = pipeline[0]["$match"].get("published", {})
-                pipeline[0]["$match"]["published"]["$regex"] = f"^{year_filter}"
-            
             # Execute the query
             logger.info("Executing aggregation query...")
-            cursor = mongo.papers.aggregate(pipeline)
+            cursor = mongo.papers.aggregate(pipeline, batchSize=5000, allowDiskUse=True)
             
             # Process results into hierarchical structure
             yearly_data = defaultdict(int)
@@ -104,17 +105,14 @@ def analyze_papers_by_year_month_day(connection_string=None, db_name="arxiv_pape
             categories_cursor = mongo.papers.aggregate(categories_pipeline)
             categories_list = [doc["_id"] for doc in categories_cursor]
             
-            # Process each document
+            # Roll day counts up into months and years (prefixes of the same date)
             for doc in cursor:
-                year = doc.get("year")
-                month = doc.get("month")
-                day = doc.get("day")
-                year_month = doc.get("yearMonth")
-                full_date = doc.get("fullDate")
+                full_date = doc["_id"]
+                count = doc["count"]
                 
-                yearly_data[year] += 1
-                monthly_data[year_month] += 1
-                daily_data[full_date] += 1
+                yearly_data[full_date[:4]] += count
+                monthly_data[full_date[:7]] += count
+                daily_data[full_date] += count
             
             # Convert to ordered dictionaries
             yearly_data = OrderedDict(sorted(yearly_data.items()))
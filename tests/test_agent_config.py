@@ -0,0 +1,45 @@
+import os
+
+from src.agents_core.config import load_config
+
+AGENT_CONFIG = """
+system:
+  log_level: INFO
+models:
+  default: ollama
+  providers:
+    ollama:
+      base_url: ${AGENT_TEST_OLLAMA_URL}
+agents: {}
+"""
+
+
+def test_load_config_expands_current_environment_each_call(tmp_path, monkeypatch):
+    path = tmp_path / "agent_config.yaml"
+    path.write_text(AGENT_CONFIG)
+    monkeypatch.setenv("AGENT_TEST_OLLAMA_URL", "http://first:11434")
+
+    first = load_config(str(path))
+    monkeypatch.setenv("AGENT_TEST_OLLAMA_URL", "http://second:11434")
+    second = load_config(str(path))
+
+    assert first["models"]["providers"]["ollama"]["base_url"] == "http://first:11434"
+    assert second["models"]["providers"]["ollama"]["base_url"] == "http://second:11434"
+    # Each caller gets its own copy of the cached parse
+    second["system"]["log_level"] = "DEBUG"
+    assert load_config(str(path))["system"]["log_level"] == "INFO"
+
+
+def test_load_config_leaves_unset_variables_and_sees_file_edits(tmp_path, monkeypatch):
+    path = tmp_path / "agent_config.yaml"
+    path.write_text(AGENT_CONFIG)
+    monkeypatch.delenv("AGENT_TEST_OLLAMA_URL", raising=False)
+
+    config = load_config(str(path))
+    path.write_text(AGENT_CONFIG.replace("INFO", "WARNING"))
+    os.utime(path, ns=(1, 1))
+
+    assert config["models"]["providers"]["ollama"]["base_url"] == (
+        "${AGENT_TEST_OLLAMA_URL}"
+    )
+    assert load_config(str(path))["system"]["log_level"] == "WARNING"
@@ -0,0 +1,333 @@
+import asyncio
+import builtins
+import importlib
+import sys
+import types
+
+import pytest
+
+from src.agents_core.models.base import ModelInterface
+
+# Placeholder modules the agent packages import but that are still empty in
+# this tree (parsers, monitors and data clients), keyed by import name.
+AGENT_PLACEHOLDERS = {
+    "agents.code_doc.code_parser": ("CodeParser",),
+    "agents.code_doc.git_monitor": ("GitMonitor",),
+    "agents.research.paper_processor": ("PaperProcessor",),
+    "agents.research.concept_mapper": ("ConceptMapper",),
+    "agent_core.data": (),
+    "agent_core.data.mongodb": ("MongoDBClient",),
+    "agent_core.data.neo4j": ("Neo4jClient",),
+    "agent_core.data.qdrant": ("QdrantClient",),
+}
+
+
+@pytest.fixture
+def import_agent(monkeypatch):
+    """Import agent modules under the ``agents``/``agent_core`` names they use."""
+
+    monkeypatch.setitem(sys.modules, "agents", importlib.import_module("src.agents"))
+    monkeypatch.setitem(
+        sys.modules, "agent_core", importlib.import_module("src.agents_core")
+    )
+    # base_agent annotates with ModelInterface without importing it
+    monkeypatch.setattr(builtins, "ModelInterface", ModelInterface, raising=False)
+    for name, attributes in AGENT_PLACEHOLDERS.items():
+        module = types.ModuleType(name)
+        for attribute in attributes:
+            setattr(module, attribute, type(attribute, (), {}))
+        monkeypatch.setitem(sys.modules, name, module)
+    loaded = set(sys.modules)
+
+    yield importlib.import_module
+
+    for name in set(sys.modules) - loaded:
+        if name.split(".")[0] in ("agents", "agent_core"):
+            del sys.modules[name]
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+def test_code_doc_agent_default_ignore_patterns_filter_globs(import_agent, tmp_path):
+    agent_module = import_agent("agents.code_doc.agent")
+    config = {
+        "ignore_patterns": ["*.pyc", "__pycache__"],
+        "cache_dir": str(tmp_path),
+    }
+
+    agent = agent_module.CodeDocAgent(config, model_interface=None)
+    changes = [
+        agent_module.Change(path, "modified")
+        for path in (
+            "src/api/main.py",
+            "src/api/main.pyc",
+            "__pycache__/main.cpython-313.pyc",
+            "__pycache__",
+            "docs/pycache.md",
+        )
+    ]
+
+    assert [change.file for change in agent._filter_relevant_changes(changes)] == [
+        "src/api/main.py",
+        "docs/pycache.md",
+    ]
+
+
+class FakeOllamaResponse:
+    def __init__(self, status, body):
+        self.status = status
+        self.body = body
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    async def text(self):
+        return str(self.body)
+
+    async def json(self):
+        return self.body
+
+
+class FakeOllamaSession:
+    def __init__(self, responses):
+        self.responses = responses
+
+    def post(self, url, json):
+        return self.responses[json["prompt"]]
+
+
+@pytest.mark.anyio
+async def test_ollama_generate_batch_returns_failures_as_exceptions(import_agent):
+    ollama = import_agent("agent_core.models.ollama")
+    model = ollama.OllamaModelInterface()
+    session = FakeOllamaSession(
+        {
+            "good": FakeOllamaResponse(200, {"response": "analysis"}),
+            "bad": FakeOllamaResponse(500, "model not loaded"),
+        }
+    )
+
+    async def get_session():
+        return session
+
+    model._get_session = get_session
+
+    good, bad = await model.generate_batch(["good", "bad"])
+
+    assert good == "analysis"
+    assert isinstance(bad, RuntimeError)
+    assert "500" in str(bad)
+
+
+class FlakyModel(ModelInterface):
+    """Fails the first request for each prompt listed in ``flaky``."""
+
+    def __init__(self, flaky):
+        self.flaky = set(flaky)
+        self.prompts = []
+
+    async def initialize(self, config):
+        pass
+
+    async def generate(self, prompt, system_prompt=None, parameters=None):
+        self.prompts.append(prompt)
+        for title in list(self.flaky):
+            if title in prompt:
+                self.flaky.discard(title)
+                raise RuntimeError("Ollama API error: 503 - busy")
+        return f"analysis of {prompt.split()[1]}"
+
+
+@pytest.mark.anyio
+async def test_research_agent_retries_only_the_failed_paper(import_agent):
+    agent_module = import_agent("agents.research.agent")
+    model = FlakyModel(flaky=["Flaky"])
+    agent = agent_module.ResearchAnalysisAgent({"max_attempts": 2}, model)
+    papers = [
+        agent_module.Paper.from_document({"paper_id": paper_id, "title": title})
+        for paper_id, title in (("p1", "Stable"), ("p2", "Flaky"))
+    ]
+    task = {"name": "summarize", "prompt_template": None}
+    agent._templates = {"summarize": "Title: {title}"}
+
+    results = await agent._process_task(task, papers)
+
+    assert results == {
+        "p1": {"title": "Stable", "analysis": "analysis of Stable"},
+        "p2": {"title": "Flaky", "analysis": "analysis of Flaky"},
+    }
+    assert model.prompts == ["Title: Stable", "Title: Flaky", "Title: Flaky"]
+
+
+class FakePromptCache:
+    def __init__(self):
+        self.writes = []
+
+    def find(self, query, projection):
+        return []
+
+    def bulk_write(self, operations, ordered):
+        self.writes.extend(operation._filter["key"] for operation in operations)
+
+
+@pytest.mark.anyio
+async def test_research_agent_never_caches_failed_generations(import_agent):
+    agent_module = import_agent("agents.research.agent")
+    model = FlakyModel(flaky=["Flaky"])
+    agent = agent_module.ResearchAnalysisAgent({"max_attempts": 1}, model)
+    agent.prompt_cache = FakePromptCache()
+    agent._templates = {"summarize": "Title: {title}"}
+    papers = [
+        agent_module.Paper.from_document({"paper_id": paper_id, "title": title})
+        for paper_id, title in (("p1", "Stable"), ("p2", "Flaky"))
+    ]
+
+    results = await agent._process_task({"name": "summarize"}, papers)
+
+    assert list(results) == ["p1"]
+    system_prompt = agent._build_system_prompt({"name": "summarize"})
+    assert agent.prompt_cache.writes == [
+        agent._prompt_cache_key(system_prompt, "Title: Stable")
+    ]
+
+
+def test_response_cache_serves_until_expiry(tmp_path, monkeypatch):
+    import src.agents.code_doc.response_cache as response_cache
+
+    now = [1000.0]
+    monkeypatch.setattr(response_cache.time, "time", lambda: now[0])
+    cache = response_cache.ResponseCache(str(tmp_path), expire_seconds=60)
+    key = cache.make_key("prompt", "system", "qwen3:8b", 0.2)
+
+    assert cache.get(key) is None
+    cache.set(key, "suggestion")
+    now[0] += 60
+    assert cache.get(key) == "suggestion"
+    now[0] += 1
+    assert cache.get(key) is None
+    # Replay serves stored entries regardless of age, and never writes
+    replay = response_cache.ResponseCache(str(tmp_path), policy="replay")
+    assert replay.get(key) == "suggestion"
+    replay.set(cache.make_key("other", "system", "qwen3:8b", 0.2), "ignored")
+    assert len(list(tmp_path.rglob("*.json"))) == 1
+
+
+def test_response_cache_key_covers_model_and_prompt():
+    from src.agents.code_doc.response_cache import ResponseCache
+
+    key = ResponseCache.make_key("prompt", "system", "qwen3:8b", 0.2)
+
+    assert key == ResponseCache.make_key("prompt", "system", "qwen3:8b", 0.2)
+    assert key != ResponseCache.make_key("prompt", "system", "llama3:8b", 0.2)
+    assert key != ResponseCache.make_key("prompt 2", "system", "qwen3:8b", 0.2)
+    assert key != ResponseCache.make_key("prompt", "system", "qwen3:8b", 0.7)
+
+
+class FakeParser:
+    def parse(self, file_path, content):
+        return {"content": content}
+
+
+class DocModel(ModelInterface):
+    def __init__(self, fail=False):
+        self.fail = fail
+        self.calls = 0
+
+    async def initialize(self, config):
+        pass
+
+    async def generate(self, prompt, system_prompt=None, parameters=None):
+        self.calls += 1
+        if self.fail:
+            raise RuntimeError("Ollama API error: 503 - busy")
+        return "suggestion"
+
+
+@pytest.mark.anyio
+async def test_code_doc_cache_is_keyed_by_configured_model(import_agent, tmp_path):
+    agent_module = import_agent("agents.code_doc.agent")
+    source = tmp_path / "module.py"
+    source.write_text("def f():\n    return 1\n")
+    change = agent_module.Change(str(source), "modified")
+
+    async def suggest(model_name, model):
+        config = {"model": model_name, "cache_dir": str(tmp_path / "cache")}
+        agent = agent_module.CodeDocAgent(config, model)
+        agent.parser = FakeParser()
+        return await agent._process_change(change, asyncio.Semaphore(1))
+
+    first = DocModel()
+    await suggest("qwen3:8b", first)
+    await suggest("qwen3:8b", first)
+    other = DocModel()
+    await suggest("llama3:8b", other)
+
+    assert (first.calls, other.calls) == (1, 1)
+
+
+@pytest.mark.anyio
+async def test_code_doc_does_not_cache_failed_generations(import_agent, tmp_path):
+    agent_module = import_agent("agents.code_doc.agent")
+    source = tmp_path / "module.py"
+    source.write_text("def f():\n    return 1\n")
+    config = {"model": "qwen3:8b", "cache_dir": str(tmp_path / "cache")}
+    agent = agent_module.CodeDocAgent(config, DocModel(fail=True))
+    agent.parser = FakeParser()
+    change = agent_module.Change(str(source), "modified")
+
+    assert await agent._process_changes([change]) == []
+    assert not list((tmp_path / "cache").rglob("*.json"))
+
+
+@pytest.fixture
+def paced_clock(monkeypatch):
+    """Fake monotonic clock for the code_doc TokenBucket; sleeping advances it."""
+
+    import src.agents.code_doc.rate_limiter as rate_limiter
+
+    now = [100.0]
+    sleeps = []
+
+    async def sleep(seconds):
+        sleeps.append(seconds)
+        now[0] += seconds
+
+    monkeypatch.setattr(rate_limiter.time, "monotonic", lambda: now[0])
+    monkeypatch.setattr(
+        rate_limiter, "asyncio", types.SimpleNamespace(Lock=asyncio.Lock, sleep=sleep)
+    )
+    return rate_limiter.TokenBucket, now, sleeps
+
+
+@pytest.mark.anyio
+async def test_agent_token_bucket_paces_requests_per_minute(paced_clock):
+    TokenBucket, now, sleeps = paced_clock
+    bucket = TokenBucket(rpm=2, tpm=60000)
+
+    assert await bucket.acquire() == 0
+    assert await bucket.acquire() == 0
+    assert await bucket.acquire() == pytest.approx(30.0)
+    assert sleeps == [pytest.approx(30.0)]
+    # Waiting a full refill interval restores one request without sleeping
+    now[0] += 30.0
+    assert await bucket.acquire() == 0
+
+
+@pytest.mark.anyio
+async def test_agent_token_bucket_paces_tokens_per_minute(paced_clock):
+    TokenBucket, now, sleeps = paced_clock
+    bucket = TokenBucket(rpm=60, tpm=600)
+
+    assert await bucket.acquire(estimated_tokens=600) == 0
+    assert await bucket.acquire(estimated_tokens=300) == pytest.approx(30.0)
+    now[0] += 60.0
+    # An oversized prompt is charged one full bucket instead of waiting forever
+    assert await bucket.acquire(estimated_tokens=10_000) == 0
+    assert bucket.token_tokens == pytest.approx(0.0)
+    assert sleeps == [pytest.approx(30.0)]
@@ -1,6 +1,7 @@
 import pytest
 
 from src.ingestion.fetch import ArxivClient, ArxivFetchError, ArxivPage
+from src.ingestion.rate_limit import TokenBucket
 from src.pipeline import run_pipeline, sync_mongodb
 
 ARXIV_RESPONSE = """<?xml version="1.0" encoding="UTF-8"?>
@@ -45,10 +46,9 @@ class FakeSession:
 
 
 class ResponseWithText:
-    status_code = 200
-
-    def __init__(self, text):
+    def __init__(self, text, status_code=200):
         self.text = text
+        self.status_code = status_code
 
     def raise_for_status(self):
         return None
@@ -188,6 +188,7 @@ def test_bulk_fetch_retries_malformed_atom_xml(monkeypatch):
     client = ArxivClient(session=session)
     sleeps = []
     monkeypatch.setattr(sync_mongodb.time, "sleep", sleeps.append)
+    monkeypatch.setattr(sync_mongodb.random, "uniform", lambda low, high: 0)
 
     page = sync_mongodb._fetch_with_retries(
         client,
@@ -360,3 +361,98 @@ def test_metadata_import_runs_version_cleanup_at_the_end(monkeypatch):
         ("close", None),
     ]
     assert result["version_cleanup"] == {"archived_documents": 1}
+
+
+def test_metadata_import_processes_categories_concurrently(monkeypatch):
+    import threading
+
+    barrier = threading.Barrier(2, timeout=5)
+
+    class FakeArxivClient:
+        def __init__(self, **kwargs):
+            pass
+
+        def fetch_papers_page(self, **kwargs):
+            # Both categories must be in flight at once to pass the barrier.
+            barrier.wait()
+            number = "00001" if kwargs["category"] == "cs.AI" else "00002"
+            return ArxivPage(
+                papers=[{"id": f"https://arxiv.org/abs/2607.{number}v1"}],
+                total_results=1,
+                start_index=0,
+                items_per_page=1,
+            )
+
+    class FakeMongoStorage:
+        def __init__(self, **kwargs):
+            pass
+
+        def store_papers_bulk(self, papers):
+            pass
+
+        def cleanup_paper_versions(self):
+            return {}
+
+        def close(self):
+            pass
+
+    monkeypatch.setattr(sync_mongodb, "ArxivClient", FakeArxivClient)
+    monkeypatch.setattr(sync_mongodb, "MongoStorage", FakeMongoStorage)
+
+    result = sync_mongodb.run_ingestion_pipeline(
+        {
+            "mongo": {
+                "connection_string": "mongodb://unused/",
+                "db_name": "arxiv_papers",
+            },
+            "arxiv": {
+                "categories": ["cs.AI", "cs.LG"],
+                "max_results": 100,
+                "max_iterations": 1,
+                "max_no_papers": 1,
+                "max_concurrency": 2,
+                "sort_by": "submittedDate",
+                "sort_order": "descending",
+                "rate_limit_seconds": 0,
+            },
+        }
+    )
+
+    assert result["category_totals"] == {"cs.AI": 1, "cs.LG": 1}
+    assert result["total_processed"] == 2
+
+
+def test_token_bucket_allows_burst_then_paces_by_refill_rate():
+    now = [0.0]
+    sleeps = []
+
+    def sleep(seconds):
+        sleeps.append(seconds)
+        now[0] += seconds
+
+    bucket = TokenBucket(capacity=2, refill_rate=0.5, clock=lambda: now[0], sleep=sleep)
+
+    assert bucket.acquire() == 0
+    assert bucket.acquire() == 0
+    assert bucket.acquire() == pytest.approx(2.0)
+    now[0] += 1.0
+    assert bucket.acquire() == pytest.approx(1.0)
+    assert sleeps == [pytest.approx(2.0), pytest.approx(1.0)]
+
+
+def test_bulk_fetch_does_not_retry_client_errors(monkeypatch):
+    session = SequenceSession([ResponseWithText("bad query", status_code=400)])
+    client = ArxivClient(session=session)
+    monkeypatch.setattr(sync_mongodb.time, "sleep", pytest.fail)
+
+    with pytest.raises(ArxivFetchError, match="HTTP 400"):
+        sync_mongodb._fetch_with_retries(
+            client,
+            category="cs.AI",
+            search_query=None,
+            start=0,
+            start_date=None,
+            end_date=None,
+        )
+
+    assert len(session.requests) == 1
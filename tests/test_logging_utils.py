@@ -0,0 +1,292 @@
+from datetime import datetime
+
+import pytest
+
+from src.agents_core.logging_utils import (
+    check_data_integrity,
+    count_papers_by_date,
+    validate_paper_schema,
+    validate_publication_date,
+)
+
+
+@pytest.mark.parametrize(
+    "date_str, expected",
+    [
+        ("2023-01-01T00:00:00Z", datetime(2023, 1, 1)),
+        ("2023-01-01T00:00:00", datetime(2023, 1, 1)),
+        ("2023-01-01", datetime(2023, 1, 1)),
+        # Unpadded fields, accepted by strptime before the fromisoformat fast path
+        ("2023-1-1T1:1:1Z", datetime(2023, 1, 1, 1, 1, 1)),
+        ("2023-01-01T1:0:0Z", datetime(2023, 1, 1, 1, 0, 0)),
+        ("2023-1-01T01:00:00Z", datetime(2023, 1, 1, 1, 0, 0)),
+        ("2023-1-1T1:1:1", datetime(2023, 1, 1, 1, 1, 1)),
+    ],
+)
+def test_validate_publication_date_accepts(date_str, expected):
+    assert validate_publication_date(date_str) == (True, expected)
+
+
+@pytest.mark.parametrize(
+    "date_str",
+    [
+        "not a date",
+        "",
+        "2023-13-01T00:00:00Z",
+        "2023-01-01T00:00:00+00:00",
+        "2023-01-01T00:00:00.5Z",
+        "2023-W01-1",
+        "2023/01/01",
+        "2023-1-1",
+        "9999-01-01T00:00:00Z",
+        "1989-12-31T00:00:00Z",
+        None,
+        20230101,
+    ],
+)
+def test_validate_publication_date_rejects(date_str):
+    assert validate_publication_date(date_str) == (False, None)
+
+
+def make_paper(**overrides):
+    paper = {
+        "id": "2301.00001",
+        "title": "A paper",
+        "authors": ["Ada Lovelace"],
+        "categories": ["cs.LG"],
+        "published": "2023-01-01T00:00:00Z",
+        "pdf_url": "https://arxiv.org/pdf/2301.00001",
+    }
+    paper.update(overrides)
+    return paper
+
+
+@pytest.mark.parametrize(
+    "published", ["2023-01-01T00:00:00Z", "2023-1-1T1:1:1Z", "2023-01-01T1:0:0Z"]
+)
+def test_validate_paper_schema_accepts_published(published):
+    assert validate_paper_schema(make_paper(published=published)) == (True, [])
+
+
+@pytest.mark.parametrize(
+    "published",
+    ["2023-01-01T00:00:00", "2023-01-01", "2023-01-01T00:00:00+00:00", "garbage"],
+)
+def test_validate_paper_schema_rejects_published(published):
+    assert validate_paper_schema(make_paper(published=published)) == (
+        False,
+        ["Field 'published' has invalid date format. Expected YYYY-MM-DDThh:mm:ssZ"],
+    )
+
+
+def test_validate_paper_schema_reports_missing_and_mistyped_fields():
+    paper = make_paper(authors=["Ada Lovelace", 7], published=20230101)
+    del paper["title"]
+
+    assert validate_paper_schema(paper) == (
+        False,
+        [
+            "Missing required field: title",
+            "All authors must be strings",
+            "Field 'published' must be a string",
+        ],
+    )
+
+
+class FakeAggregateCollection:
+    """Records each pipeline passed to aggregate and returns canned rows."""
+
+    def __init__(self, *results):
+        self.results = list(results)
+        self.pipelines = []
+
+    def aggregate(self, pipeline, **options):
+        self.pipelines.append(pipeline)
+        return iter(self.results.pop(0))
+
+
+def test_count_papers_by_date_builds_a_fresh_pipeline_per_call():
+    collection = FakeAggregateCollection([], [])
+
+    count_papers_by_date(collection, group_by="month")
+    collection.pipelines[0][0]["$group"]["_id"] = "mutated"
+    collection.pipelines[0].append({"$limit": 1})
+    count_papers_by_date(collection, group_by="month")
+
+    assert collection.pipelines[1] == [
+        {"$group": {"_id": {"$substr": ["$published", 0, 7]}, "count": {"$sum": 1}}},
+        {"$sort": {"_id": 1}},
+    ]
+
+
+def test_count_papers_by_date_maps_mongodb_day_of_week_to_weekday_names():
+    # $dayOfWeek numbers days 1 (Sunday) to 7 (Saturday)
+    collection = FakeAggregateCollection(
+        [{"_id": day, "count": day * 10} for day in (3, 1, 7, 2, 5, 4, 6)]
+    )
+
+    counts = count_papers_by_date(collection, group_by="weekday")
+
+    assert list(counts.items()) == [
+        ("Monday", 20),
+        ("Tuesday", 30),
+        ("Wednesday", 40),
+        ("Thursday", 50),
+        ("Friday", 60),
+        ("Saturday", 70),
+        ("Sunday", 10),
+    ]
+    assert collection.pipelines[0][-1] == {
+        "$group": {"_id": {"$dayOfWeek": "$_d"}, "count": {"$sum": 1}}
+    }
+
+
+def test_count_papers_by_date_fills_missing_weekdays_with_zero():
+    collection = FakeAggregateCollection([{"_id": 2, "count": 4}])
+
+    counts = count_papers_by_date(collection, group_by="weekday")
+
+    assert counts == {
+        "Monday": 4,
+        "Tuesday": 0,
+        "Wednesday": 0,
+        "Thursday": 0,
+        "Friday": 0,
+        "Saturday": 0,
+        "Sunday": 0,
+    }
+    assert list(counts)[0] == "Monday"
+
+
+def test_check_data_integrity_unpacks_facet_counts():
+    facet_counts = {
+        "total_documents": [{"n": 120}],
+        "duplicate_ids": [{"n": 2}],
+        "future_dates": [{"n": 1}],
+        "missing_id": [],
+        "missing_title": [{"n": 3}],
+        "missing_published": [],
+        "missing_authors": [{"n": 4}],
+        "missing_categories": [],
+    }
+    collection = FakeAggregateCollection([facet_counts])
+
+    results = check_data_integrity(collection)
+
+    assert results == {
+        "total_documents": 120,
+        "integrity_checks": {
+            "duplicate_ids": 2,
+            "missing_id": 0,
+            "missing_title": 3,
+            "missing_published": 0,
+            "missing_authors": 4,
+            "missing_categories": 0,
+            "future_dates": 1,
+        },
+    }
+    assert list(results["integrity_checks"]) == [
+        "duplicate_ids",
+        "missing_id",
+        "missing_title",
+        "missing_published",
+        "missing_authors",
+        "missing_categories",
+        "future_dates",
+    ]
+    [pipeline] = collection.pipelines
+    assert [list(stage) for stage in pipeline] == [["$facet"]]
+    assert set(pipeline[0]["$facet"]) == set(facet_counts)
+
+
+def test_check_data_integrity_counts_zero_without_facet_rows():
+    collection = FakeAggregateCollection([])
+
+    results = check_data_integrity(collection)
+
+    assert results == {
+        "total_documents": 0,
+        "integrity_checks": {
+            "duplicate_ids": 0,
+            "missing_id": 0,
+            "missing_title": 0,
+            "missing_published": 0,
+            "missing_authors": 0,
+            "missing_categories": 0,
+            "future_dates": 0,
+        },
+    }
+
+
+def test_check_data_integrity_limits_range_checks_but_not_future_dates():
+    collection = FakeAggregateCollection([{}], [])
+    date_range = ("2023-01-01", "2023-12-31")
+
+    check_data_integrity(collection, date_range)
+
+    facets = collection.pipelines[0][0]["$facet"]
+    in_range = {"$gte": "2023-01-01", "$lte": "2023-12-31"}
+    assert facets["duplicate_ids"][0] == {"$match": {"published": in_range}}
+    assert facets["missing_title"][0] == {
+        "$match": {"published": in_range, "title": {"$exists": False}}
+    }
+    assert facets["future_dates"][0]["$match"]["published"].keys() == {"$gt"}
+
+
+def datetime_month_gaps(months):
+    """Month gaps as the datetime-based check_data_integrity computed them."""
+    dates = sorted(datetime.strptime(month, "%Y-%m") for month in months)
+    gaps = []
+    for current_month, next_month in zip(dates, dates[1:]):
+        if current_month.month == 12:
+            expected_next = current_month.replace(year=current_month.year + 1, month=1)
+        else:
+            expected_next = current_month.replace(month=current_month.month + 1)
+        if expected_next < next_month:
+            gap_months = []
+            gap_date = expected_next
+            while gap_date < next_month:
+                gap_months.append(gap_date.strftime("%Y-%m"))
+                if gap_date.month == 12:
+                    gap_date = gap_date.replace(year=gap_date.year + 1, month=1)
+                else:
+                    gap_date = gap_date.replace(month=gap_date.month + 1)
+            gaps.append(gap_months)
+    return gaps
+
+
+@pytest.mark.parametrize(
+    "months, expected",
+    [
+        (["2023-01", "2023-02", "2023-03"], []),
+        (["2022-12", "2023-01"], []),
+        (["2022-11", "2023-02"], [["2022-12", "2023-01"]]),
+        (["2023-01", "2023-05"], [["2023-02", "2023-03", "2023-04"]]),
+        (["2023-03", "2023-01", "2023-06"], [["2023-02"], ["2023-04", "2023-05"]]),
+        (["2021-12", "2023-01"], [[f"2022-{month:02d}" for month in range(1, 13)]]),
+        (["2023-01"], []),
+        ([], []),
+    ],
+)
+def test_check_data_integrity_finds_month_gaps(months, expected):
+    month_rows = [{"_id": month, "count": 1} for month in months]
+    collection = FakeAggregateCollection([{}], month_rows)
+
+    results = check_data_integrity(collection, ("2020-01-01", "2024-12-31"))
+
+    assert results["integrity_checks"]["time_gaps"] == expected
+    assert expected == datetime_month_gaps(months)
+
+
+@pytest.mark.parametrize(
+    "malformed", ["", "2023", "2023-1-", "2023/04", "2023-00", "2023-13", "abcd-ef"]
+)
+def test_check_data_integrity_skips_malformed_month_keys(malformed):
+    month_rows = [
+        {"_id": month, "count": 1} for month in ("2023-01", malformed, "2023-03")
+    ]
+    collection = FakeAggregateCollection([{}], month_rows)
+
+    results = check_data_integrity(collection, ("2023-01-01", "2023-12-31"))
+
+    assert results["integrity_checks"]["time_gaps"] == [["2023-02"]]
@@ -0,0 +1,433 @@
+import types
+
+import httpx
+import pytest
+from fastapi import HTTPException
+from qdrant_client.http.exceptions import UnexpectedResponse
+
+import src.api.routes.mongodb as mongodb_routes
+import src.api.routes.neo4j as neo4j_routes
+import src.api.routes.qdrant as qdrant_routes
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+class FakeCursor:
+    def __init__(self, rows):
+        self.rows = rows
+
+    async def to_list(self, length):
+        return self.rows[:length]
+
+
+class FakePapersCollection:
+    def __init__(self, count, facet_rows, error=None):
+        self.count = count
+        self.facet_rows = facet_rows
+        self.error = error
+        self.pipelines = []
+
+    async def estimated_document_count(self):
+        if self.error:
+            raise self.error
+        return self.count
+
+    def aggregate(self, pipeline, allowDiskUse):
+        self.pipelines.append(pipeline)
+        return FakeCursor(self.facet_rows)
+
+
+class FakeMongoClient:
+    def __init__(self, collection):
+        self.collection = collection
+
+    def __getitem__(self, db_name):
+        assert db_name == "arxiv_papers"
+        return {"papers": self.collection}
+
+
+@pytest.fixture
+def paper_stats(monkeypatch):
+    """Serve /paper-stats from a swappable fake collection with a cold cache."""
+
+    clock = types.SimpleNamespace(now=100.0)
+    client = FakeMongoClient(None)
+    monkeypatch.setattr(mongodb_routes, "_paper_stats_cache", None)
+    monkeypatch.setattr(mongodb_routes, "get_mongo_client", lambda: client)
+    monkeypatch.setattr(
+        mongodb_routes, "time", types.SimpleNamespace(monotonic=lambda: clock.now)
+    )
+
+    def use(collection):
+        client.collection = collection
+        return collection
+
+    return use, clock
+
+
+@pytest.mark.anyio
+async def test_paper_stats_counts_distinct_authors_and_categories(paper_stats):
+    use, _ = paper_stats
+    collection = use(
+        FakePapersCollection(42, [{"authors": [{"n": 7}], "categories": [{"n": 3}]}])
+    )
+
+    assert await mongodb_routes.mongodb_paper_stats() == {
+        "papers": 42,
+        "authors": 7,
+        "categories": 3,
+    }
+    [[stage]] = collection.pipelines
+    assert stage["$facet"] == {
+        "authors": mongodb_routes._distinct_strings_pipeline("authors"),
+        "categories": mongodb_routes._distinct_strings_pipeline("categories"),
+    }
+
+
+@pytest.mark.parametrize(
+    "facet_rows",
+    [[], [{}], [{"authors": [], "categories": []}], [{"authors": None}]],
+)
+@pytest.mark.anyio
+async def test_paper_stats_counts_empty_facets_as_zero(paper_stats, facet_rows):
+    use, _ = paper_stats
+    use(FakePapersCollection(0, facet_rows))
+
+    assert await mongodb_routes.mongodb_paper_stats() == {
+        "papers": 0,
+        "authors": 0,
+        "categories": 0,
+    }
+
+
+@pytest.mark.anyio
+async def test_paper_stats_errors_are_not_cached(paper_stats):
+    use, _ = paper_stats
+    use(FakePapersCollection(0, [], error=RuntimeError("server selection timeout")))
+
+    assert await mongodb_routes.mongodb_paper_stats() == {
+        "papers": 0,
+        "authors": 0,
+        "categories": 0,
+        "error": "server selection timeout",
+    }
+    assert mongodb_routes._paper_stats_cache is None
+
+    use(FakePapersCollection(5, [{"authors": [{"n": 2}], "categories": [{"n": 1}]}]))
+    assert await mongodb_routes.mongodb_paper_stats() == {
+        "papers": 5,
+        "authors": 2,
+        "categories": 1,
+    }
+
+
+@pytest.mark.anyio
+async def test_paper_stats_are_reused_until_the_ttl_expires(paper_stats, monkeypatch):
+    use, clock = paper_stats
+    monkeypatch.setattr(mongodb_routes, "PAPER_STATS_TTL_SECONDS", 60.0)
+    first = use(FakePapersCollection(5, [{"authors": [{"n": 2}]}]))
+
+    stats = await mongodb_routes.mongodb_paper_stats()
+    # Callers get copies, so changing a response leaves the cache intact
+    stats["papers"] = -1
+    second = use(FakePapersCollection(9, [{"authors": [{"n": 4}]}]))
+    clock.now += 59.9
+    assert await mongodb_routes.mongodb_paper_stats() == {
+        "papers": 5,
+        "authors": 2,
+        "categories": 0,
+    }
+
+    clock.now += 0.1
+    assert await mongodb_routes.mongodb_paper_stats() == {
+        "papers": 9,
+        "authors": 4,
+        "categories": 0,
+    }
+    assert (len(first.pipelines), len(second.pipelines)) == (1, 1)
+
+
+def qdrant_error(status_code, reason_phrase):
+    return UnexpectedResponse(
+        status_code=status_code,
+        reason_phrase=reason_phrase,
+        content=b"{}",
+        headers=httpx.Headers(),
+    )
+
+
+def qdrant_collection(points, size=384):
+    vectors = {"dense": types.SimpleNamespace(size=size)}
+    return types.SimpleNamespace(
+        status="green",
+        points_count=points,
+        indexed_vectors_count=points,
+        config=types.SimpleNamespace(
+            params=types.SimpleNamespace(vectors=vectors, sparse_vectors={"sparse": {}})
+        ),
+    )
+
+
+class FakeQdrantClient:
+    """Answers get_collection by name (aliases included) and get_aliases."""
+
+    def __init__(self, collections, aliases=None, errors=None):
+        self.collections = collections
+        self.aliases = aliases or {}
+        self.errors = errors or {}
+        self.requests = []
+
+    async def get_collection(self, name):
+        self.requests.append(name)
+        if name in self.errors:
+            raise self.errors[name]
+        name = self.aliases.get(name, name)
+        if name not in self.collections:
+            raise qdrant_error(404, "Not Found")
+        return self.collections[name]
+
+    async def get_aliases(self):
+        return types.SimpleNamespace(
+            aliases=[
+                types.SimpleNamespace(alias_name=alias, collection_name=collection)
+                for alias, collection in self.aliases.items()
+            ]
+        )
+
+
+@pytest.fixture
+def qdrant_status(monkeypatch):
+    """Serve /metrics/qdrant/status from a swappable fake client with a cold cache."""
+
+    clock = types.SimpleNamespace(now=100.0)
+    holder = types.SimpleNamespace(client=None)
+    for name in (
+        "QDRANT_RESEARCH_COLLECTION",
+        "QDRANT_DISCOVERY_ALIAS",
+    ):
+        monkeypatch.delenv(name, raising=False)
+    monkeypatch.setattr(qdrant_routes, "_status_cache", None)
+    monkeypatch.setattr(
+        qdrant_routes,
+        "load_project_config",
+        lambda: {
+            "research_index": {"collection_name": "evidence_v1"},
+            "discovery_index": {"alias_name": "discovery_current"},
+        },
+    )
+    monkeypatch.setattr(qdrant_routes, "resolve_qdrant_url", lambda config: "qdrant")
+    monkeypatch.setattr(qdrant_routes, "_get_client", lambda url: holder.client)
+    monkeypatch.setattr(
+        qdrant_routes, "time", types.SimpleNamespace(monotonic=lambda: clock.now)
+    )
+
+    def use(client):
+        holder.client = client
+        return client
+
+    return use, clock
+
+
+@pytest.mark.anyio
+async def test_qdrant_status_resolves_the_discovery_alias(qdrant_status):
+    use, _ = qdrant_status
+    client = use(
+        FakeQdrantClient(
+            {
+                "evidence_v1": qdrant_collection(10),
+                "discovery_v7": qdrant_collection(99),
+            },
+            aliases={"discovery_current": "discovery_v7"},
+        )
+    )
+
+    status = await qdrant_routes.get_qdrant_research_status()
+
+    assert status["status"] == "healthy"
+    evidence, discovery = status["collections"]
+    assert evidence == {
+        "role": "evidence",
+        "configured_name": "evidence_v1",
+        "resolved_name": "evidence_v1",
+        "available": True,
+        "status": "green",
+        "points": 10,
+        "indexed_vectors": 10,
+        "dense_dimensions": 384,
+        "sparse_enabled": True,
+    }
+    assert discovery["configured_name"] == "discovery_current"
+    assert discovery["resolved_name"] == "discovery_v7"
+    assert discovery["points"] == 99
+    # One info request per collection; the alias is looked up once alongside
+    assert sorted(client.requests) == ["discovery_current", "evidence_v1"]
+
+
+@pytest.mark.anyio
+async def test_qdrant_status_reports_a_missing_collection(qdrant_status):
+    use, _ = qdrant_status
+    use(FakeQdrantClient({"evidence_v1": qdrant_collection(10)}))
+
+    status = await qdrant_routes.get_qdrant_research_status()
+
+    assert status["status"] == "degraded"
+    assert status["collections"][1] == {
+        "role": "discovery",
+        "configured_name": "discovery_current",
+        "resolved_name": "discovery_current",
+        "available": False,
+        "status": "missing",
+        "points": 0,
+        "indexed_vectors": 0,
+        "dense_dimensions": None,
+        "sparse_enabled": False,
+    }
+
+
+@pytest.mark.anyio
+async def test_qdrant_status_turns_other_errors_into_503(qdrant_status):
+    use, _ = qdrant_status
+    use(
+        FakeQdrantClient(
+            {"discovery_current": qdrant_collection(5)},
+            errors={"evidence_v1": qdrant_error(500, "Internal Server Error")},
+        )
+    )
+
+    with pytest.raises(HTTPException) as raised:
+        await qdrant_routes.get_qdrant_research_status()
+
+    assert raised.value.status_code == 503
+    assert raised.value.detail.startswith("Qdrant status unavailable: ")
+    assert "500 (Internal Server Error)" in raised.value.detail
+    assert qdrant_routes._status_cache is None
+
+
+@pytest.mark.anyio
+async def test_qdrant_status_is_reused_until_the_ttl_expires(
+    qdrant_status, monkeypatch
+):
+    use, clock = qdrant_status
+    monkeypatch.setattr(qdrant_routes, "QDRANT_STATUS_TTL_SECONDS", 30.0)
+    first = use(FakeQdrantClient({"evidence_v1": qdrant_collection(10)}))
+
+    status = await qdrant_routes.get_qdrant_research_status()
+    # Nested collection entries are copied too, so edits stay with the caller
+    status["collections"][0]["points"] = -1
+    second = use(
+        FakeQdrantClient(
+            {
+                "evidence_v1": qdrant_collection(20),
+                "discovery_current": qdrant_collection(5),
+            }
+        )
+    )
+    clock.now += 29.9
+    cached = await qdrant_routes.get_qdrant_research_status()
+    assert (cached["status"], cached["collections"][0]["points"]) == ("degraded", 10)
+
+    clock.now += 0.1
+    fresh = await qdrant_routes.get_qdrant_research_status()
+    assert (fresh["status"], fresh["collections"][0]["points"]) == ("healthy", 20)
+    assert (len(first.requests), len(second.requests)) == (2, 2)
+
+
+class FakeNeo4jResult:
+    def __init__(self, record):
+        self.record = record
+
+    async def single(self):
+        return self.record
+
+
+class FakeNeo4jDriver:
+    def __init__(self, record=None, error=None):
+        self.record = record
+        self.error = error
+        self.queries = []
+
+    def session(self):
+        return self
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    async def run(self, query):
+        self.queries.append(query)
+        if self.error:
+            raise self.error
+        return FakeNeo4jResult(self.record)
+
+
+@pytest.fixture
+def db_stats(monkeypatch):
+    """Serve /neo4j/db-stats from a swappable fake driver with a cold cache."""
+
+    clock = types.SimpleNamespace(now=100.0)
+    holder = types.SimpleNamespace(driver=None)
+    monkeypatch.setattr(neo4j_routes, "_db_stats_cache", None)
+    monkeypatch.setattr(neo4j_routes, "NEO4J_STATS_TTL_SECONDS", 30.0)
+    monkeypatch.setattr(neo4j_routes, "get_driver", lambda: holder.driver)
+    monkeypatch.setattr(
+        neo4j_routes, "time", types.SimpleNamespace(monotonic=lambda: clock.now)
+    )
+
+    def use(driver):
+        holder.driver = driver
+        return driver
+
+    return use, clock
+
+
+@pytest.mark.anyio
+async def test_neo4j_db_stats_are_reused_until_the_ttl_expires(db_stats):
+    use, clock = db_stats
+    first = use(FakeNeo4jDriver({"papers": 3, "authors": 5, "categories": 2}))
+
+    stats = await neo4j_routes.neo4j_db_stats()
+    stats["papers"] = -1
+    second = use(FakeNeo4jDriver({"papers": 4, "authors": 6, "categories": 2}))
+    clock.now += 29.9
+    assert await neo4j_routes.neo4j_db_stats() == {
+        "papers": 3,
+        "authors": 5,
+        "categories": 2,
+    }
+
+    clock.now += 0.1
+    assert await neo4j_routes.neo4j_db_stats() == {
+        "papers": 4,
+        "authors": 6,
+        "categories": 2,
+    }
+    assert (first.queries, second.queries) == (
+        [neo4j_routes.NODE_COUNTS_QUERY],
+        [neo4j_routes.NODE_COUNTS_QUERY],
+    )
+
+
+@pytest.mark.anyio
+async def test_neo4j_db_stats_errors_are_not_cached(db_stats):
+    use, _ = db_stats
+    use(FakeNeo4jDriver(error=RuntimeError("connection refused")))
+
+    assert await neo4j_routes.neo4j_db_stats() == {
+        "papers": 0,
+        "authors": 0,
+        "categories": 0,
+        "error": "connection refused",
+    }
+    assert neo4j_routes._db_stats_cache is None
+
+    use(FakeNeo4jDriver({"papers": 1, "authors": 1, "categories": 1}))
+    assert await neo4j_routes.neo4j_db_stats() == {
+        "papers": 1,
+        "authors": 1,
+        "categories": 1,
+    }
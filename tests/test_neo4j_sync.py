@@ -0,0 +1,151 @@
+import logging
+
+import pytest
+from neo4j.exceptions import ClientError
+
+import src.graph.neo4j_sync as neo4j_sync
+
+
+class FakeResult:
+    def consume(self):
+        return None
+
+
+class FakeTransaction:
+    def __init__(self, session):
+        self.session = session
+
+    def run(self, query, rows=None):
+        if any(row["id"] in self.session.bad_ids for row in rows):
+            raise ClientError("bad paper")
+        return FakeResult()
+
+
+class FakeSession:
+    def __init__(self, driver):
+        self.driver = driver
+        self.bad_ids = driver.bad_ids
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def run(self, query):
+        self.driver.queries.append(query)
+        if query.startswith("CREATE CONSTRAINT") and self.driver.constraint_error:
+            raise self.driver.constraint_error
+        return FakeResult()
+
+    def execute_write(self, work, rows):
+        ids = [row["id"] for row in rows]
+        self.driver.transactions.append(ids)
+        result = work(FakeTransaction(self), rows)
+        self.driver.committed.append(ids)
+        return result
+
+
+class FakeDriver:
+    def __init__(self, bad_ids=(), constraint_error=None):
+        self.bad_ids = set(bad_ids)
+        self.constraint_error = constraint_error
+        self.queries = []
+        self.transactions = []
+        self.committed = []
+
+    def session(self):
+        return FakeSession(self)
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def make_sync(monkeypatch):
+    def make_sync(**driver_options):
+        driver = FakeDriver(**driver_options)
+        monkeypatch.setattr(
+            neo4j_sync.GraphDatabase, "driver", lambda uri, auth: driver
+        )
+        return neo4j_sync.Neo4jSync("bolt://neo4j:7687", "neo4j", "password"), driver
+
+    return make_sync
+
+
+def make_papers(count):
+    return [
+        {
+            "id": f"2301.{index:05d}",
+            "title": f"Paper {index}",
+            "authors": ["Ada Lovelace"],
+            "categories": ["cs.LG"],
+        }
+        for index in range(count)
+    ]
+
+
+def test_sync_papers_batch_writes_one_transaction_per_chunk(make_sync):
+    sync, driver = make_sync()
+    papers = make_papers(5)
+
+    assert sync.sync_papers_batch(papers, batch_size=2) == (5, 0)
+    assert driver.transactions == [
+        ["2301.00000", "2301.00001"],
+        ["2301.00002", "2301.00003"],
+        ["2301.00004"],
+    ]
+
+
+def test_sync_papers_batch_retries_a_failed_chunk_row_by_row(make_sync):
+    sync, driver = make_sync(bad_ids={"2301.00003"})
+    papers = make_papers(6)
+
+    assert sync.sync_papers_batch(papers, batch_size=3) == (5, 1)
+    assert driver.transactions == [
+        ["2301.00000", "2301.00001", "2301.00002"],
+        ["2301.00003", "2301.00004", "2301.00005"],
+        ["2301.00003"],
+        ["2301.00004"],
+        ["2301.00005"],
+    ]
+    assert driver.committed == [
+        ["2301.00000", "2301.00001", "2301.00002"],
+        ["2301.00004"],
+        ["2301.00005"],
+    ]
+
+
+def test_paper_row_adds_last_synced_only_with_a_sync_timestamp():
+    paper = {"id": "2301.00001", "title": "A paper", "authors": None}
+
+    row = neo4j_sync.Neo4jSync._paper_row(paper)
+    assert row == {
+        "id": "2301.00001",
+        "props": {
+            "title": "A paper",
+            "summary": "",
+            "published": "",
+            "updated": "",
+            "arxiv_url": "",
+            "pdf_url": "",
+        },
+        "authors": [],
+        "categories": [],
+    }
+
+    synced = neo4j_sync.Neo4jSync._paper_row(paper, "2024-01-01T00:00:00Z")
+    assert synced["props"] == {**row["props"], "last_synced": "2024-01-01T00:00:00Z"}
+
+
+def test_constraint_errors_are_logged_not_raised(make_sync, caplog):
+    with caplog.at_level(logging.WARNING, logger=neo4j_sync.__name__):
+        sync, driver = make_sync(constraint_error=ClientError("duplicate nodes"))
+
+    constraints = [q for q in driver.queries if q.startswith("CREATE CONSTRAINT")]
+    assert len(constraints) == len(neo4j_sync.NODE_KEYS)
+    assert [record.getMessage() for record in caplog.records] == [
+        f"Could not create unique constraint on :{label}({key}): duplicate nodes"
+        for label, key in neo4j_sync.NODE_KEYS
+    ]
+    assert sync.sync_papers_batch(make_papers(1)) == (1, 0)
@@ -1,4 +1,7 @@
-from src.storage.mongo import MongoStorage
+from types import SimpleNamespace
+
+from src.ingestion.schema import canonicalize_paper_metadata
+from src.storage.mongo import PAPER_LISTING_PROJECTION, MongoStorage
 
 
 class FakeCursor:
@@ -26,13 +29,15 @@ class FakePapers:
     def __init__(self):
         self.cursor = FakeCursor([{"id": "paper-1"}])
         self.last_query = None
+        self.last_projection = None
 
     def find_one(self, query):
         self.last_query = query
         return {"id": query["id"]}
 
-    def find(self, query):
+    def find(self, query, projection=None):
         self.last_query = query
+        self.last_projection = projection
         return self.cursor
 
 
@@ -42,6 +47,15 @@ def make_storage():
     return storage
 
 
+def make_write_storage(papers=None):
+    storage = MongoStorage.__new__(MongoStorage)
+    storage.papers = papers or FakeWriteCollection()
+    storage.paper_archive = FakeWriteCollection()
+    storage.stats = FakeWriteCollection()
+    storage._stats_buffer = []
+    return storage
+
+
 def test_get_paper_uses_pymongo_collection_directly():
     storage = make_storage()
 
@@ -69,3 +83,245 @@ def test_get_papers_applies_sort_and_pagination():
         ("skip", 5),
         ("limit", 10),
     ]
+    assert storage.papers.last_projection is None
+
+
+def test_get_papers_passes_projection_to_find():
+    storage = make_storage()
+
+    storage.get_papers(projection=PAPER_LISTING_PROJECTION)
+
+    assert storage.papers.last_query == {}
+    assert storage.papers.last_projection == {
+        "id": 1,
+        "title": 1,
+        "published": 1,
+        "_id": 0,
+    }
+
+
+class FakeWriteCollection:
+    def __init__(self, error=None):
+        self.error = error
+        self.requests = []
+        self.inserted = []
+
+    def find(self, query):
+        return iter([])
+
+    def bulk_write(self, requests, ordered=True):
+        self.requests.append((list(requests), ordered))
+        if self.error is not None:
+            raise self.error
+        return SimpleNamespace(
+            upserted_count=len(self.requests[-1][0]), modified_count=0
+        )
+
+    def insert_one(self, document):
+        self.inserted.append(document)
+
+    def insert_many(self, documents, ordered=True):
+        self.inserted.extend(documents)
+
+
+def test_store_papers_counts_only_reported_bulk_write_errors():
+    from pymongo.errors import BulkWriteError
+
+    storage = make_write_storage(
+        FakeWriteCollection(
+            BulkWriteError(
+                {
+                    "nUpserted": 2,
+                    "nModified": 0,
+                    "writeErrors": [{"index": 1, "code": 11000, "errmsg": "dup"}],
+                }
+            )
+        )
+    )
+
+    stats = storage.store_papers(
+        [
+            {"id": f"http://arxiv.org/abs/2607.2155{index}v1", "title": "Paper"}
+            for index in range(3)
+        ]
+    )
+
+    requests, ordered = storage.papers.requests[0]
+    assert len(requests) == 3
+    assert ordered is False
+    assert stats["inserted"] == 2
+    assert stats["failed"] == 1
+    assert storage.stats.inserted == []
+
+    storage.close()
+
+    assert storage.stats.inserted[0]["failed"] == 1
+
+
+def test_store_papers_bulk_splits_paper_writes_into_batches():
+    storage = make_write_storage()
+
+    stats = storage.store_papers_bulk(
+        [
+            {"id": f"http://arxiv.org/abs/2607.2155{index}v1", "title": "Paper"}
+            for index in range(5)
+        ],
+        batch_size=2,
+    )
+
+    assert [len(requests) for requests, _ in storage.papers.requests] == [2, 2, 1]
+    assert stats["inserted"] == 5
+    assert stats["failed"] == 0
+
+
+def test_storages_share_one_client_and_index_setup(monkeypatch):
+    import src.storage.mongo as mongo
+
+    clients = []
+    index_setups = []
+
+    class FakeDatabase(dict):
+        def __missing__(self, name):
+            return name
+
+        def __getattr__(self, name):
+            return self[name]
+
+    class FakeClient(dict):
+        def __init__(self, connection_string, **options):
+            super().__init__()
+            clients.append((connection_string, options))
+
+        def __missing__(self, name):
+            return FakeDatabase()
+
+        def close(self):
+            pass
+
+    monkeypatch.setattr(mongo.pymongo, "MongoClient", FakeClient)
+    monkeypatch.setattr(
+        MongoStorage, "_setup_indexes", lambda self: index_setups.append(self)
+    )
+    mongo.close_mongo_clients()
+
+    first = MongoStorage("mongodb://shared/", "arxiv_papers", max_pool_size=8)
+    first.close()
+    second = MongoStorage("mongodb://shared/", "arxiv_papers", max_pool_size=8)
+
+    assert clients == [("mongodb://shared/", {"maxPoolSize": 8})]
+    assert len(index_setups) == 1
+    assert second.client is not None
+    mongo.close_mongo_clients()
+
+
+def test_store_papers_bulk_archives_older_versions_without_paper_write():
+    storage = make_write_storage()
+    storage.papers.find = lambda query: iter(
+        [{"_id": "live", "id": "https://arxiv.org/abs/2607.21557v3"}]
+    )
+
+    stats = storage.store_papers_bulk([{"id": "http://arxiv.org/abs/2607.21557v1"}])
+
+    assert len(storage.paper_archive.requests[0][0]) == 1
+    assert storage.papers.requests == []
+    assert stats["archived"] == 1
+    assert stats["skipped_older"] == 1
+
+
+def test_store_papers_bulk_only_sets_changed_fields_for_same_version():
+    storage = make_write_storage()
+    existing = canonicalize_paper_metadata(
+        {"id": "http://arxiv.org/abs/2607.21557v2", "title": "Old title"}
+    )
+    existing["_id"] = "live"
+    storage.papers.find = lambda query: iter([existing])
+
+    storage.store_papers_bulk(
+        [{"id": "http://arxiv.org/abs/2607.21557v2", "title": "New title"}]
+    )
+
+    operation = storage.papers.requests[0][0][0]
+    assert set(operation._doc["$set"]) == {"title", "ingestion_timestamp"}
+
+
+def test_store_papers_bulk_inserts_new_papers_with_set_on_insert():
+    storage = make_write_storage()
+
+    storage.store_papers_bulk([{"id": "http://arxiv.org/abs/2607.21557v1"}])
+
+    operation = storage.papers.requests[0][0][0]
+    assert set(operation._doc["$set"]) == {"ingestion_timestamp"}
+    assert operation._doc["$setOnInsert"]["arxiv_id"] == "2607.21557v1"
+
+
+def test_setup_indexes_batches_index_builds_per_collection():
+    class FakeIndexCollection:
+        def __init__(self):
+            self.calls = []
+
+        def create_indexes(self, models):
+            self.calls.append([model.document["name"] for model in models])
+
+        def create_index(self, keys, **kwargs):
+            self.calls.append(kwargs["name"])
+
+    storage = MongoStorage.__new__(MongoStorage)
+    storage.papers = FakeIndexCollection()
+    storage.paper_archive = FakeIndexCollection()
+
+    storage._setup_indexes()
+
+    assert storage.papers.calls == [
+        [
+            "id_1",
+            "categories_1",
+            "authors_1",
+            "published_1",
+            "published_1_categories_1",
+        ],
+        "base_arxiv_id_unique",
+    ]
+    assert storage.paper_archive.calls == [
+        ["archived_paper_version_unique", "archived_at_1"]
+    ]
+
+
+def test_store_papers_bulk_retries_connection_failures(monkeypatch):
+    import src.storage.mongo as mongo
+    from pymongo.errors import AutoReconnect
+
+    storage = make_write_storage(
+        FakeWriteCollection(AutoReconnect("primary stepped down"))
+    )
+    original_bulk_write = storage.papers.bulk_write
+
+    def flaky_bulk_write(requests, ordered=True):
+        if len(storage.papers.requests) == 1:
+            storage.papers.error = None
+        return original_bulk_write(requests, ordered)
+
+    storage.papers.bulk_write = flaky_bulk_write
+    sleeps = []
+    monkeypatch.setattr(mongo.time, "sleep", sleeps.append)
+
+    stats = storage.store_papers_bulk([{"id": "http://arxiv.org/abs/2607.21557v1"}])
+
+    assert len(storage.papers.requests) == 2
+    assert len(sleeps) == 1
+    assert stats["inserted"] == 1
+    assert stats["failed"] == 0
+
+
+def test_store_papers_flushes_stats_buffer_at_threshold(monkeypatch):
+    from src.storage import mongo
+
+    monkeypatch.setattr(mongo, "STATS_FLUSH_THRESHOLD", 2)
+    storage = make_write_storage()
+    papers = [{"id": "http://arxiv.org/abs/2607.21550v1", "title": "Paper"}]
+
+    storage.store_papers(papers)
+    assert storage.stats.inserted == []
+
+    storage.store_papers(papers)
+    assert len(storage.stats.inserted) == 2
+    assert storage._stats_buffer == []